@@ -0,0 +1,111 @@
+import os
+import re
+import json
+from collections import defaultdict
+from datetime import date, datetime
+
+from API.news.news_search import SEARCH_DB_PATH, index_articles
+from utils.file_lock import file_lock
+
+NEWS_DIR = "Database/news"
+ARTICLE_DIR = os.path.join(NEWS_DIR, "articles")
+
+MONTH_KEY_PATTERN = re.compile(r"^\d{4}-(0[1-9]|1[0-2])$")
+
+
+def month_key_of(published_at: str | date) -> str:
+    """
+    발행일(date/datetime 또는 ISO 형식 문자열, 예: "2025-04-03T09:00:00")에서 월 키("2025-04")를 구합니다.
+    월 키는 파일 이름이 되므로 문자열을 자르지 않고 날짜로 해석합니다 (형식이 틀리면 ValueError).
+    """
+    if isinstance(published_at, str):
+        published_at = datetime.fromisoformat(published_at)
+    return f"{published_at.year:04d}-{published_at.month:02d}"
+
+
+def article_partition_path(month_key: str) -> str:
+    return os.path.join(ARTICLE_DIR, f"{month_key}.jsonl")
+
+
+def month_lock_path(month_key: str) -> str:
+    return os.path.join(ARTICLE_DIR, f".{month_key}.lock")
+
+
+def list_month_keys() -> list[str]:
+    """
+    저장된 월별 기사 파일의 월 키 목록. 'YYYY-MM.jsonl' 형식이 아닌 파일은 건너뜁니다.
+    """
+    if not os.path.isdir(ARTICLE_DIR):
+        return []
+    month_keys = []
+    for filename in sorted(os.listdir(ARTICLE_DIR)):
+        month_key, extension = os.path.splitext(filename)
+        if extension == ".jsonl" and MONTH_KEY_PATTERN.match(month_key):
+            month_keys.append(month_key)
+    return month_keys
+
+
+def load_month_articles(month_key: str) -> list[dict]:
+    """
+    한 달치 수집 기사를 읽습니다. 파일이 없으면 빈 목록.
+    """
+    path = article_partition_path(month_key)
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def save_articles(articles: list[dict]) -> dict[str, list[dict]]:
+    """
+    수집한 기사를 발행 월별 파일(JSON Lines)에 이어 쓰고 검색 색인에 추가합니다. 이미 저장된 id 는 건너뜁니다.
+    늦게 들어온 기사도 발행 월 파일에 추가되므로 해당 월 집계만 다시 계산 대상이 됩니다.
+
+    기사 형식: {"id", "published_at", "title", "content", "category", "keywords": [...], "sentiment", "office", "url"}
+
+    Args:
+        articles (list[dict]): 수집한 기사 목록
+
+    Returns:
+        dict[str, list[dict]]: {월 키: 새로 저장된 기사 목록}
+    """
+    by_month = defaultdict(list)
+    for article in articles:
+        by_month[month_key_of(article["published_at"])].append(article)
+
+    os.makedirs(ARTICLE_DIR, exist_ok=True)
+    added = {}
+    for month_key, month_articles in sorted(by_month.items()):
+        # 동시에 들어온 수집 요청(다른 워커 프로세스 포함)끼리 id 중복 확인과 파일 추가가 섞이지 않도록 월 파일 단위로 잠금
+        with file_lock(month_lock_path(month_key)):
+            existing_ids = {article["id"] for article in load_month_articles(month_key)}
+            new_articles = []
+            for article in month_articles:
+                if article["id"] not in existing_ids:
+                    existing_ids.add(article["id"])
+                    new_articles.append(article)
+
+            if new_articles:
+                # 색인을 먼저 추가: 월 파일에 쓴 뒤 색인이 실패하면 다음 수집 때 id 중복으로 건너뛰어 색인에서 영영 빠짐.
+                # 색인은 같은 id 를 무시하므로 파일 쓰기가 실패해 다시 수집해도 중복되지 않음
+                index_articles(new_articles)
+                with open(article_partition_path(month_key), "a", encoding="utf-8") as f:
+                    for article in new_articles:
+                        f.write(json.dumps(article, ensure_ascii=False) + "\n")
+                added[month_key] = new_articles
+                print(f"✅ {month_key} 기사 {len(new_articles)}건 저장")
+
+    return added
+
+
+def reindex_collected_articles(db_path: str = SEARCH_DB_PATH) -> int:
+    """
+    월별 기사 파일 전체로 검색 색인을 처음부터 다시 만듭니다.
+    """
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    total = 0
+    for month_key in list_month_keys():
+        total += index_articles(load_month_articles(month_key), db_path)
+    print(f"✅ 뉴스 검색 색인 재생성: {total}건")
+    return total
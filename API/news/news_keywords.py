@@ -0,0 +1,74 @@
+from collections import Counter
+from collections.abc import Iterable
+
+# top-k 스케치: {"k": 용량, "counters": {키워드: [추정 빈도, 오차]}}
+# 추정 빈도 - 오차 <= 실제 빈도 <= 추정 빈도 가 항상 성립합니다.
+# 월별 스케치를 합쳐도 크기가 k 로 유지되어 연간 상위 키워드를 원문 없이 구할 수 있습니다.
+
+
+def new_topk_sketch(k: int = 100) -> dict:
+    return {"k": k, "counters": {}}
+
+
+def topk_sketch_from_counts(counts: Counter, k: int = 100) -> dict:
+    """
+    정확한 빈도(Counter)에서 상위 k 개를 오차 0 으로 담은 스케치를 만듭니다.
+    빈도를 이미 모두 센 경우에는 Space-Saving 교체 없이 이 함수를 사용합니다.
+    """
+    return {"k": k, "counters": {keyword: [count, 0] for keyword, count in counts.most_common(k)}}
+
+
+def update_topk_sketch(sketch: dict, keywords: Iterable[str]) -> dict:
+    """
+    키워드가 하나씩 도착하는 스트림을 Space-Saving 방식으로 스케치에 반영합니다.
+    (정확한 빈도가 이미 있으면 topk_sketch_from_counts 를 사용)
+    """
+    counters = sketch["counters"]
+    for keyword in keywords:
+        if keyword in counters:
+            counters[keyword][0] += 1
+        elif len(counters) < sketch["k"]:
+            counters[keyword] = [1, 0]
+        else:
+            # 가장 작은 카운터를 새 키워드로 교체 (이전 값은 오차로 기록)
+            min_keyword = min(counters, key=lambda key: counters[key][0])
+            min_count = counters.pop(min_keyword)[0]
+            counters[keyword] = [min_count + 1, min_count]
+    return sketch
+
+
+def _sketch_floor(sketch: dict) -> int:
+    """
+    스케치에 없는 키워드의 최대 빈도. 꽉 찬 스케치는 최소 카운터 값, 여유가 있으면 0.
+    """
+    counters = sketch["counters"]
+    if len(counters) < sketch["k"]:
+        return 0
+    return min((value[0] for value in counters.values()), default=0)
+
+
+def merge_topk_sketches(sketches: list[dict]) -> dict:
+    """
+    여러 스케치를 하나로 합칩니다. 모든 키워드를 먼저 모은 뒤 스케치마다 해당 빈도를 더하고,
+    그 스케치에 없는 키워드에는 스케치의 floor 를 빈도와 오차로 더하므로 합치는 순서와 관계없이 같은 결과를 냅니다.
+    """
+    k = max((sketch["k"] for sketch in sketches), default=100)
+    keywords = set().union(*(sketch["counters"] for sketch in sketches))
+
+    merged = {keyword: [0, 0] for keyword in keywords}
+    for sketch in sketches:
+        counters = sketch["counters"]
+        floor = _sketch_floor(sketch)
+        for keyword, total in merged.items():
+            count, error = counters.get(keyword, (floor, floor))
+            total[0] += count
+            total[1] += error
+
+    # 빈도가 같으면 키워드 순으로 정렬해 결과가 입력 순서에 좌우되지 않게 함
+    top = sorted(merged.items(), key=lambda item: (-item[1][0], item[0]))[:k]
+    return {"k": k, "counters": {keyword: value for keyword, value in top}}
+
+
+def topk_from_sketch(sketch: dict, n: int = 10) -> list[tuple[str, int]]:
+    top = sorted(sketch["counters"].items(), key=lambda item: (-item[1][0], item[0]))[:n]
+    return [(keyword, value[0]) for keyword, value in top]
@@ -0,0 +1,181 @@
+import os
+import json
+import hashlib
+import tempfile
+from collections import Counter, defaultdict
+
+from API.news.news_collect import NEWS_DIR, article_partition_path, list_month_keys, load_month_articles
+from API.news.news_keywords import topk_sketch_from_counts
+from utils.file_lock import file_lock
+
+MONTHLY_DIR = os.path.join(NEWS_DIR, "monthly")
+
+# 집계 형식이 바뀌면 올려서 이전 파티션을 다시 계산
+AGGREGATE_VERSION = 2
+TOPK_CAPACITY = 100
+
+
+def _month_key(year: int, month: int) -> str:
+    return f"{year:04d}-{month:02d}"
+
+
+def _source_signature(month_key: str) -> str | None:
+    """
+    월별 기사 파일의 크기/수정 시각으로 만든 서명. 기사가 추가되면 바뀝니다.
+    """
+    path = article_partition_path(month_key)
+    if not os.path.exists(path):
+        return None
+    stat = os.stat(path)
+    payload = f"{AGGREGATE_VERSION}:{stat.st_size}:{stat.st_mtime_ns}"
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _pointer_path(month_key: str) -> str:
+    return os.path.join(MONTHLY_DIR, month_key, "current.json")
+
+
+def _read_pointer(month_key: str) -> dict | None:
+    path = _pointer_path(month_key)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json_atomic(path: str, data: dict) -> None:
+    """
+    같은 폴더의 고유한 임시 파일에 쓴 뒤 os.replace 로 교체합니다.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def aggregate_articles(articles: list[dict], topk_capacity: int = TOPK_CAPACITY) -> dict:
+    """
+    기사 목록을 합칠 수 있는 집계로 만듭니다 (건수/합계/스케치만 저장하므로 월별 집계끼리 더할 수 있음).
+
+    Returns:
+        dict: 기사 수, 카테고리별 기사 수, 키워드 빈도, 감성 합계/건수(전체·카테고리별),
+              교육청별 기사 수, 키워드 top-k 스케치
+    """
+    category_counts = Counter()
+    office_counts = Counter()
+    keyword_counts = Counter()
+    sentiment_sum = defaultdict(float)
+    sentiment_count = Counter()
+
+    for article in articles:
+        category = article.get("category") or "기타"
+        category_counts[category] += 1
+        if article.get("office"):
+            office_counts[article["office"]] += 1
+        keyword_counts.update(article.get("keywords") or [])
+
+        sentiment = article.get("sentiment")
+        if sentiment is not None:
+            for key in ("전체", category):
+                sentiment_sum[key] += float(sentiment)
+                sentiment_count[key] += 1
+
+    return {
+        "article_count": len(articles),
+        "category_counts": dict(category_counts),
+        "office_counts": dict(office_counts),
+        "keyword_counts": dict(keyword_counts),
+        "sentiment_sum": dict(sentiment_sum),
+        "sentiment_count": dict(sentiment_count),
+        "keyword_topk": topk_sketch_from_counts(keyword_counts, topk_capacity)
+    }
+
+
+def load_month_aggregate(year: int, month: int) -> dict | None:
+    """
+    현재 게시된 월별 집계 파티션을 읽습니다. 없으면 None.
+    """
+    month_key = _month_key(year, month)
+    pointer = _read_pointer(month_key)
+    if pointer is None:
+        return None
+    with open(os.path.join(MONTHLY_DIR, month_key, pointer["file"]), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def is_month_dirty(year: int, month: int) -> bool:
+    """
+    기사 파일이 마지막 집계 이후 바뀌었는지 (늦게 도착한 기사 포함) 확인합니다.
+    """
+    month_key = _month_key(year, month)
+    signature = _source_signature(month_key)
+    if signature is None:
+        return False
+    pointer = _read_pointer(month_key)
+    return pointer is None or pointer["signature"] != signature
+
+
+def dirty_months() -> list[tuple[int, int]]:
+    """
+    다시 집계해야 하는 (연도, 월) 목록.
+    """
+    months = []
+    for month_key in list_month_keys():
+        year, month = (int(part) for part in month_key.split("-"))
+        if is_month_dirty(year, month):
+            months.append((year, month))
+    return months
+
+
+def process_news_month(year: int, month: int, force: bool = False) -> dict:
+    """
+    한 달치 기사를 집계하여 불변 파티션(aggregate_{서명}.json)으로 저장하고 current.json 이 가리키게 합니다.
+    기사 파일이 바뀌지 않았으면 기존 파티션을 그대로 반환합니다.
+
+    Args:
+        year (int): 연도
+        month (int): 월
+        force (bool): 변경이 없어도 다시 집계
+
+    Returns:
+        dict: 월별 집계 (year, month, signature 포함)
+    """
+    month_key = _month_key(year, month)
+    partition_dir = os.path.join(MONTHLY_DIR, month_key)
+
+    # 같은 달을 동시에 집계하지 않도록 (다른 워커 프로세스 포함) 월별 파일 잠금
+    with file_lock(os.path.join(partition_dir, ".lock")):
+        signature = _source_signature(month_key)
+        if signature is None:
+            raise FileNotFoundError(f"{month_key} 수집 기사가 없습니다.")
+
+        pointer = _read_pointer(month_key)
+        if not force and pointer is not None and pointer["signature"] == signature:
+            return load_month_aggregate(year, month)
+
+        aggregate = aggregate_articles(load_month_articles(month_key))
+        aggregate.update({"year": year, "month": month, "signature": signature})
+
+        filename = f"aggregate_{signature}.json"
+        write_json_atomic(os.path.join(partition_dir, filename), aggregate)
+        write_json_atomic(_pointer_path(month_key), {"file": filename, "signature": signature})
+
+        # 이전 파티션 정리 (읽는 중인 요청이 있을 수 있으므로 직전 것까지 유지)
+        keep = {filename, pointer["file"] if pointer else None}
+        for old in os.listdir(partition_dir):
+            if old.startswith("aggregate_") and old.endswith(".json") and old not in keep:
+                os.remove(os.path.join(partition_dir, old))
+
+        print(f"✅ {month_key} 뉴스 집계 완료: 기사 {aggregate['article_count']}건")
+        return aggregate
+
+
+def process_dirty_months() -> list[dict]:
+    """
+    바뀐 달만 다시 집계합니다.
+    """
+    return [process_news_month(year, month) for year, month in dirty_months()]
@@ -0,0 +1,56 @@
+import os
+from collections import Counter
+
+from API.news.news_collect import NEWS_DIR
+from API.news.news_keywords import merge_topk_sketches
+from API.news.news_process_monthly import is_month_dirty, load_month_aggregate, process_news_month, write_json_atomic
+
+YEARLY_DIR = os.path.join(NEWS_DIR, "yearly")
+
+COUNTER_FIELDS = ["category_counts", "office_counts", "keyword_counts", "sentiment_sum", "sentiment_count"]
+
+
+def merge_month_aggregates(aggregates: list[dict]) -> dict:
+    """
+    월별 집계를 더해 하나의 집계로 만듭니다 (원 기사를 다시 읽지 않음).
+    """
+    merged = {"article_count": sum(aggregate["article_count"] for aggregate in aggregates)}
+    for field in COUNTER_FIELDS:
+        total = Counter()
+        for aggregate in aggregates:
+            total.update(aggregate.get(field, {}))
+        merged[field] = dict(total)
+    merged["keyword_topk"] = merge_topk_sketches([aggregate["keyword_topk"] for aggregate in aggregates])
+    return merged
+
+
+def process_news_year(year: int) -> dict:
+    """
+    12개월 집계 파티션을 합쳐 연간 집계를 만듭니다. 바뀐 달(늦게 도착한 기사 포함)만 다시 집계합니다.
+
+    Args:
+        year (int): 연도
+
+    Returns:
+        dict: 연간 집계 (months: 포함된 월 목록)
+    """
+    aggregates = []
+    for month in range(1, 13):
+        if is_month_dirty(year, month):
+            aggregate = process_news_month(year, month)
+        else:
+            aggregate = load_month_aggregate(year, month)
+        if aggregate is not None:
+            aggregates.append(aggregate)
+
+    if not aggregates:
+        raise FileNotFoundError(f"{year}년 뉴스 집계가 없습니다.")
+
+    yearly = merge_month_aggregates(aggregates)
+    yearly.update({"year": year, "months": [aggregate["month"] for aggregate in aggregates]})
+
+    os.makedirs(YEARLY_DIR, exist_ok=True)
+    write_json_atomic(os.path.join(YEARLY_DIR, f"{year}.json"), yearly)
+
+    print(f"✅ {year}년 뉴스 집계 완료: {len(aggregates)}개월, 기사 {yearly['article_count']}건")
+    return yearly
@@ -0,0 +1,218 @@
+import os
+import re
+import sqlite3
+from datetime import date
+
+SEARCH_DB_PATH = "Database/news/news_index.sqlite"
+
+MAX_SEARCH_LIMIT = 200
+
+# trigram 토크나이저는 3글자 이상 검색어만 색인을 사용하므로 짧은 검색어는 2-gram 으로 미리 나눈 색인(articles_bigram)에서 찾음
+MIN_TRIGRAM_LENGTH = 3
+
+# 2-gram 색인의 단어 단위 (unicode61 토크나이저가 나누는 기준과 같게 밑줄/구두점은 구분자로 취급)
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT UNIQUE NOT NULL,
+    published_at TEXT NOT NULL,
+    category TEXT,
+    office TEXT,
+    title TEXT,
+    content TEXT,
+    keywords TEXT,
+    url TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_articles_published_at ON articles(published_at);
+CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category, published_at);
+CREATE INDEX IF NOT EXISTS idx_articles_office ON articles(office, published_at);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, content, keywords,
+    content='articles', content_rowid='rowid',
+    tokenize='trigram'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_bigram USING fts5(
+    title, content, keywords,
+    content='',
+    tokenize='unicode61'
+);
+"""
+
+
+def _word_bigrams(word: str) -> list[str]:
+    # 마지막 글자를 1-gram 으로 함께 넣어 한 글자 검색어도 접두어 검색("급"*)으로 모든 위치를 찾을 수 있게 함
+    return [word[i:i + 2] for i in range(len(word) - 1)] + [word[-1]]
+
+
+def _bigram_text(text: str | None) -> str:
+    """
+    색인할 텍스트를 단어별 2-gram 토큰열로 나눕니다 (예: "급식비 인상" → "급식 식비 비 인상 상").
+    """
+    words = _WORD_PATTERN.findall((text or "").lower())
+    return " ".join(token for word in words for token in _word_bigrams(word))
+
+
+def _connect(db_path: str = SEARCH_DB_PATH) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")  # 수집기가 쓰는 동안에도 검색 가능
+    conn.create_function("bigram_text", 1, _bigram_text, deterministic=True)
+    has_bigram = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'articles_bigram'").fetchone()
+    conn.executescript(_SCHEMA)
+    if not has_bigram:
+        # 2-gram 색인이 생기기 전에 만든 DB: 이미 색인된 기사를 한 번 채움
+        with conn:
+            _sync_bigram_index(conn)
+    return conn
+
+
+def _sync_bigram_index(conn: sqlite3.Connection) -> None:
+    # 기사는 추가만 되므로 2-gram 색인의 마지막 rowid 이후 기사만 색인 (한 문장이라 동시에 실행돼도 중복 없음)
+    conn.execute(
+        "INSERT INTO articles_bigram (rowid, title, content, keywords) "
+        "SELECT rowid, bigram_text(title), bigram_text(content), bigram_text(keywords) FROM articles "
+        "WHERE rowid > coalesce((SELECT rowid FROM articles_bigram ORDER BY rowid DESC LIMIT 1), 0) "
+        "ORDER BY rowid"
+    )
+
+
+def index_articles(articles: list[dict], db_path: str = SEARCH_DB_PATH) -> int:
+    """
+    기사를 검색 색인에 추가합니다. 이미 색인된 id 는 건너뜁니다.
+
+    Returns:
+        int: 새로 색인된 기사 수
+    """
+    conn = _connect(db_path)
+    added = 0
+    with conn:
+        for article in articles:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO articles (id, published_at, category, office, title, content, keywords, url) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    article["id"], article["published_at"], article.get("category"), article.get("office"),
+                    article.get("title", ""), article.get("content", ""),
+                    " ".join(article.get("keywords") or []), article.get("url")
+                )
+            )
+            if cursor.rowcount:
+                conn.execute(
+                    "INSERT INTO articles_fts (rowid, title, content, keywords) "
+                    "SELECT rowid, title, content, keywords FROM articles WHERE rowid = ?",
+                    (cursor.lastrowid,)
+                )
+                added += 1
+        _sync_bigram_index(conn)
+    conn.close()
+    return added
+
+
+def _fts_phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _bigram_query(term: str) -> str:
+    """
+    3글자 미만 검색어를 2-gram 색인 검색식으로 바꿉니다 (2글자는 토큰 일치, 1글자는 접두어 검색).
+    """
+    words = _WORD_PATTERN.findall(term.lower())
+    if not words:
+        raise ValueError(f"검색어에 글자나 숫자가 없습니다: {term!r}")
+    phrases = []
+    for word in words:
+        if len(word) == 1:
+            phrases.append(_fts_phrase(word) + "*")
+        else:
+            phrases.extend(_fts_phrase(token) for token in _word_bigrams(word)[:-1])
+    return " AND ".join(phrases)
+
+
+def _as_date(value: str | date | None, name: str) -> date | None:
+    if value is None or isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"{name} 는 YYYY-MM-DD 형식이어야 합니다: {value!r}")
+
+
+def search_articles(
+    query: str,
+    date_from: str | date | None = None,
+    date_to: str | date | None = None,
+    category: str | None = None,
+    office: str | None = None,
+    limit: int = 20,
+    db_path: str = SEARCH_DB_PATH
+) -> list[dict]:
+    """
+    제목/본문/키워드에서 검색어를 모두 포함하는 기사를 관련도(bm25) 순으로 찾습니다.
+    3글자 이상 검색어는 trigram 색인에서, 더 짧은 검색어는 2-gram 색인에서 찾습니다.
+
+    Args:
+        query (str): 공백으로 구분한 검색어 (예: "급식비 인상")
+        date_from (str | date | None): 시작 발행일 (예: "2025-03-01")
+        date_to (str | date | None): 끝 발행일 (포함, 예: "2025-03-31")
+        category (str | None): 카테고리
+        office (str | None): 교육청
+        limit (int): 최대 결과 수 (1 ~ MAX_SEARCH_LIMIT)
+
+    Returns:
+        list[dict]: id, published_at, category, office, title, url, snippet
+    """
+    terms = query.split()
+    if not terms:
+        raise ValueError("검색어가 비어 있습니다.")
+    if not 1 <= limit <= MAX_SEARCH_LIMIT:
+        raise ValueError(f"limit 은 1 이상 {MAX_SEARCH_LIMIT} 이하여야 합니다: {limit}")
+    date_from, date_to = _as_date(date_from, "date_from"), _as_date(date_to, "date_to")
+    if date_from and date_to and date_from > date_to:
+        raise ValueError("date_from 이 date_to 보다 늦습니다.")
+    long_terms = [term for term in terms if len(term) >= MIN_TRIGRAM_LENGTH]
+    short_terms = [term for term in terms if len(term) < MIN_TRIGRAM_LENGTH]
+
+    conditions, params, joins, ranks = [], [], [], []
+    if long_terms:
+        joins.append("JOIN articles_fts ON articles_fts.rowid = a.rowid")
+        conditions.append("articles_fts MATCH ?")
+        params.append(" AND ".join(_fts_phrase(term) for term in long_terms))
+        ranks.append("bm25(articles_fts, 10.0, 1.0, 5.0)")
+    if short_terms:
+        joins.append("JOIN articles_bigram ON articles_bigram.rowid = a.rowid")
+        conditions.append("articles_bigram MATCH ?")
+        params.append(" AND ".join(_bigram_query(term) for term in short_terms))
+        ranks.append("bm25(articles_bigram, 10.0, 1.0, 5.0)")
+    if date_from:
+        conditions.append("a.published_at >= ?")
+        params.append(date_from.isoformat())
+    if date_to:
+        conditions.append("a.published_at < date(?, '+1 day')")  # 해당 날짜의 시각 포함
+        params.append(date_to.isoformat())
+    if category:
+        conditions.append("a.category = ?")
+        params.append(category)
+    if office:
+        conditions.append("a.office = ?")
+        params.append(office)
+
+    # 2-gram 색인은 원문을 저장하지 않으므로 짧은 검색어만 있으면 본문 앞부분을 미리보기로 사용
+    snippet = "snippet(articles_fts, 1, '<b>', '</b>', '…', 16)" if long_terms else "substr(a.content, 1, 80)"
+    # 두 색인의 bm25 는 모두 음수(작을수록 관련도 높음)이므로 합으로 함께 정렬
+    sql = (
+        f"SELECT a.id, a.published_at, a.category, a.office, a.title, a.url, {snippet} AS snippet "
+        f"FROM articles a {' '.join(joins)} "
+        f"WHERE {' AND '.join(conditions)} ORDER BY {' + '.join(ranks)} LIMIT ?"
+    )
+    params.append(limit)
+
+    if not os.path.exists(db_path):
+        return []
+    conn = _connect(db_path)
+    try:
+        return [dict(row) for row in conn.execute(sql, params)]
+    finally:
+        conn.close()
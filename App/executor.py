@@ -0,0 +1,138 @@
+import os
+import heapq
+import asyncio
+import itertools
+from functools import partial
+from concurrent.futures.process import BrokenProcessPool
+
+import anyio
+from fastapi import HTTPException
+
+from utils.process_pool import CPU_MAX_WORKERS, get_process_pool, replace_broken_pool, shutdown_process_pool
+
+# 요청 처리 분리
+# - CPU 작업(pandas 집계, 정렬 등)과 차트 렌더링: 공유 프로세스 풀에서 실행, 대기열이 차면 503 으로 즉시 거절
+#   풀에는 워커 수만큼만 넣고 나머지는 여기서 기다리게 하여, 짧은 요청 작업이 먼저 쌓인 렌더링 뒤에 줄 서지 않도록 함
+# - 블로킹 I/O(파일, SQLite, 캐시 조회): 전용 스레드 한도 안에서 실행
+# - 가벼운 핸들러: async def 로 이벤트 루프에서 바로 응답 (스레드를 기다리지 않음)
+# 캐시 미스 경로(최종표 정렬, 우선순위 특성, 뉴스 집계)와 보고서 차트(요청당 여러 개)가 같은 대기열을 쓰므로 대기 한도를 넉넉히 둠
+CPU_MAX_PENDING = int(os.environ.get("EDUDATA_CPU_PENDING", max(CPU_MAX_WORKERS * 2, 64)))
+IO_MAX_THREADS = int(os.environ.get("EDUDATA_IO_THREADS", 16))
+
+# 빈 워커를 기다리는 순서: 도착 시각 + 지연(초)이 작은 작업부터.
+# 렌더링은 RENDER_DELAY 만큼 뒤로 미뤄 짧은 요청 작업이 먼저 실행되고, 그만큼 기다린 렌더링은 새 요청보다 먼저 실행됨 (기아 방지)
+RENDER_DELAY = 10.0
+
+
+class _PriorityGate:
+    """
+    프로세스 풀에 동시에 넣는 작업 수를 워커 수로 제한하는 관문.
+    빈 워커가 없으면 (도착 시각 + delay) 순으로 기다리며, 실행 중 + 대기 중 작업 수가 capacity 에 이르면 full() 이 참입니다.
+    """
+    def __init__(self, workers: int, capacity: int):
+        self._workers = workers
+        self._capacity = capacity
+        self._running = 0
+        self._waiting = 0
+        self._waiters: list = []
+        self._order = itertools.count()
+
+    def full(self) -> bool:
+        return self._running + self._waiting >= self._capacity
+
+    async def acquire(self, delay: float = 0.0) -> None:
+        if self._running < self._workers and not self._waiting:
+            self._running += 1
+            return
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._waiters, (loop.time() + delay, next(self._order), future))
+        self._waiting += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 자리를 넘겨받은 직후 취소된 경우 다음 작업에 넘김
+                self.release()
+            else:
+                self._waiting -= 1
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # 실행 중 작업 수는 그대로 두고 자리를 다음 작업에 넘김
+                self._waiting -= 1
+                future.set_result(None)
+                return
+        self._running -= 1
+
+
+_cpu_gate: _PriorityGate | None = None
+_io_limiter: anyio.CapacityLimiter | None = None
+
+
+def start_executors() -> None:
+    """
+    공유 프로세스 풀과 CPU/I/O 동시 실행 한도를 만듭니다 (앱 시작 시 호출, 이미 있으면 그대로 사용).
+    """
+    global _cpu_gate, _io_limiter
+    get_process_pool()
+    if _cpu_gate is None:
+        _cpu_gate = _PriorityGate(CPU_MAX_WORKERS, CPU_MAX_WORKERS + CPU_MAX_PENDING)
+    if _io_limiter is None:
+        _io_limiter = anyio.CapacityLimiter(IO_MAX_THREADS)
+
+
+def shutdown_executors() -> None:
+    global _cpu_gate, _io_limiter
+    shutdown_process_pool()
+    _cpu_gate, _io_limiter = None, None
+
+
+async def _run_in_pool(delay: float, func, args, kwargs):
+    start_executors()
+    if _cpu_gate.full():
+        raise HTTPException(
+            status_code=503,
+            detail="처리 중인 작업이 많습니다. 잠시 후 다시 시도하세요.",
+            headers={"Retry-After": "5"}
+        )
+
+    await _cpu_gate.acquire(delay)
+    try:
+        loop = asyncio.get_running_loop()
+        pool = get_process_pool()
+        try:
+            return await loop.run_in_executor(pool, partial(func, *args, **kwargs))
+        except BrokenProcessPool:
+            return await loop.run_in_executor(replace_broken_pool(pool), partial(func, *args, **kwargs))
+    finally:
+        _cpu_gate.release()
+
+
+async def run_cpu_bound(func, *args, **kwargs):
+    """
+    func 를 프로세스 풀에서 실행합니다. 실행/대기 한도가 차 있으면 기다리지 않고 503 을 반환합니다.
+    워커가 비정상 종료되어 풀이 고장 나면 풀을 새로 만들고 한 번 다시 실행합니다.
+    func 와 인자, 반환값은 pickle 가능해야 합니다 (모듈 최상위 함수).
+    """
+    return await _run_in_pool(0.0, func, args, kwargs)
+
+
+async def run_render_bound(func, *args, **kwargs):
+    """
+    차트 렌더링처럼 오래 걸리는 작업을 run_cpu_bound 와 같은 풀/한도에서 실행하되,
+    빈 워커를 기다릴 때는 RENDER_DELAY 초 안에 도착한 요청 작업(run_cpu_bound)보다 뒤에 실행합니다.
+    """
+    return await _run_in_pool(RENDER_DELAY, func, args, kwargs)
+
+
+async def run_io_bound(func, *args, **kwargs):
+    """
+    블로킹 I/O 함수를 전용 스레드 한도 안에서 실행합니다.
+    """
+    start_executors()
+    return await anyio.to_thread.run_sync(partial(func, *args, **kwargs), limiter=_io_limiter)
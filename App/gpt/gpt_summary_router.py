@@ -6,7 +6,7 @@ router = APIRouter(
 )
 
 @router.post("/summary_generation")
-def generate_gpt_summary():
+async def generate_gpt_summary():
     """
     GPT API를 이용한 해설/요약 문장 생성 API
     """
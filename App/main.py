@@ -1,4 +1,7 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from App.executor import start_executors, shutdown_executors
 from App.news.news_collect_router import router as news_collect_router
 from App.news.news_process_router import router as news_process_router
 from App.news.news_result_router import router as news_result_router
@@ -16,10 +19,20 @@ from App.report.report_table_router import router as report_table_router
 from App.report.report_piechart_router import router as report_piechart_router
 from App.gpt.gpt_summary_router import router as gpt_summary_router
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # CPU 작업/차트 렌더링 공유 프로세스 풀과 I/O 스레드 한도를 만들고 종료 시 정리
+    start_executors()
+    yield
+    shutdown_executors()
+
+
 app = FastAPI(
     title="학교 예결산서 월별/연별 보고서 API 서비스",
     description="학교의 회계 예결산서 데이터를 활용하여 월별 및 연별 보고서를 생성하는 API를 제공합니다.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # 라우터 등록
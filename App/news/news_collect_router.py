@@ -1,10 +1,40 @@
-from fastapi import APIRouter
+from datetime import datetime
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+
+from App.executor import run_io_bound
+from API.news.news_collect import save_articles
 
 router = APIRouter(
     prefix="/news",
     tags=["News"]
 )
 
+class NewsArticle(BaseModel):
+    id: str
+    published_at: datetime
+    title: str
+    content: str = ""
+    category: str | None = None
+    keywords: list[str] = []
+    sentiment: float | None = None
+    office: str | None = None
+    url: str | None = None
+
+class NewsCollectRequest(BaseModel):
+    articles: list[NewsArticle]
+
 @router.post("/collect")
-def collect_news():
-    return {"message": "News collection endpoint"}
+async def collect_news(request: NewsCollectRequest):
+    """
+    수집한 기사를 발행 월별로 저장합니다. 기사가 추가된 달은 다음 월별 집계 때 다시 계산됩니다.
+    """
+    try:
+        # 발행일은 ISO 문자열로 저장 (월 키와 검색 색인의 기간 조건이 같은 형식을 사용)
+        added = await run_io_bound(save_articles, [article.model_dump(mode="json") for article in request.articles])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {
+        "message": f"기사 {sum(len(rows) for rows in added.values())}건 저장",
+        "months": {month: len(rows) for month, rows in added.items()}
+    }
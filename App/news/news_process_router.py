@@ -1,14 +1,72 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+
+from App.executor import run_cpu_bound, run_io_bound
+from App.news.news_service import aggregate_month
+from API.news.news_process_monthly import dirty_months, is_month_dirty, process_dirty_months
+from API.news.news_process_yearly import process_news_year
 
 router = APIRouter(
     prefix="/news",
     tags=["News"]
 )
 
+class MonthlyProcessRequest(BaseModel):
+    year: int | None = None
+    month: int | None = None
+    force: bool = False
+
+class YearlyProcessRequest(BaseModel):
+    year: int
+
+def _year_is_dirty(year: int) -> bool:
+    return any(is_month_dirty(year, month) for month in range(1, 13))
+
 @router.post("/process_monthly")
-def process_news_monthly():
-    return {"message": "News monthly processing endpoint"}
+async def process_news_monthly(request: MonthlyProcessRequest):
+    """
+    월별 뉴스 집계 파티션을 만듭니다.
+    - year, month: 대상 월 (생략하면 기사가 바뀐 달만 다시 집계)
+    - force: 변경이 없어도 다시 집계
+    """
+    if request.year is None or request.month is None:
+        # 바뀐 달이 있을 때만 프로세스 풀에서 한 번에 집계 (달마다 풀에 따로 넣으면 달마다 대기)
+        aggregates = await run_cpu_bound(process_dirty_months) if await run_io_bound(dirty_months) else []
+        return {
+            "message": f"{len(aggregates)}개월 다시 집계",
+            "months": [f"{a['year']}-{a['month']:02d}" for a in aggregates]
+        }
+
+    if not 1 <= request.month <= 12:
+        raise HTTPException(status_code=400, detail="month 는 1~12 사이여야 합니다.")
+    try:
+        aggregate = await aggregate_month(request.year, request.month, force=request.force)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    return {
+        "message": f"{request.year}-{request.month:02d} 집계 완료",
+        "article_count": aggregate["article_count"],
+        "category_counts": aggregate["category_counts"]
+    }
 
 @router.post("/process_yearly")
-def process_news_yearly():
-    return {"message": "News yearly processing endpoint"}
+async def process_news_yearly(request: YearlyProcessRequest):
+    """
+    월별 집계 파티션을 합쳐 연간 뉴스 집계를 만듭니다.
+    """
+    try:
+        # 바뀐 달이 있으면 다시 집계가 필요하므로 프로세스 풀에서, 없으면 월별 집계를 더하기만 하므로 스레드에서 실행
+        if await run_io_bound(_year_is_dirty, request.year):
+            yearly = await run_cpu_bound(process_news_year, request.year)
+        else:
+            yearly = await run_io_bound(process_news_year, request.year)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    return {
+        "message": f"{request.year}년 집계 완료",
+        "months": yearly["months"],
+        "article_count": yearly["article_count"],
+        "category_counts": yearly["category_counts"]
+    }
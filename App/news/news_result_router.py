@@ -1,20 +1,51 @@
+from datetime import date
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
 
-
-from fastapi import APIRouter
+from App.executor import run_io_bound
+from API.news.news_search import MAX_SEARCH_LIMIT, search_articles
 
 router = APIRouter(
     prefix="/news",
     tags=["News"]
 )
 
+class NewsSearchRequest(BaseModel):
+    query: str
+    date_from: date | None = None
+    date_to: date | None = None
+    category: str | None = None
+    office: str | None = None
+    limit: int = Field(20, ge=1, le=MAX_SEARCH_LIMIT)
+
 @router.post("/top10/tabledata")
-def get_top10_tabledata():
+async def get_top10_tabledata():
     return {"message": "Top 10 news table data endpoint"}
 
 @router.post("/keywords/wordcloud")
-def get_keywords_wordcloud():
+async def get_keywords_wordcloud():
     return {"message": "Keywords word cloud endpoint"}
 
 @router.post("/top_category_3")
-def get_top3_categories():
-    return {"message": "Top 3 news categories endpoint"}
\ No newline at end of file
+async def get_top3_categories():
+    return {"message": "Top 3 news categories endpoint"}
+
+@router.post("/search")
+async def search_news(request: NewsSearchRequest):
+    """
+    수집 기사 전문 검색 (관련도순).
+    - query: 검색어 (공백으로 구분하면 모두 포함하는 기사)
+    - date_from, date_to: 발행일 범위 (예: "2025-03-01", "2025-03-31")
+    - category, office: 카테고리/교육청 필터
+    - limit: 최대 결과 수 (1 ~ 200)
+    """
+    try:
+        hits = await run_io_bound(
+            search_articles,
+            request.query, request.date_from, request.date_to,
+            request.category, request.office, request.limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {"message": f"{len(hits)}건 검색", "hits": hits}
@@ -0,0 +1,14 @@
+from App.executor import run_cpu_bound, run_io_bound
+from API.news.news_process_monthly import is_month_dirty, load_month_aggregate, process_news_month
+
+
+async def aggregate_month(year: int, month: int, force: bool = False) -> dict:
+    """
+    기사 파일이 바뀐 달(또는 force)만 프로세스 풀에서 다시 집계하고, 그 외에는 저장된 파티션을 읽습니다.
+    /news/process_monthly 와 /report/monthly 가 함께 사용합니다.
+    """
+    if not force and not await run_io_bound(is_month_dirty, year, month):
+        aggregate = await run_io_bound(load_month_aggregate, year, month)
+        if aggregate is not None:
+            return aggregate
+    return await run_cpu_bound(process_news_month, year, month, force=force)
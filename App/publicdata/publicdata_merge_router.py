@@ -8,7 +8,7 @@ router = APIRouter(
 )
 
 @router.post("/result_generate")
-def generate_publicdata_result():
+async def generate_publicdata_result():
     """
     공공 데이터 Scoring DB + 뉴스 예측 예산 활용 → 최종 예산 Result DB 저장
     """
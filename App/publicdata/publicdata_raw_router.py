@@ -6,5 +6,5 @@ router = APIRouter(
 )
 
 @router.post("/raw")
-def collect_publicdata_raw():
+async def collect_publicdata_raw():
     return {"message": "Public data raw collection endpoint"}
@@ -6,5 +6,5 @@ router = APIRouter(
 )
 
 @router.post("/result")
-def get_publicdata_result():
+async def get_publicdata_result():
     return {"message": "Public data result endpoint"}
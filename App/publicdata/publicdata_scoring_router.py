@@ -6,5 +6,5 @@ router = APIRouter(
 )
 
 @router.post("/scoring")
-def score_publicdata():
+async def score_publicdata():
     return {"message": "Public data scoring endpoint"}
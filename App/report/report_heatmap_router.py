@@ -1,15 +1,57 @@
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
 
-
-from fastapi import APIRouter
+from App.executor import run_cpu_bound
+from App.report.report_render import render_report_sections
+from utils.region_hierarchy import region_heatmap_matrix
+from utils.report_builder import ReportSection
 
 router = APIRouter(
     prefix="/report",
     tags=["Report"]
 )
 
+class HeatmapRequest(BaseModel):
+    level: str = "시도"
+    year: int
+    value: str = "비중"
+    budget_type: str = "결산"
+    flow: str = "세출"
+    school_level: str | None = None
+    parent: str | None = None
+
 @router.post("/heatmap_generate")
-def generate_heatmap():
+async def generate_heatmap(request: HeatmapRequest):
     """
     공공 데이터 Result DB 기반 지도 히트맵 생성 API
+    - level: "시도", "지원청", "시군구", "학교" 중 히트맵 행 단위
+    - value: "비중"(지역 내 항목 비중), "학교당 평균", "합계"
+    - parent: 상위 지역 이름 (예: "경기도교육청" 하위 지원청만)
+    - 지역이 HEATMAP_MAX_ROWS 개를 넘으면(전국 학교 단위 등) 400 - parent 로 범위를 좁혀 요청
     """
-    return {"message": "Heatmap successfully generated"}
\ No newline at end of file
+    try:
+        matrix = await run_cpu_bound(
+            region_heatmap_matrix, request.level, request.year, request.value,
+            budget_type=request.budget_type, flow=request.flow,
+            school_level=request.school_level, parent=request.parent
+        )
+        section = ReportSection("region_heatmap", "heatmap", f"{request.year}년 {request.level}별 {request.flow} 항목 {request.value}", {
+            "rows": matrix.index.tolist(),
+            "columns": matrix.columns.tolist(),
+            "values": matrix.values.tolist()
+        })
+        rendered = await render_report_sections([section])
+        image_path, reused = rendered[section.name]
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "message": "Heatmap successfully generated",
+        "image": image_path,
+        "reused": reused,
+        "rows": section.data["rows"],
+        "columns": section.data["columns"],
+        "values": section.data["values"]
+    }
@@ -1,6 +1,12 @@
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
+from App.executor import run_io_bound
+from App.news.news_service import aggregate_month
+from App.report.report_render import render_report_sections
+from API.news.news_keywords import topk_from_sketch
+from utils.report_builder import ReportSection, build_report, pdf_available
+
 router = APIRouter(
     prefix="/report",
     tags=["Report"]
@@ -9,15 +15,59 @@ router = APIRouter(
 class MonthlyReportRequest(BaseModel):
     year: int
     month: int
+    pdf: bool = False
 
 @router.post("/monthly")
-def generate_monthly_report(request: MonthlyReportRequest):
+async def generate_monthly_report(request: MonthlyReportRequest):
     """
     월별 뉴스 데이터를 기반으로 보고서를 생성합니다.
     - year: 보고서 대상 연도 (예: 2025)
     - month: 보고서 대상 월 (예: 4)
+    - pdf: PDF 생성 여부
     """
-    # TODO: 해당 연도/월의 뉴스 데이터를 조회하여 보고서 생성 로직 추가
-    # 예시) report_content = create_monthly_report(year=request.year, month=request.month)
+    if not 1 <= request.month <= 12:
+        raise HTTPException(status_code=400, detail="month 는 1~12 사이여야 합니다.")
+    if request.pdf and not pdf_available():
+        raise HTTPException(status_code=501, detail="PDF 생성을 위해서는 서버에 weasyprint 패키지가 필요합니다.")
+
+    try:
+        aggregate = await aggregate_month(request.year, request.month)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    categories = sorted(aggregate["category_counts"].items(), key=lambda item: item[1], reverse=True)
+    top_keywords = topk_from_sketch(aggregate["keyword_topk"], n=10)
+    sentiment_count = aggregate["sentiment_count"].get("전체", 0)
+    summary = (
+        f"{request.year}년 {request.month}월 교육 뉴스 동향 보고서\n"
+        f"기사 {aggregate['article_count']}건, 주요 분야: {', '.join(name for name, _ in categories[:3])}"
+    )
+    if sentiment_count:
+        summary += f"\n평균 감성 점수: {aggregate['sentiment_sum']['전체'] / sentiment_count:.2f}"
+
+    sections = [
+        ReportSection("summary", "text", "요약", {"text": summary}),
+        ReportSection("keyword_cloud", "wordcloud", "주요 키워드", {"frequencies": aggregate["keyword_counts"]}),
+        ReportSection("category_pie", "piechart", "분야별 기사 비중", {
+            "labels": [name for name, _ in categories],
+            "values": [count for _, count in categories]
+        }),
+        ReportSection("keyword_table", "table", "상위 키워드", {
+            "columns": ["순위", "키워드", "빈도"],
+            "rows": [[rank, keyword, count] for rank, (keyword, count) in enumerate(top_keywords, start=1)]
+        }),
+    ]
+    rendered = await render_report_sections(sections)
+    report = await run_io_bound(
+        build_report,
+        title=f"{request.year}년 {request.month}월 교육 여론 월간 보고서",
+        sections=sections,
+        output_name=f"monthly_{request.year}_{request.month:02d}",
+        pdf=request.pdf,
+        rendered=rendered
+    )
 
-    return {"message": f"Monthly report for {request.year}-{request.month:02d} generation is triggered."}
+    return {
+        "message": f"Monthly report for {request.year}-{request.month:02d} generation is triggered.",
+        "report": report
+    }
@@ -1,15 +1,49 @@
 
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+
+from App.executor import run_cpu_bound, run_io_bound
+from utils.priority_ranking import (
+    MAX_TOP_N, build_features, lookup_features, rank_features, store_features, validate_rank_args
+)
 
 router = APIRouter(
     prefix="/report",
     tags=["Report"]
 )
 
+class PrioritySummaryRequest(BaseModel):
+    year: int | None = None
+    weights: dict[str, float] | None = None
+    top_n: int = Field(10, ge=1, le=MAX_TOP_N)
+    level: str | None = None
+
 @router.post("/priority_summary")
-def generate_priority_summary():
+async def generate_priority_summary(request: PrioritySummaryRequest):
     """
     공공 데이터 Result DB 기반 지역별 우선순위 요약 생성 API
+    - year: 대상 연도 (없으면 최신 연도)
+    - weights: 지표별 가중치 (비중_부족, 학교당_격차, 미집행) - 바꿔서 what-if 순위 확인 가능
+    - top_n: 상위 몇 개를 반환할지
+    - level: 학교급 필터 (초등/중등/고등)
     """
-    return {"message": "Priority summary successfully generated"}
\ No newline at end of file
+    try:
+        validate_rank_args(request.weights, request.top_n)
+        version, year, features = await run_io_bound(lookup_features, request.year)
+        if features is None:
+            # 지표 행렬 계산(pandas 집계)은 캐시가 없을 때만 프로세스 풀에서 수행
+            features = await run_cpu_bound(build_features, version, year)
+            store_features(version, year, features)
+        # 캐시된 행렬에는 행렬곱과 부분 정렬만 수행
+        ranking = rank_features(year, features, request.weights, request.top_n, request.level)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    ranking = ranking.astype(object).where(ranking.notna(), None)
+    return {
+        "message": "Priority summary successfully generated",
+        "ranking": ranking.to_dict(orient="records")
+    }
\ No newline at end of file
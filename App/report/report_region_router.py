@@ -1,13 +1,44 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel
+
+from App.executor import run_io_bound
+from utils.region_hierarchy import query_region_level
 
 router = APIRouter(
     prefix="/report",
     tags=["Report"]
 )
 
+class RegionSummationRequest(BaseModel):
+    level: str = "시도"
+    year: int
+    budget_type: str = "결산"
+    flow: str = "세출"
+    school_level: str | None = None
+    parent: str | None = None
+
 @router.post("/region_summation")
-def generate_region_summation():
+async def generate_region_summation(request: RegionSummationRequest):
     """
     공공 데이터 Result DB 기반 지역별 예산 Summation API
+    - level: "전국", "시도", "지원청", "시군구", "학교"
+    - year, budget_type, flow: 대상 연도와 예산/결산, 세입/세출
+    - school_level: 학교급 (없으면 학교급 합산)
+    - parent: 상위 지역(시도교육청 또는 교육지원청) 이름 - 해당 지역 하위만 조회
     """
-    return {"message": "Region summation successfully generated"}
+    try:
+        df = await run_io_bound(
+            query_region_level, request.level, request.year,
+            budget_type=request.budget_type, flow=request.flow,
+            school_level=request.school_level, parent=request.parent
+        )
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    df = df.astype(object).where(df.notna(), None)
+    return {
+        "message": "Region summation successfully generated",
+        "rows": df.to_dict(orient="records")
+    }
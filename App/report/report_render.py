@@ -0,0 +1,39 @@
+import asyncio
+
+from App.executor import run_io_bound, run_render_bound
+from utils.report_builder import ReportSection, plan_sections, render_section, save_rendered_charts
+
+# 렌더링 중인 차트 (산출물 경로 → 작업). 같은 입력의 차트를 동시에 요청하면 한 번만 렌더링
+_inflight: dict[str, asyncio.Task] = {}
+
+
+async def _render_chart(section: ReportSection, path: str) -> None:
+    content = await run_render_bound(render_section, section.kind, section.data)
+    await run_io_bound(save_rendered_charts, [(section, path)], [content])
+
+
+async def render_report_sections(sections: list[ReportSection]) -> dict:
+    """
+    보고서 섹션을 렌더링합니다. 바뀐 차트만 run_render_bound 로 공유 프로세스 풀에서 렌더링하므로
+    요청 작업과 같은 실행 한도(초과 시 503)를 따르고, 빈 워커는 요청 작업이 먼저 사용합니다.
+    다른 요청이 같은 차트를 렌더링 중이면 새로 렌더링하지 않고 그 결과를 기다립니다.
+
+    Returns:
+        dict: {섹션 이름: (산출물 경로, 재사용 여부)} (build_report 의 rendered 인자로 전달)
+    """
+    results, charts = await run_io_bound(plan_sections, sections)
+
+    tasks = []
+    for section, path in charts:
+        task = _inflight.get(path)
+        if task is None:
+            task = asyncio.ensure_future(_render_chart(section, path))
+            _inflight[path] = task
+            task.add_done_callback(lambda _, path=path: _inflight.pop(path, None))
+        # 한 요청이 취소되어도 같은 차트를 기다리는 다른 요청의 렌더링은 계속되도록 shield
+        tasks.append(asyncio.shield(task))
+
+    await asyncio.gather(*tasks)
+    for section, path in charts:
+        results[section.name] = (path, False)
+    return results
@@ -1,15 +1,95 @@
 
 
-from fastapi import APIRouter
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
+
+from App.executor import run_cpu_bound, run_io_bound
+from utils.table_serving import (
+    compute_sorted_indices, filter_key, lookup_sorted_indices, paginate, resolve_final_table, store_sorted_indices,
+    take_batches, iter_csv_bytes, iter_arrow_stream_bytes
+)
 
 router = APIRouter(
     prefix="/report",
     tags=["Report"]
 )
 
+class FinalTableRequest(BaseModel):
+    table: Literal["school", "office"] = "school"
+    office: list[str] | None = None
+    level: list[str] | None = None
+    type: list[str] | None = None
+    year: list[int] | None = None
+    sort_by: str = "ATPT_OFCDC_ORG_NM"
+    descending: bool = False
+    cursor: str | None = None
+    limit: int | None = Field(1000, ge=1, le=10_000)
+    format: Literal["json", "csv", "arrow"] = "json"
+    compression: Literal["gzip", "br"] | None = None
+
+def _json_page_response(table, page, next_cursor: str | None, total: int, headers: dict) -> JSONResponse:
+    return JSONResponse({
+        "message": "Final table data successfully generated",
+        "total": total,
+        "next_cursor": next_cursor,
+        "rows": table.take(page).to_pylist()
+    }, headers=headers)
+
 @router.post("/final_table_generate")
-def generate_final_table():
+async def generate_final_table(request: FinalTableRequest):
     """
     예산 DB + 뉴스 예측 예산 기반 표 데이터 생성 API
+    - table: "school"(학교별) 또는 "office"(교육청별)
+    - office / level / type / year: 필터 (서버에서 적용)
+    - sort_by, descending: 정렬
+    - cursor, limit: 페이지네이션 (limit 1~10000, csv/arrow 는 limit=null 이면 전체 스트리밍)
+    - format: "json", "csv", "arrow"(IPC stream) / compression: csv 전용 "gzip" 또는 "br"
     """
-    return {"message": "Final table data successfully generated"}
\ No newline at end of file
+    if request.format == "json" and request.limit is None:
+        raise HTTPException(status_code=400, detail="json 형식은 limit 를 1~10000 으로 지정해야 합니다.")
+
+    filters = {"office": request.office, "level": request.level, "type": request.type, "year": request.year}
+    try:
+        table_name, version, table = await run_io_bound(resolve_final_table, request.table)
+        key = (table_name, version, filter_key(filters), request.sort_by, request.descending)
+        page_indices = lookup_sorted_indices(key)
+        if page_indices is None:
+            # 필터/정렬은 CPU 작업이므로 프로세스 풀에서 계산 (워커도 같은 버전 파일을 memory-map 으로 열어 복사 없음)
+            page_indices = await run_cpu_bound(compute_sorted_indices, *key)
+            store_sorted_indices(key, page_indices)
+        page, next_cursor, total = paginate(version, page_indices, request.cursor, request.limit)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    headers = {"X-Total-Count": str(total)}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
+
+    if request.format == "csv":
+        if request.compression:
+            headers["Content-Encoding"] = request.compression
+        try:
+            body = iter_csv_bytes(take_batches(table, page), table.schema, compression=request.compression)
+            first_chunk = next(body)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        def stream():
+            yield first_chunk
+            yield from body
+
+        return StreamingResponse(stream(), media_type="text/csv; charset=utf-8", headers=headers)
+
+    if request.format == "arrow":
+        return StreamingResponse(
+            iter_arrow_stream_bytes(take_batches(table, page), table.schema),
+            media_type="application/vnd.apache.arrow.stream", headers=headers
+        )
+
+    # 행 변환과 JSON 직렬화는 이벤트 루프를 막지 않도록 스레드에서 수행
+    return await run_io_bound(_json_page_response, table, page, next_cursor, total, headers)
\ No newline at end of file
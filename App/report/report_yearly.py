@@ -1,5 +1,13 @@
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from App.executor import run_cpu_bound, run_io_bound
+from App.report.report_render import render_report_sections
+from API.news.news_keywords import topk_from_sketch
+from API.news.news_process_yearly import process_news_year
+from utils.report_builder import ReportSection, build_report, pdf_available
+from utils.schema_registry import PER_HEAD_COLUMN
+from utils.yearly_trend import MAX_TREND_SPAN, build_yearly_comparison
 
 router = APIRouter(
     prefix="/report",
@@ -8,14 +16,118 @@ router = APIRouter(
 
 class YearlyReportRequest(BaseModel):
     year: int
+    span: int = Field(5, ge=1, le=MAX_TREND_SPAN)
+    pdf: bool = False
+
+def build_yearly_sections(year: int, comparison) -> list[ReportSection]:
+    """
+    추세 비교표로부터 연별 보고서 섹션(비교표, 항목 비중 파이차트, 교육청 히트맵, 요약)을 만듭니다.
+    """
+    spending = comparison[(comparison["세입세출"] == "세출") & (comparison["항목"] != PER_HEAD_COLUMN)]
+    current = spending[spending["연도"] == year]
+
+    national = spending.pivot_table(index="항목", columns="연도", values="결산", aggfunc="sum")
+    category_share = current.groupby("항목")["결산"].sum()
+    office_share = current.pivot_table(index="ATPT_OFCDC_ORG_NM", columns="항목", values="결산", aggfunc="sum")
+    office_share = office_share.div(office_share.sum(axis=1), axis=0).fillna(0)
+
+    growth = None
+    if national.shape[1] > 1:
+        growth = (national.iloc[:, -1] / national.iloc[:, -2] - 1).dropna().sort_values()
+    summary_lines = [f"{year}년 결산 세출 총액: {category_share.sum():,.0f}원"]
+    if growth is not None and not growth.empty:
+        summary_lines.append(f"전년 대비 증가율이 가장 큰 항목: {growth.index[-1]} ({growth.iloc[-1]:+.1%})")
+        summary_lines.append(f"전년 대비 감소폭이 가장 큰 항목: {growth.index[0]} ({growth.iloc[0]:+.1%})")
+
+    national_rows = national.reset_index().astype(object)
+    national_rows = national_rows.where(national_rows.notna(), None)
+
+    return [
+        ReportSection("summary", "text", "요약", {"text": "\n".join(summary_lines)}),
+        ReportSection("national_table", "table", f"최근 {national.shape[1]}년 항목별 결산 세출", {
+            "columns": ["항목"] + [str(c) for c in national.columns],
+            "rows": national_rows.values.tolist()
+        }),
+        ReportSection("category_pie", "piechart", f"{year}년 결산 세출 항목 비중", {
+            "labels": category_share.index.tolist(),
+            "values": category_share.tolist()
+        }),
+        ReportSection("office_heatmap", "heatmap", f"{year}년 교육청별 세출 항목 비중", {
+            "rows": office_share.index.tolist(),
+            "columns": office_share.columns.tolist(),
+            "values": office_share.values.tolist()
+        }),
+    ]
+
+def build_yearly_news_sections(year: int, yearly: dict) -> list[ReportSection]:
+    """
+    연간 뉴스 집계(process_news_year)로부터 뉴스 종합 분석 섹션(요약, 분야 비중, 상위 키워드)을 만듭니다.
+    """
+    categories = sorted(yearly["category_counts"].items(), key=lambda item: item[1], reverse=True)
+    top_keywords = topk_from_sketch(yearly["keyword_topk"], n=10)
+    summary = (
+        f"{year}년 수집 기사 {yearly['article_count']}건 ({len(yearly['months'])}개월), "
+        f"주요 분야: {', '.join(name for name, _ in categories[:3])}"
+    )
+    sentiment_count = yearly["sentiment_count"].get("전체", 0)
+    if sentiment_count:
+        summary += f"\n평균 감성 점수: {yearly['sentiment_sum']['전체'] / sentiment_count:.2f}"
+
+    return [
+        ReportSection("news_summary", "text", "뉴스 종합 분석", {"text": summary}),
+        ReportSection("news_category_pie", "piechart", f"{year}년 분야별 기사 비중", {
+            "labels": [name for name, _ in categories],
+            "values": [count for _, count in categories]
+        }),
+        ReportSection("news_keyword_table", "table", f"{year}년 상위 키워드", {
+            "columns": ["순위", "키워드", "빈도"],
+            "rows": [[rank, keyword, count] for rank, (keyword, count) in enumerate(top_keywords, start=1)]
+        }),
+    ]
+
+def prepare_yearly_report(year: int, span: int) -> tuple[list[ReportSection], list[dict]]:
+    """
+    추세 비교표와 보고서 섹션을 만듭니다 (pandas 집계라 프로세스 풀에서 실행).
+    해당 연도의 뉴스 집계가 있으면 뉴스 종합 분석 섹션을 덧붙입니다.
+    """
+    comparison = build_yearly_comparison(year=year, span=span)
+    sections = build_yearly_sections(year, comparison)
+    try:
+        sections += build_yearly_news_sections(year, process_news_year(year))
+    except FileNotFoundError:
+        print(f"⚠️ {year}년 뉴스 집계가 없어 뉴스 분석 섹션을 생략합니다.")
+    comparison = comparison.astype(object).where(comparison.notna(), None)
+    return sections, comparison.to_dict(orient="records")
 
 @router.post("/yearly")
-def generate_yearly_report(request: YearlyReportRequest):
+async def generate_yearly_report(request: YearlyReportRequest):
     """
     연별 뉴스 + 공공 데이터를 통합하여 보고서를 생성합니다.
     - year: 보고서 대상 연도 (예: 2025)
+    - span: 비교할 연도 수 (기본 5년)
+    - pdf: PDF 생성 여부
     """
-    # TODO: 해당 연도 동안 수집된 뉴스 및 공공 데이터 종합 분석 및 보고서 생성 로직 추가
-    # 예시) report_content = create_yearly_report(year=request.year)
+    if request.pdf and not pdf_available():
+        raise HTTPException(status_code=501, detail="PDF 생성을 위해서는 서버에 weasyprint 패키지가 필요합니다.")
+
+    try:
+        sections, comparison = await run_cpu_bound(prepare_yearly_report, request.year, request.span)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+    # 차트는 공유 프로세스 풀에서 요청 작업보다 낮은 우선순위로 렌더링하고, 조립(파일 읽기/쓰기)만 스레드에서 실행
+    rendered = await render_report_sections(sections)
+    report = await run_io_bound(
+        build_report,
+        title=f"{request.year}년 교육 예결산 연간 보고서",
+        sections=sections,
+        output_name=f"yearly_{request.year}",
+        pdf=request.pdf,
+        rendered=rendered
+    )
 
-    return {"message": f"Yearly report for {request.year} generation is triggered."}
\ No newline at end of file
+    return {
+        "message": f"Yearly report for {request.year} generation is triggered.",
+        "report": report,
+        "comparison": comparison
+    }
\ No newline at end of file
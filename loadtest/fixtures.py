@@ -0,0 +1,104 @@
+import os
+import random
+import numpy as np
+import pandas as pd
+
+from utils.schema_registry import AMT_COLUMN_MAPS
+
+OFFICES = [
+    "서울특별시교육청", "부산광역시교육청", "대구광역시교육청", "인천광역시교육청", "광주광역시교육청",
+    "대전광역시교육청", "울산광역시교육청", "세종특별자치시교육청", "경기도교육청", "강원특별자치도교육청",
+    "충청북도교육청", "충청남도교육청", "전북특별자치도교육청", "전라남도교육청", "경상북도교육청",
+    "경상남도교육청", "제주특별자치도교육청"
+]
+LEVELS = {"초등": "초등학교", "중등": "중학교", "고등": "고등학교"}
+NEWS_CATEGORIES = ["급식", "안전", "예산", "교권", "돌봄", "디지털"]
+NEWS_SUBJECTS = [
+    "급식비 인상", "학교 안전 점검", "교육 예산 삭감", "방과후 학교 확대", "교사 채용 확대",
+    "디지털 교과서 도입", "늘봄학교 운영", "학교 시설 개선", "교권 보호 대책", "기초학력 진단"
+]
+
+
+def generate_budget_csvs(csv_folder: str, years: list[int], schools_per_level: int, seed: int = 0) -> None:
+    """
+    combined_csv 형식의 예산/결산 × 세입/세출 CSV를 연도·학교급별로 만듭니다.
+    (학교 목록은 연도마다 같고 금액만 달라짐)
+    """
+    os.makedirs(csv_folder, exist_ok=True)
+    rng = np.random.default_rng(seed)
+
+    for level, suffix in LEVELS.items():
+        n = schools_per_level
+        schools = pd.DataFrame({
+            "SCHUL_CODE": [f"{level}{i:06d}" for i in range(n)],
+            "SCHUL_NM": [f"테스트{i}{suffix}" for i in range(n)],
+            "ATPT_OFCDC_ORG_NM": rng.choice(OFFICES, size=n),
+            "FOND_SC_CODE": rng.choice(["공립", "사립"], size=n, p=[0.8, 0.2]),
+        })
+        scale = rng.lognormal(mean=20, sigma=0.5, size=n)
+
+        for year in years:
+            growth = 1.03 ** (year - years[0])
+            for flow, amt_map in AMT_COLUMN_MAPS.items():
+                shares = rng.dirichlet(np.ones(len(amt_map)), size=n)
+                budget = scale[:, None] * growth * shares
+                for budget_type, amounts in [("예산", budget), ("결산", budget * rng.uniform(0.8, 1.0, size=(n, 1)))]:
+                    df = schools.copy()
+                    for i, column in enumerate(amt_map):
+                        df[column] = amounts[:, i].round()
+                    if "YESAN_PER_HEAD" in df.columns:
+                        df["YESAN_PER_HEAD"] = (df["YESAN_PER_HEAD"] / 1000).round()
+                    path = os.path.join(csv_folder, f"{level}_{budget_type}_{flow}_{year}.csv")
+                    df.to_csv(path, index=False, encoding="utf-8-sig")
+
+
+def generate_articles(years: list[int], n_articles: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    articles = []
+    for i in range(n_articles):
+        subject = rng.choice(NEWS_SUBJECTS)
+        office = rng.choice(OFFICES)
+        articles.append({
+            "id": f"fixture-{i}",
+            "published_at": f"{rng.choice(years)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T09:00:00",
+            "title": f"{office} {subject} 추진",
+            "content": f"{office}는 {subject} 관련 계획을 발표했다. " * 5,
+            "category": rng.choice(NEWS_CATEGORIES),
+            "keywords": subject.split() + [office],
+            "sentiment": round(rng.uniform(-1, 1), 3),
+            "office": office,
+            "url": f"https://news.example.com/{i}"
+        })
+    return articles
+
+
+def build_fixtures(
+    workdir: str,
+    years: tuple[int, ...] = (2020, 2021, 2022, 2023, 2024),
+    schools_per_level: int = 300,
+    n_articles: int = 5000,
+    seed: int = 0
+) -> None:
+    """
+    workdir 아래에 부하 테스트용 Database/ 를 만들고 서버가 읽는 저장소(추세, 최종 표, 뉴스 집계/색인)를 게시합니다.
+    저장소 경로가 상대 경로이므로 workdir 로 이동한 뒤 실행합니다.
+    """
+    from API.news.news_collect import save_articles
+    from API.news.news_process_yearly import process_news_year
+    from utils.region_hierarchy import build_region_hierarchy
+    from utils.table_serving import build_final_tables
+    from utils.yearly_trend import append_year_to_trend_store
+
+    os.makedirs(workdir, exist_ok=True)
+    os.chdir(workdir)
+
+    csv_folder = "Database/schoolinfo/combined_csv"
+    generate_budget_csvs(csv_folder, list(years), schools_per_level, seed)
+    for year in years:
+        append_year_to_trend_store(csv_folder, year)
+    build_final_tables(csv_folder)
+    build_region_hierarchy(csv_folder)
+
+    save_articles(generate_articles(list(years[-2:]), n_articles, seed))
+    for year in years[-2:]:
+        process_news_year(year)
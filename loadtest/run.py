@@ -0,0 +1,260 @@
+"""
+App.main:app 을 같은 프로세스에서 (ASGI transport) 구동하는 부하 테스트.
+
+    PYTHONPATH=. python -m loadtest.run --concurrency 16 --requests 400
+    PYTHONPATH=. python -m loadtest.run --update-baseline --recorded-on "기록 환경 설명"   # 기준값 갱신
+
+경로별 p50/p95/p99 지연과 처리량(503 거절 제외)을 기록하고, 저장된 기준값(loadtest/baseline.json)보다
+p95 가 tolerance 배 + slack 이상 느려지거나 오류 응답이 있으면 종료 코드 1 로 끝납니다.
+
+기준값은 절대 시간(ms)이므로 기록한 기계에서만 의미가 있습니다. 다른 기계/CI 에서는 먼저
+--update-baseline 으로 그 기계의 기준값을 만든 뒤 비교하세요 (기준값에 기록 환경을 함께 저장하고, 다르면 경고).
+기준값 갱신은 --recorded-on 으로 기록 환경(기계, 부하, 이유)을 밝혀야 하며, 기능 변경과 별도 커밋으로 올립니다.
+"""
+import os
+import sys
+import platform
+import json
+import time
+import random
+import asyncio
+import argparse
+import tempfile
+from collections import Counter, defaultdict
+import numpy as np
+
+from loadtest.fixtures import build_fixtures
+from loadtest.scenarios import DEFAULT_SCENARIOS, Scenario
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+async def run_load(scenarios: list[Scenario], total_requests: int, concurrency: int, seed: int = 0) -> dict:
+    """
+    가중치대로 섞은 요청 total_requests 개를 concurrency 개의 동시 클라이언트로 보냅니다.
+    각 경로를 한 번씩 먼저 호출하여 (프로세스 풀, 캐시) 예열한 뒤 측정합니다.
+
+    Returns:
+        dict: {"elapsed": 초, "latencies": {이름: [초, ...]}, "errors": {이름: 건수}, "rejected": {이름: 건수}}
+    """
+    import httpx
+    from App.main import app
+
+    rng = random.Random(seed)
+    plan = rng.choices(scenarios, weights=[scenario.weight for scenario in scenarios], k=total_requests)
+    requests = iter([(scenario, scenario.payload(rng)) for scenario in plan])
+
+    latencies = defaultdict(list)
+    errors = Counter()
+    rejected = Counter()
+
+    async with app.router.lifespan_context(app):
+        # 처리되지 않은 예외도 500 응답으로 받아 오류로 집계
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=None) as client:
+            for scenario in scenarios:
+                await client.post(scenario.path, json=scenario.payload(rng))
+
+            async def worker():
+                for scenario, payload in requests:
+                    start = time.perf_counter()
+                    response = await client.post(scenario.path, json=payload)
+                    if response.status_code == 503:
+                        rejected[scenario.name] += 1
+                    else:
+                        latencies[scenario.name].append(time.perf_counter() - start)
+                    if response.status_code not in scenario.ok_status:
+                        errors[scenario.name] += 1
+
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - start
+
+    return {"elapsed": elapsed, "latencies": dict(latencies), "errors": dict(errors), "rejected": dict(rejected)}
+
+
+def summarize(result: dict) -> dict:
+    """
+    경로별 처리 수, 오류 수, 거절(503) 수, p50/p95/p99 지연(ms), 처리량(req/s)을 계산합니다.
+    """
+    elapsed = result["elapsed"]
+    routes = {}
+    names = set(result["latencies"]) | set(result["errors"]) | set(result["rejected"])
+    for name in sorted(names):
+        values = result["latencies"].get(name, [])
+        p50, p95, p99 = np.percentile(np.array(values) * 1000, [50, 95, 99]) if values else (0.0, 0.0, 0.0)
+        routes[name] = {
+            "count": len(values),
+            "errors": result["errors"].get(name, 0),
+            "rejected": result["rejected"].get(name, 0),
+            "p50_ms": round(float(p50), 2),
+            "p95_ms": round(float(p95), 2),
+            "p99_ms": round(float(p99), 2),
+            "rps": round(len(values) / elapsed, 2)
+        }
+
+    total = sum(route["count"] for route in routes.values())
+    all_values = np.concatenate([np.array(values) for values in result["latencies"].values()]) * 1000
+    p50, p95, p99 = np.percentile(all_values, [50, 95, 99])
+    overall = {
+        "count": total,
+        "errors": sum(route["errors"] for route in routes.values()),
+        "rejected": sum(route["rejected"] for route in routes.values()),
+        "p50_ms": round(float(p50), 2),
+        "p95_ms": round(float(p95), 2),
+        "p99_ms": round(float(p99), 2),
+        "rps": round(total / elapsed, 2)
+    }
+    return {"routes": routes, "overall": overall}
+
+
+def combine_summaries(summaries: list[dict]) -> dict:
+    """
+    반복 실행 결과를 합칩니다. 지연/처리량은 실행별 값의 중앙값(한 번 튄 꼬리 지연에 흔들리지 않도록),
+    요청/오류/거절 수는 합계를 사용합니다.
+    """
+    def combine(routes: list[dict]) -> dict:
+        combined = {key: sum(route[key] for route in routes) for key in ("count", "errors", "rejected")}
+        for key in ("p50_ms", "p95_ms", "p99_ms", "rps"):
+            combined[key] = round(float(np.median([route[key] for route in routes])), 2)
+        return combined
+
+    names = sorted({name for summary in summaries for name in summary["routes"]})
+    return {
+        "routes": {
+            name: combine([summary["routes"][name] for summary in summaries if name in summary["routes"]])
+            for name in names
+        },
+        "overall": combine([summary["overall"] for summary in summaries])
+    }
+
+
+def compare_to_baseline(summary: dict, baseline: dict, tolerance: float, slack_ms: float) -> list[str]:
+    """
+    기준값 대비 회귀 목록을 반환합니다 (빈 목록이면 통과).
+    - 오류 응답이 있으면 회귀
+    - p95 > 기준 p95 × tolerance + slack_ms 이면 회귀
+    - 전체 처리량 < 기준 처리량 / tolerance 이면 회귀
+    """
+    regressions = []
+    for name, route in summary["routes"].items():
+        if route["errors"]:
+            regressions.append(f"{name}: 오류 응답 {route['errors']}건")
+        base = baseline["routes"].get(name)
+        if base is None:
+            continue
+        limit = base["p95_ms"] * tolerance + slack_ms
+        if route["p95_ms"] > limit:
+            regressions.append(f"{name}: p95 {route['p95_ms']:.1f}ms > 허용 {limit:.1f}ms (기준 {base['p95_ms']:.1f}ms)")
+
+    base_rps = baseline["overall"]["rps"]
+    if summary["overall"]["rps"] < base_rps / tolerance:
+        regressions.append(f"전체 처리량 {summary['overall']['rps']:.1f} req/s < 허용 {base_rps / tolerance:.1f} req/s")
+    return regressions
+
+
+def routes_without_baseline(summary: dict, baseline: dict) -> list[str]:
+    """
+    기준값이 없어 p95 를 비교하지 못한 경로 목록 (기준값을 다시 기록하기 전까지는 오류 응답만 검사).
+    """
+    return sorted(name for name in summary["routes"] if name not in baseline["routes"])
+
+
+def machine_info() -> dict:
+    """
+    기준값을 기록한 환경. 지연은 CPU/코어 수/파이썬 버전에 따라 달라지므로 비교 전에 확인합니다.
+    """
+    return {
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version()
+    }
+
+
+def print_summary(summary: dict) -> None:
+    header = f"{'route':<32}{'count':>7}{'err':>5}{'503':>5}{'p50':>10}{'p95':>10}{'p99':>10}{'req/s':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, route in [*summary["routes"].items(), ("(overall)", summary["overall"])]:
+        print(
+            f"{name:<32}{route['count']:>7}{route['errors']:>5}{route['rejected']:>5}"
+            f"{route['p50_ms']:>10.1f}{route['p95_ms']:>10.1f}{route['p99_ms']:>10.1f}{route['rps']:>9.1f}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="App.main:app 부하 테스트")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 클라이언트 수")
+    parser.add_argument("--requests", type=int, default=400, help="실행당 측정 요청 수")
+    parser.add_argument("--repeat", type=int, default=1, help="반복 실행 횟수 (경로별 지표는 중앙값 사용)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--schools", type=int, default=300, help="학교급별 가상 학교 수")
+    parser.add_argument("--articles", type=int, default=5000, help="가상 뉴스 기사 수")
+    parser.add_argument("--workdir", default=None, help="픽스처 폴더 (기본: 임시 폴더)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--recorded-on", default=None, help="기준값을 기록한 환경 설명 (--update-baseline 에 필수)")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="p95/처리량 허용 배수")
+    parser.add_argument("--slack-ms", type=float, default=20.0, help="p95 허용 여유 (ms)")
+    args = parser.parse_args(argv)
+    if args.update_baseline and not (args.recorded_on or "").strip():
+        parser.error("--update-baseline 에는 기록 환경을 밝히는 --recorded-on 이 필요합니다 (예: \"4 vCPU CI 러너, 다른 작업 없음\")")
+
+    baseline_path = os.path.abspath(args.baseline)
+    workdir = args.workdir or tempfile.mkdtemp(prefix="edudata_loadtest_")
+    print(f"픽스처 생성: {workdir}")
+    build_fixtures(workdir, schools_per_level=args.schools, n_articles=args.articles, seed=args.seed)
+
+    summaries = []
+    for run in range(args.repeat):
+        result = asyncio.run(run_load(DEFAULT_SCENARIOS, args.requests, args.concurrency, args.seed + run))
+        summaries.append(summarize(result))
+    summary = combine_summaries(summaries)
+    summary["config"] = {
+        "concurrency": args.concurrency, "requests": args.requests, "repeat": args.repeat, "seed": args.seed,
+        "schools": args.schools, "articles": args.articles
+    }
+    summary["machine"] = machine_info()
+    print_summary(summary)
+
+    if args.update_baseline:
+        if summary["overall"]["errors"]:
+            print(f"❌ 오류 응답 {summary['overall']['errors']}건이 있어 기준값을 저장하지 않습니다.")
+            return 1
+        summary["recorded_on"] = args.recorded_on.strip()
+        with open(baseline_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        print(f"✅ 기준값 저장: {baseline_path} ({summary['recorded_on']})")
+        print("   기준값 변경은 기능 변경과 별도 커밋으로 올리고, 커밋 메시지에 기록 환경과 이유를 적으세요.")
+        return 0
+
+    if not os.path.exists(baseline_path):
+        print(f"⚠️ 기준값이 없습니다 ({baseline_path}). --update-baseline 으로 먼저 저장하세요.")
+        return 0
+
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"기준값 기록 환경: {baseline.get('recorded_on', '(설명 없음)')}")
+    if baseline.get("config") != summary["config"]:
+        print(f"⚠️ 기준값과 설정이 다릅니다: {baseline.get('config')}")
+    if baseline.get("machine") != summary["machine"]:
+        print(
+            f"⚠️ 기준값을 기록한 환경과 다릅니다: {baseline.get('machine')} "
+            f"(이 기계에서 --update-baseline 으로 기준값을 다시 만든 뒤 비교하세요)"
+        )
+
+    missing = routes_without_baseline(summary, baseline)
+    if missing:
+        print(f"⚠️ 기준값이 없어 p95 를 비교하지 않은 경로: {', '.join(missing)}")
+
+    regressions = compare_to_baseline(summary, baseline, args.tolerance, args.slack_ms)
+    for regression in regressions:
+        print(f"❌ {regression}")
+    if not regressions:
+        print("✅ 기준값 대비 회귀 없음")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
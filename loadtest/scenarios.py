@@ -0,0 +1,98 @@
+import random
+from dataclasses import dataclass
+from typing import Callable
+
+from loadtest.fixtures import LEVELS, NEWS_CATEGORIES, NEWS_SUBJECTS, OFFICES
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    부하 테스트 요청 한 종류.
+    - weight: 요청 비율 (전체 가중치 대비)
+    - payload: 난수 생성기를 받아 요청 본문을 만드는 함수
+    - ok_status: 정상으로 보는 상태 코드 (503 은 과부하 거절로 따로 집계)
+    """
+    name: str
+    path: str
+    weight: float
+    payload: Callable[[random.Random], dict]
+    ok_status: tuple = (200,)
+
+
+def _priority(rng: random.Random) -> dict:
+    return {
+        "weights": {"비중_부족": rng.uniform(0, 2), "학교당_격차": rng.uniform(0, 2), "미집행": rng.uniform(0, 1)},
+        "top_n": rng.choice([5, 10, 20]),
+        "level": rng.choice([None, *LEVELS])
+    }
+
+
+def _final_table(rng: random.Random) -> dict:
+    return {
+        "table": rng.choice(["school", "office"]),
+        "office": [rng.choice(OFFICES)] if rng.random() < 0.5 else None,
+        "level": [rng.choice(list(LEVELS))] if rng.random() < 0.5 else None,
+        "sort_by": rng.choice(["ATPT_OFCDC_ORG_NM", "연도"]),
+        "limit": rng.choice([100, 500, 1000])
+    }
+
+
+def _region(rng: random.Random) -> dict:
+    level = rng.choice(["시도", "지원청", "시군구"])
+    return {
+        "level": level,
+        "year": rng.choice([2023, 2024]),
+        "flow": rng.choice(["세입", "세출"]),
+        "parent": rng.choice(OFFICES) if level != "시도" else None
+    }
+
+
+def _news_search(rng: random.Random) -> dict:
+    year = rng.choice([2023, 2024])
+    month = rng.randint(1, 12)
+    return {
+        "query": rng.choice(NEWS_SUBJECTS).split()[0],
+        "date_from": f"{year}-{month:02d}-01" if rng.random() < 0.5 else None,
+        "date_to": f"{year}-{month:02d}-28" if rng.random() < 0.5 else None,
+        "category": rng.choice(NEWS_CATEGORIES) if rng.random() < 0.3 else None,
+        "office": rng.choice(OFFICES) if rng.random() < 0.3 else None
+    }
+
+
+def _news_collect(rng: random.Random) -> dict:
+    subject = rng.choice(NEWS_SUBJECTS)
+    articles = [{
+        "id": f"load-{rng.getrandbits(64):x}",
+        "published_at": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T12:00:00",
+        "title": f"{subject} 후속 보도",
+        "content": f"{subject} 관련 후속 기사입니다.",
+        "category": rng.choice(NEWS_CATEGORIES),
+        "keywords": subject.split()
+    } for _ in range(rng.randint(1, 5))]
+    return {"articles": articles}
+
+
+# 데모 사용 패턴을 흉내낸 요청 비율 (조회 위주, 보고서 생성/수집은 가끔)
+DEFAULT_SCENARIOS = [
+    Scenario("report.priority_summary", "/report/priority_summary", 4, _priority),
+    Scenario("report.final_table.json", "/report/final_table_generate", 4, _final_table),
+    Scenario(
+        "report.final_table.csv_gzip", "/report/final_table_generate", 1,
+        lambda rng: {**_final_table(rng), "format": "csv", "compression": "gzip", "limit": None}
+    ),
+    Scenario(
+        "report.yearly", "/report/yearly", 0.5,
+        lambda rng: {"year": rng.choice([2023, 2024]), "span": 3},
+        ok_status=(200, 503)  # CPU 작업 대기열이 차면 503 으로 거절
+    ),
+    Scenario("report.monthly", "/report/monthly", 0.5, lambda rng: {"year": 2024, "month": rng.randint(1, 12)}),
+    Scenario("report.region_summation", "/report/region_summation", 2, _region),
+    Scenario("report.heatmap", "/report/heatmap_generate", 0.5, _region),
+    Scenario("news.search", "/news/search", 4, _news_search),
+    Scenario("news.collect", "/news/collect", 1, _news_collect),
+    Scenario("news.process_monthly", "/news/process_monthly", 0.5, lambda rng: {}),
+    Scenario("news.process_yearly", "/news/process_yearly", 0.25, lambda rng: {"year": 2024}),
+    Scenario("publicdata.result", "/publicdata/result", 1, lambda rng: {}),
+    Scenario("publicdata.scoring", "/publicdata/scoring", 1, lambda rng: {}),
+]
@@ -0,0 +1,33 @@
+import os
+
+import pandas as pd
+
+from utils import arrow_store
+from utils.arrow_store import load_arrow_frame, publish_arrow_table
+
+
+def _versions(store_dir, name="t") -> list[str]:
+    return sorted(f for f in os.listdir(store_dir) if f.startswith(f"{name}.") and f.endswith(".arrow"))
+
+
+def test_locked_old_version_is_pruned_on_later_publish(tmp_path, monkeypatch):
+    store_dir = str(tmp_path)
+    for value in (1, 2):
+        publish_arrow_table(pd.DataFrame({"x": [value]}), "t", store_dir, keep_versions=1, grace_seconds=0)
+    assert len(_versions(store_dir)) == 1
+
+    remove = os.remove
+
+    def locked(path):
+        # Windows 에서 다른 워커가 memory-map 중인 파일을 지우려 할 때와 같은 오류
+        raise PermissionError(13, "The process cannot access the file", path)
+
+    monkeypatch.setattr(arrow_store.os, "remove", locked)
+    publish_arrow_table(pd.DataFrame({"x": [3]}), "t", store_dir, keep_versions=1, grace_seconds=0)
+    assert load_arrow_frame("t", store_dir=store_dir)["x"].tolist() == [3]
+    assert len(_versions(store_dir)) == 2
+
+    monkeypatch.setattr(arrow_store.os, "remove", remove)
+    publish_arrow_table(pd.DataFrame({"x": [4]}), "t", store_dir, keep_versions=1, grace_seconds=0)
+    assert len(_versions(store_dir)) == 1
+    assert load_arrow_frame("t", store_dir=store_dir)["x"].tolist() == [4]
@@ -0,0 +1,133 @@
+import json
+
+import pandas as pd
+import pytest
+
+from utils import delta_ingest
+from utils.arrow_store import load_arrow_frame, publish_arrow_table
+from utils.delta_ingest import diff_school_rows, ingest_payload_delta
+from utils.number_of_school import NUMBER_OF_SCHOOL_TABLE, count_schools_by_attributes
+from utils.table_serving import FINAL_TABLE_NAMES, build_final_tables
+from utils.yearly_trend import TREND_TABLE_NAME, append_year_to_trend_store
+
+FILENAME = "공립_고등_결산_세입_2022.json"
+
+
+def _row(code, office="서울특별시교육청", amt1=100):
+    return {
+        "SCHUL_CODE": code, "SCHUL_NM": f"{code}고", "ATPT_OFCDC_ORG_NM": office,
+        "FOND_SC_CODE": "공립", "AMT1": amt1, "AMT2": 10
+    }
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    folder = "Database/schoolinfo/public"
+    rows = [_row("A"), _row("B", "부산광역시교육청"), _row("C")]
+    ingest_payload_delta({"list": rows}, folder, FILENAME, refresh_aggregates=False)
+    return folder, rows
+
+
+def _codes(path) -> list[str]:
+    return sorted(pd.read_csv(path)["SCHUL_CODE"])
+
+
+def test_diff_detects_insert_update_delete():
+    delta = diff_school_rows([_row("A"), _row("B")], [_row("A", amt1=1), _row("C")])
+    assert [r["SCHUL_CODE"] for r in delta["insert"]] == ["C"]
+    assert [r["SCHUL_CODE"] for r in delta["update"]] == ["A"]
+    assert [r["SCHUL_CODE"] for r in delta["delete"]] == ["B"]
+
+
+def test_delta_reaches_every_csv_and_office_file(store):
+    folder, rows = store
+    new_rows = [_row("A", amt1=999), _row("B", "서울특별시교육청"), _row("D", "부산광역시교육청")]
+    result = ingest_payload_delta({"list": new_rows}, folder, FILENAME, refresh_aggregates=False)
+
+    assert result["counts"] == {"insert": 1, "update": 2, "delete": 1}
+    base = "Database/schoolinfo"
+    assert _codes(f"{base}/public_csv/공립_고등_결산_세입_2022.csv") == ["A", "B", "D"]
+    assert _codes(f"{base}/combined_csv/고등_결산_세입_2022.csv") == ["A", "B", "D"]
+    # 교육청이 바뀐 B 는 이전 교육청 파일에서 빠지고 새 교육청 파일로 이동
+    assert _codes(f"{base}/combined_filtered/서울특별시교육청/서울특별시교육청_고등_결산_세입_2022.csv") == ["A", "B"]
+    assert _codes(f"{base}/combined_filtered/부산광역시교육청/부산광역시교육청_고등_결산_세입_2022.csv") == ["D"]
+    summary = pd.read_csv(f"{base}/summary/combined_summary/부산광역시교육청/combined_결산_세입_요약.csv")
+    assert summary["학교 수"].iloc[0] == 1
+
+    with open(f"{folder}/{FILENAME}", encoding="utf-8") as f:
+        assert json.load(f)["list"] == new_rows
+    with open(delta_ingest.CHANGELOG_PATH, encoding="utf-8") as f:
+        assert len(f.readlines()) == 3 + 4
+
+
+def test_failed_derived_write_keeps_previous_snapshot(store, monkeypatch):
+    folder, rows = store
+    apply_delta = delta_ingest._apply_delta_to_csv
+
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(delta_ingest, "_apply_delta_to_csv", fail)
+    with pytest.raises(OSError):
+        ingest_payload_delta({"list": rows[:1]}, folder, FILENAME)
+
+    with open(f"{folder}/{FILENAME}", encoding="utf-8") as f:
+        assert json.load(f)["list"] == rows
+    monkeypatch.setattr(delta_ingest, "_apply_delta_to_csv", apply_delta)
+    # 다음 수집 때 같은 변경분이 다시 감지됨
+    assert ingest_payload_delta({"list": rows[:1]}, folder, FILENAME, refresh_aggregates=False)["counts"]["delete"] == 2
+
+
+def test_published_final_table_partition_is_replaced(store):
+    folder, rows = store
+    build_final_tables("Database/schoolinfo/combined_csv")
+
+    ingest_payload_delta({"list": [_row("A", amt1=5), rows[1]]}, folder, FILENAME)
+
+    school = load_arrow_frame(FINAL_TABLE_NAMES["school"])
+    assert sorted(school["SCHUL_CODE"]) == ["A", "B"]
+    assert school.set_index("SCHUL_CODE").loc["A", "정부이전수입"] == 5
+    office = load_arrow_frame(FINAL_TABLE_NAMES["office"]).set_index("ATPT_OFCDC_ORG_NM")
+    assert office.loc["서울특별시교육청", "학교 수"] == 1
+
+
+def test_numeric_school_codes_are_replaced_not_duplicated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    folder = "Database/schoolinfo/public"
+    ingest_payload_delta({"list": [_row("7010057"), _row("7010058")]}, folder, FILENAME, refresh_aggregates=False)
+    ingest_payload_delta({"list": [_row("7010057", amt1=5), _row("7010058")]}, folder, FILENAME, refresh_aggregates=False)
+
+    combined = pd.read_csv("Database/schoolinfo/combined_csv/고등_결산_세입_2022.csv", dtype={"SCHUL_CODE": str})
+    assert sorted(combined["SCHUL_CODE"]) == ["7010057", "7010058"]
+    assert combined.set_index("SCHUL_CODE").loc["7010057", "AMT1"] == 5
+
+
+def _sorted(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.astype({column: str for column in df.columns if df[column].dtype == object}).fillna(0)
+    return df.sort_values(list(df.columns)).reset_index(drop=True)
+
+
+def test_office_partition_refresh_matches_full_rebuild(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    folder, filename = "Database/schoolinfo/public", "공립_고등_결산_세입_2024.json"
+    combined_folder = "Database/schoolinfo/combined_csv"
+    rows = [_row("A"), _row("B", "부산광역시교육청"), _row("C", "대구광역시교육청")]
+    ingest_payload_delta({"list": rows}, folder, filename, refresh_aggregates=False)
+    build_final_tables(combined_folder)
+    append_year_to_trend_store(combined_folder, 2024)
+    publish_arrow_table(count_schools_by_attributes(combined_folder), NUMBER_OF_SCHOOL_TABLE)
+
+    ingest_payload_delta({"list": [_row("A", amt1=7), rows[1], _row("D")]}, folder, filename)
+
+    refreshed = {
+        name: load_arrow_frame(name)
+        for name in [*FINAL_TABLE_NAMES.values(), TREND_TABLE_NAME, NUMBER_OF_SCHOOL_TABLE]
+    }
+    build_final_tables(combined_folder)
+    append_year_to_trend_store(combined_folder, 2024)
+    publish_arrow_table(count_schools_by_attributes(combined_folder), NUMBER_OF_SCHOOL_TABLE)
+
+    for name, frame in refreshed.items():
+        rebuilt = load_arrow_frame(name)
+        pd.testing.assert_frame_equal(_sorted(frame[rebuilt.columns]), _sorted(rebuilt), check_dtype=False, obj=name)
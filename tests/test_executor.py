@@ -0,0 +1,49 @@
+import asyncio
+
+from App.executor import RENDER_DELAY, _PriorityGate
+
+
+def test_waiting_requests_run_before_renders():
+    async def scenario():
+        gate = _PriorityGate(workers=1, capacity=4)
+        order = []
+
+        async def job(name, delay):
+            await gate.acquire(delay)
+            order.append(name)
+            await asyncio.sleep(0)
+            gate.release()
+
+        await gate.acquire()
+        tasks = [
+            asyncio.ensure_future(job("render", RENDER_DELAY)),
+            asyncio.ensure_future(job("request_1", 0.0)),
+            asyncio.ensure_future(job("request_2", 0.0)),
+        ]
+        await asyncio.sleep(0)
+        assert gate.full()
+        gate.release()
+        await asyncio.gather(*tasks)
+        return order, gate
+
+    order, gate = asyncio.run(scenario())
+    assert order == ["request_1", "request_2", "render"]
+    assert not gate.full()
+
+
+def test_cancelled_waiter_does_not_leak_slot():
+    async def scenario():
+        gate = _PriorityGate(workers=1, capacity=2)
+        await gate.acquire()
+        waiter = asyncio.ensure_future(gate.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        gate.release()
+        # 취소된 대기자 자리가 남지 않아 다음 작업이 바로 실행됨
+        await asyncio.wait_for(gate.acquire(), timeout=1)
+        gate.release()
+        return gate
+
+    gate = asyncio.run(scenario())
+    assert gate._running == 0 and gate._waiting == 0
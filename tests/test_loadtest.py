@@ -0,0 +1,59 @@
+import pytest
+
+from loadtest import run
+from loadtest.run import compare_to_baseline, routes_without_baseline
+
+
+def _summary(routes: dict, rps: float = 10.0) -> dict:
+    return {
+        "routes": {
+            name: {"count": 10, "errors": errors, "rejected": 0, "p50_ms": p95 / 2, "p95_ms": p95, "p99_ms": p95, "rps": 1.0}
+            for name, (p95, errors) in routes.items()
+        },
+        "overall": {"count": 10 * len(routes), "errors": 0, "rejected": 0, "p50_ms": 0, "p95_ms": 0, "p99_ms": 0, "rps": rps}
+    }
+
+
+BASELINE = _summary({"report.yearly": (100.0, 0), "news.search": (10.0, 0)})
+
+
+def test_p95_within_tolerance_and_slack_passes():
+    # 허용 한도 = 기준 p95 × 1.5 + 20ms
+    current = _summary({"report.yearly": (170.0, 0), "news.search": (35.0, 0)})
+    assert compare_to_baseline(current, BASELINE, tolerance=1.5, slack_ms=20.0) == []
+
+
+def test_p95_over_limit_is_regression():
+    current = _summary({"report.yearly": (170.1, 0), "news.search": (35.0, 0)})
+    regressions = compare_to_baseline(current, BASELINE, tolerance=1.5, slack_ms=20.0)
+    assert len(regressions) == 1
+    assert regressions[0].startswith("report.yearly: p95 170.1ms > 허용 170.0ms")
+
+
+def test_error_responses_and_throughput_are_regressions():
+    current = _summary({"report.yearly": (50.0, 2), "news.search": (5.0, 0)}, rps=6.0)
+    regressions = compare_to_baseline(current, BASELINE, tolerance=1.5, slack_ms=20.0)
+    assert regressions == [
+        "report.yearly: 오류 응답 2건",
+        "전체 처리량 6.0 req/s < 허용 6.7 req/s",
+    ]
+
+
+def test_route_without_baseline_only_checks_errors():
+    current = _summary({"report.yearly": (100.0, 0), "report.heatmap": (9999.0, 0)})
+    assert compare_to_baseline(current, BASELINE, tolerance=1.5, slack_ms=20.0) == []
+    assert routes_without_baseline(current, BASELINE) == ["report.heatmap"]
+
+    current["routes"]["report.heatmap"]["errors"] = 1
+    assert compare_to_baseline(current, BASELINE, tolerance=1.5, slack_ms=20.0) == ["report.heatmap: 오류 응답 1건"]
+
+
+@pytest.mark.parametrize("argv", [["--update-baseline"], ["--update-baseline", "--recorded-on", " "]])
+def test_update_baseline_requires_recorded_environment(argv, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("기록 환경 없이 부하 테스트를 실행하면 안 됨")
+
+    monkeypatch.setattr(run, "build_fixtures", fail)
+    with pytest.raises(SystemExit) as exc:
+        run.main(argv)
+    assert exc.value.code == 2
@@ -0,0 +1,60 @@
+import itertools
+import random
+from collections import Counter
+
+import pytest
+
+from API.news import news_collect
+from API.news.news_keywords import (
+    merge_topk_sketches, new_topk_sketch, topk_from_sketch, topk_sketch_from_counts, update_topk_sketch
+)
+
+
+def _bounds_hold(sketch: dict, truth: Counter) -> bool:
+    return all(count - error <= truth[keyword] <= count for keyword, (count, error) in sketch["counters"].items())
+
+
+def test_exact_counts_keep_true_top_keywords():
+    sketch = topk_sketch_from_counts(Counter({"x": 10, "y": 9, "z": 1}), k=2)
+    assert sketch["counters"] == {"x": [10, 0], "y": [9, 0]}
+
+
+def test_stream_sketch_bounds_true_counts():
+    rng = random.Random(0)
+    stream = [f"k{min(int(rng.expovariate(0.3)), 30)}" for _ in range(2000)]
+    sketch = update_topk_sketch(new_topk_sketch(8), stream)
+    truth = Counter(stream)
+    assert len(sketch["counters"]) == 8
+    assert _bounds_hold(sketch, truth)
+    assert topk_from_sketch(sketch, 1)[0][0] == truth.most_common(1)[0][0]
+
+
+def test_merge_is_order_independent_and_bounded():
+    months = [
+        Counter({"급식": 30, "돌봄": 12, "사교육": 5, "학폭": 4}),
+        Counter({"돌봄": 20, "학폭": 18, "늘봄": 3}),
+        Counter({"급식": 7, "늘봄": 15, "사교육": 14, "교권": 2}),
+    ]
+    sketches = [topk_sketch_from_counts(counts, k=2) for counts in months]
+    truth = sum(months, Counter())
+
+    results = [merge_topk_sketches(list(order)) for order in itertools.permutations(sketches)]
+    assert all(result == results[0] for result in results)
+    assert _bounds_hold(results[0], truth)
+
+
+@pytest.mark.parametrize("published_at", ["2025-04-03T09:00:00", "2025-04-30"])
+def test_month_key_parses_dates(published_at):
+    assert news_collect.month_key_of(published_at) == "2025-04"
+
+
+def test_month_key_rejects_non_dates():
+    with pytest.raises(ValueError):
+        news_collect.month_key_of("../../etc/x")
+
+
+def test_list_month_keys_skips_foreign_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(news_collect, "ARTICLE_DIR", str(tmp_path))
+    for name in ["2025-04.jsonl", "2025-13.jsonl", "backup.jsonl", "2025-05.jsonl.bak", ".2025-04.lock"]:
+        (tmp_path / name).write_text("")
+    assert news_collect.list_month_keys() == ["2025-04"]
@@ -0,0 +1,75 @@
+import sqlite3
+
+import pytest
+
+from API.news.news_search import _bigram_text, index_articles, search_articles
+
+
+def _article(article_id, title, content="", keywords=None, published_at="2025-03-01"):
+    return {
+        "id": article_id, "published_at": published_at, "category": "급식", "office": "서울특별시교육청",
+        "title": title, "content": content, "keywords": keywords or [], "url": None
+    }
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "news_index.sqlite")
+
+
+def _ids(hits) -> list[str]:
+    return [hit["id"] for hit in hits]
+
+
+def test_bigram_text_splits_words_into_two_grams():
+    assert _bigram_text("급식비 인상, AI") == "급식 식비 비 인상 상 ai i"
+    assert _bigram_text(None) == ""
+
+
+def test_short_terms_use_bigram_index(db_path):
+    index_articles([
+        _article("1", "급식비 인상", "학교 급식 예산"),
+        _article("2", "교사 연수", "연수 일정"),
+        _article("3", "AI 교과서", "디지털 교육"),
+    ], db_path)
+
+    assert _ids(search_articles("급식", db_path=db_path)) == ["1"]
+    assert _ids(search_articles("ai", db_path=db_path)) == ["3"]
+    # 한 글자 검색어는 단어 중간/끝 글자도 찾음
+    assert sorted(_ids(search_articles("수", db_path=db_path))) == ["2"]
+    assert sorted(_ids(search_articles("비", db_path=db_path))) == ["1"]
+    # 긴 검색어(trigram)와 짧은 검색어(2-gram)를 함께 쓰면 모두 포함하는 기사만
+    assert _ids(search_articles("교과서 ai", db_path=db_path)) == ["3"]
+    assert search_articles("연수 ai", db_path=db_path) == []
+    with pytest.raises(ValueError):
+        search_articles("?!", db_path=db_path)
+
+
+def test_short_terms_are_ranked_by_bm25(db_path):
+    index_articles([
+        _article("body", "교육청 소식", "이번 학기 급식 운영 안내"),
+        _article("title", "급식 급식 점검", "학교 위생 점검"),
+        _article("other", "교사 연수", "연수 일정"),
+    ], db_path)
+
+    # 제목 가중치가 높으므로 제목에 검색어가 있는 기사가 먼저
+    assert _ids(search_articles("급식", db_path=db_path)) == ["title", "body"]
+
+
+def test_bigram_index_is_updated_incrementally(db_path):
+    assert index_articles([_article("1", "급식비 인상")], db_path) == 1
+    assert index_articles([_article("1", "급식비 인상"), _article("2", "급식 점검")], db_path) == 1
+
+    assert sorted(_ids(search_articles("급식", db_path=db_path))) == ["1", "2"]
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT count(*) FROM articles_bigram").fetchone()[0] == 2
+
+
+def test_existing_index_without_bigram_table_is_backfilled(db_path):
+    index_articles([_article("1", "급식비 인상"), _article("2", "교사 연수")], db_path)
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DROP TABLE articles_bigram")
+
+    assert _ids(search_articles("연수", db_path=db_path)) == ["2"]
+    index_articles([_article("3", "연수 일정")], db_path)
+    assert sorted(_ids(search_articles("연수", db_path=db_path))) == ["2", "3"]
@@ -0,0 +1,60 @@
+import pandas as pd
+import pytest
+
+from utils.priority_ranking import _build_features, rank_features
+
+YEAR = 2024
+
+
+def _store() -> pd.DataFrame:
+    # (교육청, 학교급, 예산, 결산, 학교 수): 학교당 결산 A 10, B 20, C 30 (전국 20)
+    offices = [
+        ("A교육청", "초등", 100, 100, 10),
+        ("B교육청", "초등", 400, 200, 10),
+        ("C교육청", "초등", 330, 300, 10),
+        ("D교육청", "중등", 100, 50, 5),
+    ]
+    return pd.DataFrame([
+        {
+            "연도": YEAR, "ATPT_OFCDC_ORG_NM": office, "학교급": level, "FOND_SC_CODE": "국공립",
+            "세입세출": "세출", "항목": "인적자원_운용", "예결산": budget_type, "합계": amount, "학교 수": schools
+        }
+        for office, level, budget, settlement, schools in offices
+        for budget_type, amount in [("예산", budget), ("결산", settlement)]
+    ])
+
+
+@pytest.fixture
+def features():
+    return _build_features(_store(), YEAR)
+
+
+def test_per_school_gap_uses_school_counts(features):
+    result = rank_features(YEAR, features, top_n=4).set_index("ATPT_OFCDC_ORG_NM")
+    assert result.loc["A교육청", "학교당_격차"] == pytest.approx(0.5)
+    assert result.loc["B교육청", "학교당_격차"] == pytest.approx(0.0)
+    assert result.loc["C교육청", "학교당_격차"] == pytest.approx(-0.5)
+    assert result.loc["B교육청", "미집행"] == pytest.approx(0.5)
+
+
+def test_weights_change_the_order(features):
+    gap_only = rank_features(YEAR, features, {"비중_부족": 0, "학교당_격차": 1, "미집행": 0}, top_n=3, level="초등")
+    assert list(gap_only["ATPT_OFCDC_ORG_NM"]) == ["A교육청", "B교육청", "C교육청"]
+    unspent_only = rank_features(YEAR, features, {"비중_부족": 0, "학교당_격차": 0, "미집행": 1}, top_n=3, level="초등")
+    assert list(unspent_only["ATPT_OFCDC_ORG_NM"]) == ["B교육청", "C교육청", "A교육청"]
+    assert list(unspent_only["순위"]) == [1, 2, 3]
+    assert unspent_only["점수"].is_monotonic_decreasing
+
+
+def test_top_n_and_level_filter(features):
+    assert len(rank_features(YEAR, features, top_n=2)) == 2
+    middle = rank_features(YEAR, features, top_n=10, level="중등")
+    assert list(middle["ATPT_OFCDC_ORG_NM"]) == ["D교육청"]
+    assert rank_features(YEAR, features, level="고등").empty
+
+
+def test_unknown_weight_is_rejected(features):
+    with pytest.raises(ValueError):
+        rank_features(YEAR, features, {"1인당_격차": 1.0})
+    with pytest.raises(ValueError):
+        rank_features(YEAR, features, top_n=0)
@@ -0,0 +1,21 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from utils import process_pool
+
+
+def test_broken_pool_is_replaced_once():
+    pool = process_pool.get_process_pool()
+    try:
+        with pytest.raises(BrokenProcessPool):
+            pool.submit(os._exit, 1).result()
+
+        replacement = process_pool.replace_broken_pool(pool)
+        assert replacement is not pool
+        # 같은 고장을 늦게 알린 요청은 이미 교체된 풀을 그대로 받음
+        assert process_pool.replace_broken_pool(pool) is replacement
+        assert replacement.submit(abs, -3).result() == 3
+    finally:
+        process_pool.shutdown_process_pool()
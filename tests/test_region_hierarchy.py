@@ -0,0 +1,82 @@
+import json
+
+import pandas as pd
+import pytest
+
+from loadtest.fixtures import generate_budget_csvs
+from utils.add_region_info import extract_region_hierarchy_mapping
+from utils.region_hierarchy import build_region_hierarchy, query_region_level, region_heatmap_matrix
+
+# (학교 번호, 시도교육청, 교육지원청, 법정동 코드, 주소)
+SCHOOLS = [
+    (0, "경기도교육청", "경기도수원교육지원청", "4111110100", "경기도 수원시 장안구 파장동"),
+    (1, "경기도교육청", "경기도수원교육지원청", "4111310100", "경기도 수원시 권선구 세류동"),
+    (2, "경기도교육청", "경기도성남교육지원청", "4113110100", "경기도 성남시 수정구 신흥동"),
+    (3, "세종특별자치시교육청", "", "3611025000", "세종특별자치시 조치원읍 신흥리"),
+    (4, "세종특별자치시교육청", "", "3611011000", "세종특별자치시 한솔동"),
+]
+
+
+@pytest.fixture
+def hierarchy(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    csv_folder = "Database/schoolinfo/combined_csv"
+    generate_budget_csvs(csv_folder, [2024], schools_per_level=len(SCHOOLS))
+
+    (tmp_path / "public").mkdir()
+    rows = [
+        {
+            "SCHUL_CODE": f"{level}{i:06d}", "SCHUL_NM": f"테스트{i}", "ATPT_OFCDC_ORG_NM": office,
+            "JU_ORG_NM": support, "ADRCD_CD": code, "ADRCD_NM": address
+        }
+        for level in ["초등", "중등", "고등"] for i, office, support, code, address in SCHOOLS
+    ]
+    (tmp_path / "public" / "schools.json").write_text(json.dumps({"list": rows}, ensure_ascii=False), encoding="utf-8")
+
+    mapping = extract_region_hierarchy_mapping([str(tmp_path / "public")])
+    # 예결산 CSV 의 시도교육청을 매핑과 맞춤 (생성기는 시도를 무작위로 고름)
+    offices = {i: office for i, office, *_ in SCHOOLS}
+    for path in (tmp_path / csv_folder).iterdir():
+        df = pd.read_csv(path, dtype={"SCHUL_CODE": str})
+        df["ATPT_OFCDC_ORG_NM"] = df["SCHUL_CODE"].str[2:].astype(int).map(offices)
+        df.to_csv(path, index=False, encoding="utf-8-sig")
+    return mapping, build_region_hierarchy(csv_folder)
+
+
+def test_gu_codes_roll_up_to_city_and_sejong_stays_whole(hierarchy):
+    mapping, _ = hierarchy
+    sigungu = mapping.drop_duplicates("SIGUNGU_CD").set_index("SIGUNGU_CD")["SIGUNGU_NM"].to_dict()
+    assert sigungu == {"41110": "경기도 수원시", "41130": "경기도 성남시", "36110": "세종특별자치시"}
+    assert set(mapping.loc[mapping["ATPT_OFCDC_ORG_NM"] == "세종특별자치시교육청", "JU_ORG_NM"]) == {"세종특별자치시교육청"}
+
+
+def test_levels_roll_up_to_the_same_totals(hierarchy):
+    school = query_region_level("학교", 2024)
+    totals = {
+        level: query_region_level(level, 2024).groupby("항목")["합계"].sum()
+        for level in ["전국", "시도", "지원청", "시군구"]
+    }
+    expected = school.groupby("항목")["합계"].sum()
+    for level, total in totals.items():
+        assert total.to_dict() == pytest.approx(expected.to_dict()), level
+
+    sigungu = query_region_level("시군구", 2024)
+    assert sorted(sigungu["지역"].unique()) == ["경기도 성남시", "경기도 수원시", "세종특별자치시"]
+    assert sigungu.groupby("지역")["학교 수"].first().to_dict() == {"경기도 성남시": 3, "경기도 수원시": 6, "세종특별자치시": 6}
+
+
+def test_heatmap_averages_per_school_values(hierarchy):
+    sigungu = query_region_level("시군구", 2024)
+    matrix = region_heatmap_matrix("시군구", 2024, "학교당 평균")
+    assert matrix.index.is_unique
+    suwon = sigungu[sigungu["지역"] == "경기도 수원시"].set_index("항목")
+    assert matrix.loc["경기도 수원시"].to_dict() == pytest.approx((suwon["합계"] / suwon["학교 수"]).to_dict())
+
+    shares = region_heatmap_matrix("시군구", 2024, "비중")
+    assert shares.sum(axis=1).tolist() == pytest.approx([1.0] * len(shares))
+
+
+def test_heatmap_rejects_too_many_rows(hierarchy):
+    with pytest.raises(ValueError):
+        region_heatmap_matrix("학교", 2024, max_rows=10)
+    assert len(region_heatmap_matrix("학교", 2024, max_rows=10, parent="경기도수원교육지원청")) == 6
@@ -0,0 +1,49 @@
+import os
+import time
+
+from utils import report_builder
+from utils.report_builder import ARTIFACT_DIR, ReportSection, build_report, prune_artifacts
+
+SECTIONS = [ReportSection("summary", "text", "요약", {"text": "첫 줄\n둘째 줄"})]
+
+
+def _age(path, seconds):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_prune_removes_only_stale_artifacts(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs(ARTIFACT_DIR)
+    stale = os.path.join(ARTIFACT_DIR, "old.png")
+    leftover = os.path.join(ARTIFACT_DIR, ".old.png.tmp")
+    fresh = os.path.join(ARTIFACT_DIR, "new.png")
+    for path in (stale, leftover, fresh):
+        with open(path, "wb") as f:
+            f.write(b"x")
+    _age(stale, 8 * 24 * 3600)
+    _age(leftover, 8 * 24 * 3600)
+
+    assert prune_artifacts() == 2
+    assert os.listdir(ARTIFACT_DIR) == ["new.png"]
+
+
+def test_reused_artifact_is_kept_and_report_prunes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(report_builder, "_last_prune", 0.0)
+    first = build_report("보고서", SECTIONS, "first")
+    [artifact] = os.listdir(ARTIFACT_DIR)
+    path = os.path.join(ARTIFACT_DIR, artifact)
+    _age(path, 30 * 24 * 3600)
+
+    # 재사용하면 마지막 사용 시각이 갱신되어 정리 대상에서 빠짐
+    second = build_report("보고서", SECTIONS, "second")
+    assert first["sections"]["summary"] == {"reused": False}
+    assert second["sections"]["summary"] == {"reused": True}
+    assert prune_artifacts() == 0
+
+    # 더 이상 쓰이지 않는 산출물은 다음 보고서 생성 때 정리
+    _age(path, 30 * 24 * 3600)
+    monkeypatch.setattr(report_builder, "_last_prune", 0.0)
+    build_report("보고서", [ReportSection("summary", "text", "요약", {"text": "바뀐 내용"})], "third")
+    assert not os.path.exists(path)
@@ -0,0 +1,92 @@
+import gzip
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from utils.arrow_store import publish_arrow_table
+from utils.table_serving import (
+    FINAL_TABLE_NAMES, encode_cursor, iter_csv_bytes, query_final_table, take_batches
+)
+
+
+@pytest.fixture
+def school_table(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    df = pd.DataFrame({
+        "SCHUL_CODE": [f"S{i:03d}" for i in range(25)],
+        "ATPT_OFCDC_ORG_NM": ["서울특별시교육청", "부산광역시교육청"] * 12 + ["서울특별시교육청"],
+        "학교급": ["초등", "중등", "고등", "초등", "중등"] * 5,
+        "연도": [2023, 2024] * 12 + [2024],
+        "인적자원_운용": [float(i % 7) for i in range(25)],
+    })
+    version = publish_arrow_table(df, FINAL_TABLE_NAMES["school"])
+    return df, version
+
+
+def _collect(table, page) -> list[str]:
+    return table.take(page).column("SCHUL_CODE").to_pylist()
+
+
+def test_cursor_pages_cover_sorted_result_exactly_once(school_table):
+    df, _ = school_table
+    seen, cursor = [], None
+    while True:
+        table, page, cursor, total = query_final_table(
+            filters={"year": [2024]}, sort_by="인적자원_운용", descending=True, cursor=cursor, limit=4
+        )
+        assert len(page) <= 4
+        seen += _collect(table, page)
+        if cursor is None:
+            break
+
+    expected = df[df["연도"] == 2024].sort_values(
+        ["인적자원_운용", "SCHUL_CODE"], ascending=[False, True]
+    )["SCHUL_CODE"].tolist()
+    assert total == len(expected)
+    assert seen == expected
+
+
+def test_cursor_expires_when_table_is_republished(school_table):
+    df, _ = school_table
+    _, _, cursor, _ = query_final_table(limit=5)
+    publish_arrow_table(df, FINAL_TABLE_NAMES["school"])
+    with pytest.raises(ValueError, match="만료"):
+        query_final_table(cursor=cursor, limit=5)
+
+
+@pytest.mark.parametrize("limit", [0, -3])
+def test_non_positive_limit_is_rejected(school_table, limit):
+    with pytest.raises(ValueError):
+        query_final_table(limit=limit)
+
+
+def test_negative_cursor_offset_is_rejected(school_table):
+    _, version = school_table
+    with pytest.raises(ValueError, match="cursor"):
+        query_final_table(cursor=encode_cursor(version, -10), limit=5)
+
+
+def test_filter_type_mismatch_is_value_error(school_table):
+    with pytest.raises(ValueError):
+        query_final_table(filters={"office": [123]})
+    with pytest.raises(ValueError):
+        query_final_table(sort_by="없는_컬럼")
+
+
+def test_empty_result_still_writes_csv_header(school_table):
+    table, page, cursor, total = query_final_table(filters={"office": ["없는교육청"]})
+    assert (len(page), cursor, total) == (0, None, 0)
+
+    body = b"".join(iter_csv_bytes(take_batches(table, page), table.schema, compression="gzip"))
+    text = gzip.decompress(body).decode("utf-8-sig")
+    assert text.splitlines() == ['"SCHUL_CODE","ATPT_OFCDC_ORG_NM","학교급","연도","인적자원_운용"']
+
+
+def test_take_batches_streams_in_requested_order(school_table):
+    table, page, _, _ = query_final_table(sort_by="SCHUL_CODE", descending=True, limit=None)
+    batches = list(take_batches(table, page, batch_size=10))
+    assert [batch.num_rows for batch in batches] == [10, 10, 5]
+    assert pa.Table.from_batches(batches).column("SCHUL_CODE").to_pylist() == sorted(
+        table.column("SCHUL_CODE").to_pylist(), reverse=True
+    )
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from utils.schema_registry import PER_HEAD_COLUMN
+from utils.weighted_stats import grouped_weighted_stats, summary_records
+
+
+def test_median_interpolates_between_middle_values():
+    stats = grouped_weighted_stats([1.0, 3.0], [0, 0])
+    assert stats["quantiles"][0.5][0, 0] == pytest.approx(2.0)
+
+
+def test_weighted_median_moves_toward_heavier_value():
+    stats = grouped_weighted_stats([1.0, 3.0], [0, 0], weights=[1.0, 3.0])
+    assert stats["quantiles"][0.5][0, 0] == pytest.approx(2.5)
+
+
+def test_equal_weights_match_numpy_hazen_quantiles_per_group():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=300)
+    groups = rng.integers(0, 4, size=300)
+    quantiles = (0.1, 0.25, 0.5, 0.75, 0.9)
+
+    stats = grouped_weighted_stats(values, groups, n_groups=4, quantiles=quantiles)
+
+    for g in range(4):
+        expected = np.quantile(values[groups == g], quantiles, method="hazen")
+        actual = [stats["quantiles"][q][g, 0] for q in quantiles]
+        assert actual == pytest.approx(expected)
+
+
+def test_outer_quantiles_clamp_to_group_extremes():
+    stats = grouped_weighted_stats([5.0, 1.0, 10.0, 20.0], [0, 0, 1, 1], quantiles=(0.1, 0.9))
+    assert stats["quantiles"][0.1][:, 0].tolist() == [1.0, 10.0]
+    assert stats["quantiles"][0.9][:, 0].tolist() == [5.0, 20.0]
+
+
+def test_nan_and_zero_weight_rows_are_excluded():
+    stats = grouped_weighted_stats([1.0, np.nan, 100.0, 3.0], [0, 0, 0, 0], weights=[1.0, 1.0, 0.0, 1.0])
+    assert stats["count"][0, 0] == 2
+    assert stats["mean"][0, 0] == pytest.approx(2.0)
+    assert stats["var"][0, 0] == pytest.approx(1.0)
+    assert stats["quantiles"][0.5][0, 0] == pytest.approx(2.0)
+
+
+def test_empty_group_stays_nan():
+    stats = grouped_weighted_stats([1.0, 2.0], [0, 0], n_groups=2)
+    assert np.isnan(stats["mean"][1, 0])
+    assert np.isnan(stats["quantiles"][0.5][1, 0])
+
+
+def test_summary_records_column_order():
+    stats = grouped_weighted_stats([[1.0, 100.0, 10.0], [3.0, 300.0, 30.0]], [0, 0])
+    records = summary_records(
+        ["a.csv"], ["고등"], stats, ["x", "y", PER_HEAD_COLUMN], dispersion_column=PER_HEAD_COLUMN, include_total=True
+    )
+    assert list(records[0]) == [
+        "파일명", "x", "y", PER_HEAD_COLUMN, "평균합계",
+        f"{PER_HEAD_COLUMN}_중앙값", f"{PER_HEAD_COLUMN}_IQR", f"{PER_HEAD_COLUMN}_p90/p10", "학교급", "학교 수"
+    ]
+    # 1인당 평균 세출은 합산할 수 없으므로 평균합계 = x 평균 + y 평균
+    assert records[0]["평균합계"] == pytest.approx(2.0 + 200.0)
+    assert records[0][f"{PER_HEAD_COLUMN}_중앙값"] == pytest.approx(20.0)
+    assert records[0]["학교 수"] == 2
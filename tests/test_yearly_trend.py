@@ -0,0 +1,38 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.yearly_trend import compute_trend_metrics
+
+
+def _trend(rows: list[tuple[int, str, float]]) -> pd.DataFrame:
+    return pd.DataFrame([
+        {
+            "ATPT_OFCDC_ORG_NM": "서울특별시교육청", "학교급": "초등", "FOND_SC_CODE": "공립", "세입세출": "세출",
+            "항목": "인적자원_운용", "연도": year, "예결산": budget_type, "합계": amount
+        }
+        for year, budget_type, amount in rows
+    ])
+
+
+def test_zero_budget_year_yields_nan_not_inf():
+    trend = _trend([
+        (2022, "예산", 0.0), (2022, "결산", 0.0),
+        (2023, "예산", 0.0), (2023, "결산", 50.0),
+        (2024, "예산", 100.0), (2024, "결산", 80.0),
+    ])
+    result = compute_trend_metrics(trend).set_index("연도")
+
+    numeric = result.select_dtypes("number").to_numpy(dtype=float)
+    assert not np.isinf(numeric).any()
+    assert np.isnan(result.loc[2023, "예산_전년대비"])
+    assert np.isnan(result.loc[2024, "예산_전년대비"])
+    assert np.isnan(result.loc[2023, "집행률"])
+    assert result.loc[2024, "결산_전년대비"] == pytest.approx(0.6)
+    assert result.loc[2024, "집행률"] == pytest.approx(0.8)
+
+    # /report/yearly 처럼 NaN 을 None 으로 바꾸면 엄격한 JSON 으로 직렬화되어야 함
+    records = result.reset_index().astype(object).where(result.reset_index().notna(), None).to_dict(orient="records")
+    json.dumps(records, allow_nan=False)
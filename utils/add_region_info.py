@@ -1,6 +1,23 @@
+import os
 import json
 import pandas as pd
 
+REGION_HIERARCHY_MAPPING_PATH = "Database/etc/school_region_hierarchy.csv"
+
+# 학교알리미 응답의 관할 교육지원청 / 주소(법정동) 필드
+SUPPORT_OFFICE_COLUMN = "JU_ORG_NM"
+ADDRESS_CODE_COLUMN = "ADRCD_CD"
+ADDRESS_NAME_COLUMN = "ADRCD_NM"
+
+# 매핑 표에 추가되는 시군구 컬럼 (법정동 코드 앞 5자리, 시도 + 시군구 이름)
+SIGUNGU_CODE_COLUMN = "SIGUNGU_CD"
+SIGUNGU_NAME_COLUMN = "SIGUNGU_NM"
+
+# 세종은 시군구가 없는 단층 자치단체 (법정동 코드 36110, 주소 둘째 단어는 읍/면/동)
+SEJONG_SIDO_CODE = "36"
+
+UNKNOWN_REGION = "미상"
+
 def extract_school_org_mapping_from_json(json_path: str, output_csv_path: str) -> None:
     """
     JSON 파일에서 학교 코드와 교육청 정보를 추출하여 CSV로 저장합니다.
@@ -40,6 +57,68 @@ def fill_org_info_by_school_code(input_csv_path: str, mapping_csv_path: str, out
     df_merged.to_csv(output_csv_path, index=False, encoding="utf-8-sig")
     print(f"✅ 교육청 정보 병합 완료: {output_csv_path}")
 
+def _sigungu_code_and_name(address_code: pd.Series, address_name: pd.Series) -> tuple[pd.Series, pd.Series]:
+    """
+    법정동 코드/주소에서 같은 단위(시/군/자치구)의 시군구 코드와 이름을 만듭니다.
+    - 일반구(수원시 장안구 41111 등, 코드 끝자리가 0이 아님)는 상위 시 코드(41110)와 "경기도 수원시" 로 올립니다.
+    - 세종은 주소 둘째 단어가 읍/면이므로 시도 이름 하나만 씁니다.
+    - 한 코드에 주소 표기가 여러 개면 가장 많이 쓰인 이름 하나로 맞춥니다.
+    """
+    address_code = address_code.astype("string").str.strip()
+    code = (address_code.str[:4] + "0").where(address_code.str.len() >= 5)
+
+    words = address_name.astype("string").str.split()
+    name = words.str[:2].str.join(" ").where(~code.str.startswith(SEJONG_SIDO_CODE, na=False), words.str[0])
+
+    known = code.notna() & name.notna()
+    canonical = name[known].groupby(code[known]).agg(lambda names: names.value_counts().index[0])
+    return code.fillna(UNKNOWN_REGION), code.map(canonical).fillna(UNKNOWN_REGION)
+
+
+def extract_region_hierarchy_mapping(
+    json_folder_paths: list[str],
+    output_csv_path: str = REGION_HIERARCHY_MAPPING_PATH
+) -> pd.DataFrame:
+    """
+    학교알리미 응답 JSON들에서 학교 코드별 시도교육청, 교육지원청, 시군구 정보를 추출하여 CSV로 저장합니다.
+    교육지원청이 없는 학교(세종 등 교육청 직속)는 시도교육청을 지원청으로 사용합니다.
+
+    Args:
+        json_folder_paths (list[str]): 응답 JSON 폴더 목록 (예: ["Database/schoolinfo/public", "Database/schoolinfo/private"])
+        output_csv_path (str): 저장할 CSV 경로
+
+    Returns:
+        pd.DataFrame: SCHUL_CODE, SCHUL_NM, ATPT_OFCDC_ORG_NM, JU_ORG_NM, SIGUNGU_CD, SIGUNGU_NM
+    """
+    columns = ["SCHUL_CODE", "SCHUL_NM", "ATPT_OFCDC_ORG_NM", SUPPORT_OFFICE_COLUMN, ADDRESS_CODE_COLUMN, ADDRESS_NAME_COLUMN]
+
+    frames = []
+    for folder in json_folder_paths:
+        for filename in sorted(os.listdir(folder)):
+            if not filename.endswith(".json"):
+                continue
+            with open(os.path.join(folder, filename), "r", encoding="utf-8") as f:
+                rows = json.load(f).get("list", [])
+            if rows:
+                frames.append(pd.DataFrame(rows).reindex(columns=columns))
+
+    if not frames:
+        raise FileNotFoundError(f"학교알리미 응답 JSON이 없습니다: {json_folder_paths}")
+
+    # 최근 파일의 정보가 남도록 뒤에서부터 중복 제거
+    df = pd.concat(frames, ignore_index=True).dropna(subset=["SCHUL_CODE"])
+    df = df.drop_duplicates(subset="SCHUL_CODE", keep="last")
+
+    df[SUPPORT_OFFICE_COLUMN] = df[SUPPORT_OFFICE_COLUMN].replace("", None).fillna(df["ATPT_OFCDC_ORG_NM"])
+    df[SIGUNGU_CODE_COLUMN], df[SIGUNGU_NAME_COLUMN] = _sigungu_code_and_name(df[ADDRESS_CODE_COLUMN], df[ADDRESS_NAME_COLUMN])
+
+    df = df.drop(columns=[ADDRESS_CODE_COLUMN, ADDRESS_NAME_COLUMN])
+    os.makedirs(os.path.dirname(output_csv_path), exist_ok=True)
+    df.to_csv(output_csv_path, index=False, encoding="utf-8-sig")
+    print(f"✅ 지역 계층 매핑 저장 완료: {output_csv_path} ({len(df)}개 학교)")
+    return df
+
+
 def main():
     # 파일 경로 설정
     json_input_path = "Database/schoolinfo/private/사립_고등_결산_세입_2022.json"           # JSON 파일 경로
@@ -0,0 +1,238 @@
+import os
+import json
+import time
+import tempfile
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+
+ARROW_STORE_DIR = "Database/arrow"
+
+# 교체된 버전 파일을 지우기 전 유예 시간(초): 포인터를 막 읽은 워커가 파일을 열 수 있도록 남겨 둠
+PRUNE_GRACE_SECONDS = 300
+
+# 프로세스(uvicorn 워커)별로 열어 둔 memory-map 테이블: {경로: (버전, 테이블)}
+_mapped_tables: dict[str, tuple[str, pa.Table]] = {}
+
+
+def _pointer_path(name: str, store_dir: str) -> str:
+    return os.path.join(store_dir, f"{name}.current")
+
+
+def _write_atomic(path: str, write_func) -> None:
+    """
+    같은 폴더의 임시 파일에 먼저 쓴 뒤 os.replace로 교체하여,
+    읽는 쪽이 절반만 쓰인 파일을 보지 않도록 합니다.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write_func(tmp_path)
+        with open(tmp_path, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def read_current_version(name: str, store_dir: str = ARROW_STORE_DIR) -> str | None:
+    """
+    현재 게시된 테이블의 버전을 반환합니다. 게시된 적이 없으면 None.
+    """
+    try:
+        with open(_pointer_path(name, store_dir), "r", encoding="utf-8") as f:
+            return json.load(f)["version"]
+    except FileNotFoundError:
+        return None
+
+
+def _prune_versions(name: str, store_dir: str, keep_versions: int, grace_seconds: float) -> None:
+    """
+    최근 keep_versions 개보다 오래된 버전 파일을 지웁니다.
+    다음 버전으로 교체된 지 grace_seconds 가 지나지 않은 파일은 아직 읽는 워커가 있을 수 있으므로 남깁니다.
+    지우지 못한 파일은 남겨 두고 다음 게시 때 다시 시도합니다 (포인터는 이미 교체되었으므로 게시는 성공).
+    """
+    prefix, suffix = f"{name}.", ".arrow"
+    versions = sorted(
+        int(f[len(prefix):-len(suffix)]) for f in os.listdir(store_dir)
+        if f.startswith(prefix) and f.endswith(suffix) and f[len(prefix):-len(suffix)].isdigit()
+    )
+    now = time.time_ns()
+    for old, newer in zip(versions[:-keep_versions], versions[1:]):
+        # 파일 버전은 게시 시각(ns)이므로 다음 버전의 값이 곧 이 파일이 교체된 시각
+        if now - newer < grace_seconds * 1e9:
+            continue
+        try:
+            os.remove(os.path.join(store_dir, f"{prefix}{old}{suffix}"))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            # Windows 에서는 다른 프로세스가 memory-map 중인 파일을 지울 수 없음 (PermissionError)
+            print(f"⚠️ 이전 버전 정리 보류 (다음 게시 때 다시 시도): {name}.{old} - {e}")
+
+
+def publish_arrow_table(
+    df: pd.DataFrame,
+    name: str,
+    store_dir: str = ARROW_STORE_DIR,
+    keep_versions: int = 2,
+    grace_seconds: float = PRUNE_GRACE_SECONDS
+) -> str:
+    """
+    집계 결과 DataFrame을 비압축 Arrow(Feather v2) 파일로 게시합니다.
+    새 버전 파일을 원자적으로 만든 뒤 '{name}.current' 포인터를 교체하므로
+    워커들은 항상 완성된 파일만 읽게 됩니다.
+
+    Args:
+        df (pd.DataFrame): 게시할 집계 결과
+        name (str): 테이블 이름 (예: "number_of_school")
+        store_dir (str): Arrow 파일 저장 폴더
+        keep_versions (int): 남겨 둘 이전 버전 수 (현재 버전 포함)
+        grace_seconds (float): 교체된 버전을 지우기 전 유예 시간(초)
+
+    Returns:
+        str: 게시된 버전 문자열
+    """
+    os.makedirs(store_dir, exist_ok=True)
+    version = str(time.time_ns())
+    filename = f"{name}.{version}.arrow"
+
+    # memory-map 으로 바로 읽을 수 있도록 압축하지 않고 저장
+    table = pa.Table.from_pandas(df.reset_index(drop=True), preserve_index=False)
+    _write_atomic(
+        os.path.join(store_dir, filename),
+        lambda path: feather.write_feather(table, path, compression="uncompressed")
+    )
+
+    pointer = {"version": version, "file": filename, "rows": table.num_rows}
+
+    def write_pointer(path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(pointer, f, ensure_ascii=False)
+
+    _write_atomic(_pointer_path(name, store_dir), write_pointer)
+
+    # 오래된 버전 정리 (이미 매핑 중인 워커는 unlink 후에도 기존 페이지를 계속 사용)
+    _prune_versions(name, store_dir, keep_versions, grace_seconds)
+
+    print(f"✅ Arrow 게시 완료: {name} (version={version}, {table.num_rows}행)")
+    return version
+
+
+def load_arrow_version(name: str, version: str, store_dir: str = ARROW_STORE_DIR) -> pa.Table:
+    """
+    특정 버전의 Arrow 파일을 읽기 전용 memory-map 으로 엽니다.
+    같은 버전이면 워커 내에서 재사용하고, 페이지는 OS 페이지 캐시로 워커 간에 공유됩니다.
+
+    Args:
+        name (str): 테이블 이름
+        version (str): publish_arrow_table 이 반환한 버전
+        store_dir (str): Arrow 파일 저장 폴더
+
+    Returns:
+        pa.Table: memory-map 기반 Arrow 테이블
+    """
+    cache_key = os.path.join(store_dir, name)
+    cached = _mapped_tables.get(cache_key)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    path = os.path.join(store_dir, f"{name}.{version}.arrow")
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"{store_dir}에 '{name}' 테이블 버전 {version} 이 없습니다.")
+
+    source = pa.memory_map(path, "r")
+    table = pa.ipc.open_file(source).read_all()
+    _mapped_tables[cache_key] = (version, table)
+    return table
+
+
+def load_current_arrow_table(name: str, store_dir: str = ARROW_STORE_DIR) -> tuple[str, pa.Table]:
+    """
+    현재 게시된 버전과 그 테이블을 함께 반환합니다.
+    버전을 캐시 키로 쓰는 쪽은 포인터를 따로 읽지 말고 이 함수가 실제로 연 버전을 사용해야 합니다.
+    """
+    version = read_current_version(name, store_dir)
+    if version is None:
+        raise FileNotFoundError(f"{store_dir}에 게시된 '{name}' 테이블이 없습니다.")
+    return version, load_arrow_version(name, version, store_dir)
+
+
+def load_arrow_table(name: str, store_dir: str = ARROW_STORE_DIR) -> pa.Table:
+    """
+    게시된 Arrow 테이블(현재 버전)을 읽기 전용 memory-map 으로 엽니다.
+
+    Args:
+        name (str): 테이블 이름
+        store_dir (str): Arrow 파일 저장 폴더
+
+    Returns:
+        pa.Table: memory-map 기반 Arrow 테이블
+    """
+    return load_current_arrow_table(name, store_dir)[1]
+
+
+def load_arrow_frame(
+    name: str,
+    store_dir: str = ARROW_STORE_DIR,
+    columns: list[str] | None = None,
+    filter: pc.Expression | None = None
+) -> pd.DataFrame:
+    """
+    게시된 테이블에서 필요한 행/컬럼만 DataFrame으로 변환합니다.
+    to_pandas 는 워커 메모리로 복사하므로 행 조건(filter)과 컬럼을 Arrow 에서 먼저 줄인 뒤 변환합니다.
+    전체 테이블이 필요하면 load_arrow_table 로 Arrow 테이블을 그대로 사용하세요.
+
+    Args:
+        columns (list[str] | None): 변환할 컬럼
+        filter (pc.Expression | None): 변환 전에 적용할 행 조건 (예: pc.field("연도") == 2024)
+    """
+    table = load_arrow_table(name, store_dir)
+    if filter is not None:
+        table = table.filter(filter)
+    if columns is not None:
+        table = table.select(columns)
+    # 필터 결과는 이 요청만의 임시 테이블이므로 변환하면서 버퍼를 바로 놓아 줌
+    return table.to_pandas(split_blocks=True, self_destruct=filter is not None)
+
+
+def publish_region_summaries(summary_root: str = "Database/schoolinfo/summary", store_dir: str = ARROW_STORE_DIR) -> None:
+    """
+    summation_region 결과(교육청별 요약 CSV)를 예산/결산 - 세입/세출 조합마다 하나의 Arrow 테이블로 게시합니다.
+    테이블 이름은 region_summary_{예결산}_{세입세출} 이고, 항목 컬럼은 파일별/학교급별/전체 학교당 평균입니다 (합계 아님).
+    요약 CSV 컬럼(summarize_region_school_data 참고)에 school_type, ATPT_OFCDC_ORG_NM 컬럼을 더합니다.
+    """
+    for budget_type in ["예산", "결산"]:
+        for revenue_type in ["세입", "세출"]:
+            frames = []
+            for school_type in ["private", "public", "combined"]:
+                type_dir = os.path.join(summary_root, f"{school_type}_summary")
+                if not os.path.isdir(type_dir):
+                    continue
+                for region in os.listdir(type_dir):
+                    path = os.path.join(type_dir, region, f"{school_type}_{budget_type}_{revenue_type}_요약.csv")
+                    if not os.path.exists(path):
+                        continue
+                    df = pd.read_csv(path)
+                    df["school_type"] = school_type
+                    df["ATPT_OFCDC_ORG_NM"] = region
+                    frames.append(df)
+
+            if frames:
+                publish_arrow_table(pd.concat(frames, ignore_index=True), f"region_summary_{budget_type}_{revenue_type}", store_dir)
+            else:
+                print(f"⚠️ 요약 파일 없음: {budget_type}_{revenue_type}")
+
+
+def main():
+    number_of_school_path = "Database/schoolinfo/number_of_school.csv"
+    if os.path.exists(number_of_school_path):
+        publish_arrow_table(pd.read_csv(number_of_school_path), "number_of_school")
+    publish_region_summaries()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import os
+import numpy as np
+import pandas as pd
+
+from utils.schema_registry import PER_HEAD_COLUMN, FileMeta, build_catalog, query_catalog, read_projected
+
+ID_COLUMNS = ["SCHUL_CODE", "ATPT_OFCDC_ORG_NM", "FOND_SC_CODE"]
+REQUIRED_COLUMNS = ["SCHUL_CODE", "ATPT_OFCDC_ORG_NM"]
+
+
+def _collect_budget_settlement_pairs(csv_folder_path: str, years: list[int] | None = None) -> dict:
+    """
+    카탈로그를 (학교급, 세입/세출, 연도)별 {"예산": FileMeta, "결산": FileMeta} 쌍으로 묶습니다.
+    """
+    pairs = {}
+    for meta in query_catalog(build_catalog(csv_folder_path), years=years):
+        if meta.level is None or meta.budget_type is None or meta.flow is None or meta.year is None:
+            continue
+        pairs.setdefault((meta.level, meta.flow, meta.year), {})[meta.budget_type] = meta
+
+    return {key: metas for key, metas in pairs.items() if "예산" in metas and "결산" in metas}
+
+
+def _read_indexed(meta: FileMeta) -> pd.DataFrame:
+    """
+    필요한 컬럼만 읽고 SCHUL_CODE 정렬 인덱스를 만듭니다 (정렬된 고유 인덱스끼리는 merge-join 으로 결합됨).
+    예산/결산 파일에서 코드가 숫자/문자로 다르게 읽혀도 맞도록 문자열로 바꾸고 공백을 없앱니다.
+    """
+    df = read_projected(meta, id_columns=ID_COLUMNS)
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"{meta.filename}에 필수 컬럼이 없습니다: {missing}")
+
+    for col in ["SCHUL_CODE", "FOND_SC_CODE"]:
+        if col in df.columns:
+            df[col] = df[col].astype("string").str.strip()
+    return df.drop_duplicates(subset="SCHUL_CODE").set_index("SCHUL_CODE").sort_index()
+
+
+def reconcile_budget_settlement(
+    csv_folder_path: str,
+    output_dir: str,
+    years: list[int] | None = None,
+    outlier_k: float = 1.5
+) -> pd.DataFrame:
+    """
+    예산과 결산 파일을 SCHUL_CODE × 연도 × 항목 단위로 맞춰 학교별 집행률을 계산하고,
+    교육청 × 학교급 단위 집행률/이상치 비율로 집계합니다.
+    파일 쌍(학교급, 세입/세출, 연도) 하나씩만 메모리에 올리고 학교별 결과는 바로 파일에 이어 쓰므로
+    전국 다년도 데이터도 한 번의 순회로 처리됩니다.
+
+    Args:
+        csv_folder_path (str): 예산/결산 CSV 폴더 (예: Database/schoolinfo/combined_csv)
+        output_dir (str): 결과 저장 폴더
+        years (list[int] | None): 대상 연도 (None 이면 전체)
+        outlier_k (float): 항목별 집행률 IQR 이상치 기준 배수
+
+    Returns:
+        pd.DataFrame: 교육청 × 학교급 × 연도 × 세입/세출 × 항목별 집행률 요약
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    school_output_path = os.path.join(output_dir, "학교별_집행률.csv")
+    if os.path.exists(school_output_path):
+        os.remove(school_output_path)
+
+    partials = []
+    for (school_level, revenue_type, year), metas in sorted(_collect_budget_settlement_pairs(csv_folder_path, years).items()):
+        budget_df = _read_indexed(metas["예산"])
+        settlement_df = _read_indexed(metas["결산"])
+
+        amt_map = metas["결산"].amt_map
+        # 1인당 평균 세출은 집행 항목이 아니므로 집행률에서 제외
+        categories = [
+            col for col in amt_map.values()
+            if col != PER_HEAD_COLUMN and col in budget_df.columns and col in settlement_df.columns
+        ]
+        id_cols = [col for col in ID_COLUMNS[1:] if col in settlement_df.columns]
+        joined = settlement_df[id_cols + categories].join(
+            budget_df[categories], how="inner", lsuffix="_결산", rsuffix="_예산"
+        )
+        if joined.empty:
+            print(f"⚠️ 예산/결산 공통 학교 없음: {school_level}_{revenue_type}_{year}")
+            continue
+
+        # 학교 × 항목 long 형식으로 펼치기 (numpy 블록 단위)
+        n_schools, n_categories = len(joined), len(categories)
+        budget_values = joined[[f"{c}_예산" for c in categories]].to_numpy(dtype=float)
+        settlement_values = joined[[f"{c}_결산" for c in categories]].to_numpy(dtype=float)
+        long_df = pd.DataFrame({
+            "SCHUL_CODE": np.repeat(joined.index.to_numpy(), n_categories),
+            "항목": np.tile(categories, n_schools),
+            "예산": budget_values.ravel(),
+            "결산": settlement_values.ravel(),
+        })
+        for col in id_cols:
+            long_df[col] = np.repeat(joined[col].to_numpy(), n_categories)
+        long_df["연도"] = year
+        long_df["학교급"] = school_level
+        long_df["세입세출"] = revenue_type
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            long_df["집행률"] = np.where(long_df["예산"] > 0, long_df["결산"] / long_df["예산"], np.nan)
+
+        # 항목별 IQR 기준 이상치
+        quantiles = long_df.groupby("항목")["집행률"].quantile([0.25, 0.75]).unstack()
+        q1 = long_df["항목"].map(quantiles[0.25])
+        q3 = long_df["항목"].map(quantiles[0.75])
+        iqr = q3 - q1
+        long_df["이상치"] = (long_df["집행률"] < q1 - outlier_k * iqr) | (long_df["집행률"] > q3 + outlier_k * iqr)
+
+        long_df.to_csv(
+            school_output_path, mode="a", index=False, encoding="utf-8-sig",
+            header=not os.path.exists(school_output_path)
+        )
+
+        group_cols = ["ATPT_OFCDC_ORG_NM", "학교급", "연도", "세입세출", "항목"]
+        partial = long_df.groupby(group_cols).agg(
+            예산합계=("예산", "sum"),
+            결산합계=("결산", "sum"),
+            학교수=("SCHUL_CODE", "size"),
+            이상치수=("이상치", "sum")
+        ).reset_index()
+        partials.append(partial)
+        print(f"✅ {school_level}_{revenue_type}_{year}: {n_schools}개 학교 대응 완료")
+
+    if not partials:
+        raise FileNotFoundError(f"{csv_folder_path}에 예산/결산 쌍이 없습니다.")
+
+    summary = pd.concat(partials, ignore_index=True)
+    summary["집행률"] = summary["결산합계"] / summary["예산합계"].replace(0, np.nan)
+    summary["이상치비율"] = summary["이상치수"] / summary["학교수"]
+
+    summary_path = os.path.join(output_dir, "교육청_학교급별_집행률.csv")
+    summary.to_csv(summary_path, index=False, encoding="utf-8-sig")
+    print(f"✅ 집행률 요약 저장 완료: {summary_path}")
+    return summary
+
+
+def main():
+    reconcile_budget_settlement(
+        csv_folder_path="Database/schoolinfo/combined_csv",
+        output_dir="Database/schoolinfo/reconciliation"
+    )
+
+
+if __name__ == "__main__":
+    main()
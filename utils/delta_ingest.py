@@ -0,0 +1,235 @@
+import os
+import json
+import hashlib
+import tempfile
+from datetime import datetime
+import pandas as pd
+
+from utils.arrow_store import publish_arrow_table, publish_region_summaries, read_current_version
+from utils.file_lock import file_lock
+from utils.number_of_school import NUMBER_OF_SCHOOL_TABLE, NUMBER_OF_SCHOOL_YEAR, count_schools_by_attributes, refresh_school_counts
+from utils.schema_registry import parse_file_meta
+from utils.summation_region import summarize_region_school_data
+from utils.table_serving import FINAL_TABLE_NAMES, refresh_final_table_partition
+from utils.yearly_trend import TREND_TABLE_NAME, refresh_trend_partition
+
+CHANGELOG_PATH = "Database/schoolinfo/changelog.jsonl"
+
+
+def _row_hash(row: dict) -> str:
+    return hashlib.sha1(json.dumps(row, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def diff_school_rows(old_rows: list[dict], new_rows: list[dict]) -> dict:
+    """
+    저장된 행과 새로 받은 행을 SCHUL_CODE 기준 행 해시로 비교합니다.
+
+    Returns:
+        dict: {"insert": [...], "update": [...], "delete": [...]} (각 항목은 행 dict)
+    """
+    old_by_code = {row.get("SCHUL_CODE"): row for row in old_rows}
+    new_by_code = {row.get("SCHUL_CODE"): row for row in new_rows}
+
+    inserts, updates = [], []
+    for code, row in new_by_code.items():
+        old_row = old_by_code.get(code)
+        if old_row is None:
+            inserts.append(row)
+        elif _row_hash(old_row) != _row_hash(row):
+            updates.append(row)
+    deletes = [row for code, row in old_by_code.items() if code not in new_by_code]
+
+    return {"insert": inserts, "update": updates, "delete": deletes}
+
+
+def _apply_delta_to_csv(csv_path: str, delta: dict, office: str | None = None) -> None:
+    """
+    CSV에 변경분만 반영합니다 (추가/변경/삭제 학교를 제거한 뒤 추가/변경 행 덧붙임).
+    추가 행도 같은 코드를 먼저 제거하므로 저장된 JSON 없이 처음 반영해도 중복되지 않습니다.
+    office 를 주면 해당 교육청 행만 반영합니다.
+    """
+    def select(rows):
+        return [row for row in rows if office is None or row.get("ATPT_OFCDC_ORG_NM") == office]
+
+    upserts = select(delta["insert"]) + select(delta["update"])
+    # 숫자처럼 보이는 학교 코드("7010057")도 문자열로 비교
+    removed_codes = {str(row.get("SCHUL_CODE")).strip() for rows in delta.values() for row in rows}
+    if not upserts and not removed_codes:
+        return
+
+    os.makedirs(os.path.dirname(csv_path), exist_ok=True)
+    # 공립/사립 변경분이 같은 통합 CSV 를 동시에 고쳐도 한쪽 변경이 사라지지 않도록 읽기-수정-쓰기를 잠금
+    with file_lock(_lock_path(csv_path)):
+        if os.path.exists(csv_path):
+            df = pd.read_csv(csv_path, dtype={"SCHUL_CODE": str})
+            df = df[~df["SCHUL_CODE"].str.strip().isin(removed_codes)]
+        else:
+            df = pd.DataFrame()
+
+        if upserts:
+            df = pd.concat([df, pd.DataFrame(upserts)], ignore_index=True)
+
+        _replace_file(csv_path, lambda tmp_path: df.to_csv(tmp_path, index=False, encoding="utf-8-sig"))
+
+
+def _lock_path(path: str) -> str:
+    return os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.lock")
+
+
+def _replace_file(path: str, write_func) -> None:
+    """
+    같은 폴더의 고유한 임시 파일에 쓴 뒤 os.replace 로 교체합니다 (동시에 반영하는 워커끼리 임시 파일이 겹치지 않음).
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    os.close(fd)
+    try:
+        write_func(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _save_snapshot(data: dict, path: str) -> None:
+    """
+    다음 비교 기준이 되는 JSON 을 원자적으로 교체합니다.
+    """
+    def write(tmp_path: str) -> None:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    _replace_file(path, write)
+
+
+def _refresh_aggregates(base_dir: str, combined_name: str, meta, offices: list[str]) -> None:
+    """
+    통합 CSV 변경분을 이미 게시된 집계 저장소에 반영합니다. 바뀐 (교육청, 학교급) 부분만 다시 계산합니다.
+    - 최종 표(Arrow): 바뀐 (연도, 학교급, 예결산, 세입세출) 중 해당 교육청 행만 교체
+    - 연도별 추세 저장소: 같은 범위의 집계 행만 교체
+    - 학교 수 집계: 결산_세입 {NUMBER_OF_SCHOOL_YEAR}년 파일이 바뀐 경우 해당 (교육청, 학교급) 학교 수만 다시 계산
+    아직 만들어지지 않은 저장소는 일부 데이터로 새로 만들지 않고 건너뜁니다 (전체 생성은 각 모듈의 main).
+    """
+    combined_folder = os.path.join(base_dir, "combined_csv")
+    combined_path = os.path.join(combined_folder, combined_name)
+    if meta.year is None or meta.level is None or not os.path.exists(combined_path):
+        return
+    combined_meta = parse_file_meta(combined_path)
+
+    # 여러 파일의 변경분이 같은 Arrow 표를 동시에 교체하면 한쪽 결과가 사라지므로 집계 갱신은 한 번에 하나씩
+    with file_lock(os.path.join(base_dir, ".aggregates.lock")):
+        if all(read_current_version(name) is not None for name in FINAL_TABLE_NAMES.values()):
+            refresh_final_table_partition(combined_meta, offices)
+
+        if read_current_version(TREND_TABLE_NAME) is not None:
+            refresh_trend_partition(combined_meta, offices)
+
+        if (meta.budget_type, meta.flow) == ("결산", "세입") and str(meta.year) == NUMBER_OF_SCHOOL_YEAR:
+            if read_current_version(NUMBER_OF_SCHOOL_TABLE) is not None:
+                result = refresh_school_counts(combined_meta, offices)
+            else:
+                result = count_schools_by_attributes(combined_folder)
+            result_path = os.path.join(base_dir, "number_of_school.csv")
+            _replace_file(result_path, lambda tmp_path: result.to_csv(tmp_path, index=False, encoding="utf-8-sig"))
+            publish_arrow_table(result, NUMBER_OF_SCHOOL_TABLE)
+
+
+def _append_changelog(changelog_path: str, filename: str, meta, delta: dict) -> None:
+    os.makedirs(os.path.dirname(changelog_path), exist_ok=True)
+    timestamp = datetime.now().isoformat(timespec="seconds")
+    with open(changelog_path, "a", encoding="utf-8") as f:
+        for op, rows in delta.items():
+            for row in rows:
+                record = {
+                    "timestamp": timestamp,
+                    "file": filename,
+                    "op": op,
+                    "SCHUL_CODE": row.get("SCHUL_CODE"),
+                    "year": meta.year,
+                    "type": meta.school_type,
+                    "level": meta.level,
+                    "ATPT_OFCDC_ORG_NM": row.get("ATPT_OFCDC_ORG_NM")
+                }
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def ingest_payload_delta(
+    data: dict,
+    folder: str,
+    filename: str,
+    changelog_path: str = CHANGELOG_PATH,
+    refresh_summaries: bool = True,
+    refresh_aggregates: bool = True
+) -> dict:
+    """
+    새로 받은 학교알리미 응답을 저장된 JSON과 비교하여 변경분(추가/변경/삭제)만
+    CSV 저장소(전체/교육청별/공사립 통합)에 반영하고 변경 이력을 남깁니다.
+    변경된 교육청의 요약과 이미 게시된 집계 저장소(최종 표, 연도별 추세, 학교 수)를 갱신합니다.
+
+    저장된 JSON 은 다음 비교의 기준이므로 모든 파생 저장소를 반영한 뒤 마지막에 교체합니다.
+    중간에 실패하면 JSON 이 그대로 남아 다음 수집 때 같은 변경분을 다시 반영합니다.
+    수집 코드는 save_json 대신 이 함수를 호출해야 변경분이 파생 저장소까지 반영됩니다.
+
+    Args:
+        data (dict): API 응답 ({"list": [...]} 형식)
+        folder (str): JSON 저장 폴더 (예: "Database/schoolinfo/public")
+        filename (str): 저장 파일 이름 (예: "공립_고등_결산_세입_2022.json")
+        changelog_path (str): 변경 이력(JSON Lines) 경로
+        refresh_summaries (bool): 변경된 교육청 요약 재계산 여부
+        refresh_aggregates (bool): 최종 표/추세/학교 수 집계 갱신 여부
+
+    Returns:
+        dict: 추가/변경/삭제 건수와 영향받은 (교육청, 학교급) 목록
+    """
+    path = os.path.join(folder, filename)
+    meta = parse_file_meta(path)
+
+    old_rows = []
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            old_rows = json.load(f).get("list", [])
+
+    delta = diff_school_rows(old_rows, data.get("list", []))
+    counts = {op: len(rows) for op, rows in delta.items()}
+    # 교육청이 바뀐 학교도 이전 교육청 파일에서 빠지도록 이전 행의 교육청까지 포함
+    old_by_code = {row.get("SCHUL_CODE"): row for row in old_rows}
+    previous_rows = [old_by_code[row.get("SCHUL_CODE")] for row in delta["update"]]
+    affected_offices = sorted({
+        row.get("ATPT_OFCDC_ORG_NM")
+        for row in previous_rows + [row for rows in delta.values() for row in rows]
+        if row.get("ATPT_OFCDC_ORG_NM")
+    })
+
+    if not any(counts.values()):
+        print(f"✅ 변경 없음: {filename}")
+        return {"counts": counts, "affected": []}
+
+    # CSV 저장소 반영: {category}_csv, {category}_filtered/{교육청}, combined_csv, combined_filtered/{교육청}
+    base_dir = os.path.dirname(folder)
+    category = os.path.basename(folder)
+    csv_name = filename.replace(".json", ".csv")
+    combined_name = "_".join(csv_name.split("_")[1:])  # 앞에 '공립' 또는 '사립' 제거
+
+    _apply_delta_to_csv(os.path.join(base_dir, f"{category}_csv", csv_name), delta)
+    _apply_delta_to_csv(os.path.join(base_dir, "combined_csv", combined_name), delta)
+    for office in affected_offices:
+        _apply_delta_to_csv(
+            os.path.join(base_dir, f"{category}_filtered", office, f"{office}_{csv_name}"), delta, office
+        )
+        _apply_delta_to_csv(
+            os.path.join(base_dir, "combined_filtered", office, f"{office}_{combined_name}"), delta, office
+        )
+
+    if refresh_summaries and meta.budget_type and meta.flow:
+        for school_type in [category, "combined"]:
+            summarize_region_school_data(school_type, meta.budget_type, meta.flow, regions=affected_offices, base_dir=base_dir)
+        publish_region_summaries(os.path.join(base_dir, "summary"))
+
+    if refresh_aggregates:
+        _refresh_aggregates(base_dir, combined_name, meta, affected_offices)
+
+    _append_changelog(changelog_path, filename, meta, delta)
+    os.makedirs(folder, exist_ok=True)
+    _save_snapshot(data, path)
+    print(f"✅ 변경분 반영: {filename} (추가 {counts['insert']}, 변경 {counts['update']}, 삭제 {counts['delete']})")
+
+    return {"counts": counts, "affected": [(office, meta.level) for office in affected_offices]}
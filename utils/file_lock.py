@@ -0,0 +1,34 @@
+import os
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def file_lock(path: str):
+    """
+    잠금 파일(path)에 대한 배타적 잠금. threading.Lock 과 달리 uvicorn 워커 프로세스 사이에서도 유지됩니다.
+    잠금 파일은 지우지 않고 재사용합니다 (지우면 다른 프로세스가 새 파일을 잠글 수 있음).
+
+    Args:
+        path (str): 잠금 파일 경로 (예: "Database/news/articles/.2025-04.lock")
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
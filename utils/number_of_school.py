@@ -1,64 +1,36 @@
-import os
 import pandas as pd
 
-def count_schools_by_attributes(csv_folder_path: str, year: str = "2024") -> pd.DataFrame:
-    """
-    지정된 폴더 내의 2024년 관련 CSV 파일들에서 학교 수를 지역(시도), 학교급, 학교유형 등으로 세는 함수
+from utils.arrow_store import load_arrow_frame
+from utils.partial_aggregate import PartialAggregate
+from utils.schema_registry import FileMeta, build_catalog, query_catalog
 
-    Args:
-        csv_folder_path (str): CSV 파일이 있는 폴더 경로
-        year (str): 사용할 연도 (기본값: "2024")
+SUMMARY_KEYS = ["ATPT_OFCDC_ORG_NM", "학교급", "FOND_SC_CODE"]
 
-    Returns:
-        pd.DataFrame: 시도/학교급/학교유형/계열별 학교 수 집계표
-    """
-    files = [
-        f for f in os.listdir(csv_folder_path)
-        if year in f and "결산" in f and "세입" in f and f.endswith(".csv")
-    ]
+NUMBER_OF_SCHOOL_PATH = "Database/schoolinfo/number_of_school.csv"
+NUMBER_OF_SCHOOL_YEAR = "2024"
+NUMBER_OF_SCHOOL_TABLE = "number_of_school"
+
+
+def _list_year_files(csv_folder_path: str, year: str) -> list[FileMeta]:
+    files = query_catalog(build_catalog(csv_folder_path), budget_type="결산", flow="세입", years=[year])
     if not files:
         raise FileNotFoundError(f"{csv_folder_path}에 {year}년 파일이 없습니다.")
+    return files
 
-    dfs = []
-    for f in files:
-        df = pd.read_csv(os.path.join(csv_folder_path, f))
-        if "초등" in f:
-            school_level = "초등"
-        elif "중등" in f:
-            school_level = "중등"
-        elif "고등" in f:
-            school_level = "고등"
-        else:
-            school_level = "기타"
-        df["학교급"] = school_level
-        dfs.append(df)
-    all_schools_df = pd.concat(dfs, ignore_index=True)
-
-    all_schools_df = all_schools_df.drop_duplicates(subset=["SCHUL_CODE"])
-    # '공립'과 '국립'을 '국공립'으로 통합
-    all_schools_df["FOND_SC_CODE"] = all_schools_df["FOND_SC_CODE"].replace({"공립": "국공립", "국립": "국공립"})
 
-    summary = all_schools_df.groupby(["ATPT_OFCDC_ORG_NM", "학교급", "FOND_SC_CODE"]).size().reset_index(name="학교 수")
-
-    for level in ["초등", "중등", "고등"]:
-        for fond_type in summary["FOND_SC_CODE"].unique():
-            for edu in summary["ATPT_OFCDC_ORG_NM"].unique():
-                condition = (
-                    (summary["학교급"] == level) &
-                    (summary["FOND_SC_CODE"] == fond_type) &
-                    (summary["ATPT_OFCDC_ORG_NM"] == edu)
-                )
-                if not (condition).any():
-                    summary = pd.concat([
-                        summary,
-                        pd.DataFrame([{
-                            "ATPT_OFCDC_ORG_NM": edu,
-                            "학교급": level,
-                            "FOND_SC_CODE": fond_type,
-                            "학교 수": 0,
-                            "소계구분": ""
-                        }])
-                    ], ignore_index=True)
+def _add_missing_rows_and_subtotals(summary: pd.DataFrame) -> pd.DataFrame:
+    """
+    (교육청, 학교급, 학교유형) 조합 중 빠진 항목을 0으로 채우고 교육청/학교급/학교유형별 소계를 덧붙입니다.
+    """
+    full_index = pd.MultiIndex.from_product(
+        [summary["ATPT_OFCDC_ORG_NM"].unique(), ["초등", "중등", "고등"], summary["FOND_SC_CODE"].unique()],
+        names=SUMMARY_KEYS
+    )
+    existing = summary.set_index(SUMMARY_KEYS)
+    missing = full_index.difference(existing.index)
+    if len(missing):
+        filler = pd.DataFrame({"학교 수": 0}, index=missing).reset_index()
+        summary = pd.concat([summary, filler], ignore_index=True)
 
     # 소계 추가
     edu_office_subtotal = summary.groupby(["ATPT_OFCDC_ORG_NM"])["학교 수"].sum().reset_index()
@@ -78,15 +50,109 @@ def count_schools_by_attributes(csv_folder_path: str, year: str = "2024") -> pd.
 
     summary["소계구분"] = ""
 
-    summary = pd.concat([summary, edu_office_subtotal, level_subtotal, type_subtotal], ignore_index=True)
+    return pd.concat([summary, edu_office_subtotal, level_subtotal, type_subtotal], ignore_index=True)
+
+
+def count_schools_by_attributes(csv_folder_path: str, year: str = NUMBER_OF_SCHOOL_YEAR, chunksize: int | None = None) -> pd.DataFrame:
+    """
+    지정된 폴더 내의 2024년 관련 CSV 파일들에서 학교 수를 지역(시도), 학교급, 학교유형 등으로 세는 함수
+
+    Args:
+        csv_folder_path (str): CSV 파일이 있는 폴더 경로
+        year (str): 사용할 연도 (기본값: "2024")
+        chunksize (int | None): 지정하면 파일을 청크 단위로 읽어 부분 집계만 유지합니다 (out-of-core 모드)
+
+    Returns:
+        pd.DataFrame: 시도/학교급/학교유형/계열별 학교 수 집계표
+    """
+    if chunksize is not None:
+        return count_schools_by_attributes_chunked(csv_folder_path, year, chunksize)
+
+    files = _list_year_files(csv_folder_path, year)
+
+    dfs = []
+    for meta in files:
+        df = pd.read_csv(meta.path)
+        df["학교급"] = meta.level or "기타"
+        dfs.append(df)
+    all_schools_df = pd.concat(dfs, ignore_index=True)
+
+    all_schools_df = all_schools_df.drop_duplicates(subset=["SCHUL_CODE"])
+    # '공립'과 '국립'을 '국공립'으로 통합
+    all_schools_df["FOND_SC_CODE"] = all_schools_df["FOND_SC_CODE"].replace({"공립": "국공립", "국립": "국공립"})
+
+    summary = all_schools_df.groupby(SUMMARY_KEYS).size().reset_index(name="학교 수")
+    return _add_missing_rows_and_subtotals(summary)
+
+
+def count_schools_by_attributes_chunked(csv_folder_path: str, year: str = "2024", chunksize: int = 100_000) -> pd.DataFrame:
+    """
+    count_schools_by_attributes 의 out-of-core 버전.
+    파일을 chunksize 행씩 읽어 이미 센 SCHUL_CODE 집합과 (교육청, 학교급, 학교유형)별 행 수만 유지하므로
+    읽는 연도/파일 수와 관계없이 메모리는 전국 학교 수 수준으로 일정합니다.
+    이미 센 학교는 건너뛰므로 학교마다 한 행만 집계되어 전체 로드 방식의 drop_duplicates 와 같은 결과를 냅니다.
+
+    Args:
+        csv_folder_path (str): CSV 파일이 있는 폴더 경로
+        year (str): 사용할 연도
+        chunksize (int): 한 번에 읽을 행 수
+
+    Returns:
+        pd.DataFrame: 시도/학교급/학교유형/계열별 학교 수 집계표
+    """
+    files = _list_year_files(csv_folder_path, year)
+
+    partial = PartialAggregate(keys=SUMMARY_KEYS)
+    seen_codes = set()
+    usecols = ["SCHUL_CODE", "ATPT_OFCDC_ORG_NM", "FOND_SC_CODE"]
+
+    for meta in files:
+        school_level = meta.level or "기타"
+        for chunk in pd.read_csv(meta.path, usecols=usecols, chunksize=chunksize):
+            chunk = chunk.drop_duplicates(subset=["SCHUL_CODE"])
+            chunk = chunk[~chunk["SCHUL_CODE"].isin(seen_codes)]
+            seen_codes.update(chunk["SCHUL_CODE"])
+
+            chunk = chunk.assign(학교급=school_level)
+            chunk["FOND_SC_CODE"] = chunk["FOND_SC_CODE"].replace({"공립": "국공립", "국립": "국공립"})
+            partial.update(chunk)
+
+    summary = partial.to_frame()[SUMMARY_KEYS + ["행 수"]].rename(columns={"행 수": "학교 수"})
+    return _add_missing_rows_and_subtotals(summary)
+
+def refresh_school_counts(meta: FileMeta, offices: list[str]) -> pd.DataFrame:
+    """
+    게시된 학교 수 집계에서 변경된 파일(meta)의 (교육청, 학교급) 부분만 다시 세고 소계를 다시 붙입니다.
+    다른 교육청/학교급은 게시된 표의 값을 그대로 사용하므로 전국 파일을 다시 읽지 않습니다.
+
+    Args:
+        meta (FileMeta): 변경된 결산_세입 통합 파일
+        offices (list[str]): 변경된 교육청 목록
+
+    Returns:
+        pd.DataFrame: count_schools_by_attributes 와 같은 형식의 전체 집계표
+    """
+    school_level = meta.level or "기타"
+    stored = load_arrow_frame(NUMBER_OF_SCHOOL_TABLE)
+    summary = stored[stored["소계구분"].fillna("") == ""].drop(columns=["소계구분"])
+    summary = summary[~(summary["ATPT_OFCDC_ORG_NM"].isin(offices) & (summary["학교급"] == school_level))]
+
+    df = pd.read_csv(meta.path, usecols=["SCHUL_CODE", "ATPT_OFCDC_ORG_NM", "FOND_SC_CODE"], dtype={"SCHUL_CODE": str})
+    df = df[df["ATPT_OFCDC_ORG_NM"].isin(offices)].drop_duplicates(subset=["SCHUL_CODE"])
+    df["학교급"] = school_level
+    df["FOND_SC_CODE"] = df["FOND_SC_CODE"].replace({"공립": "국공립", "국립": "국공립"})
+    counts = df.groupby(SUMMARY_KEYS).size().reset_index(name="학교 수")
 
-    return summary
+    summary = pd.concat([summary, counts], ignore_index=True)
+    # 학교가 모두 빠진 교육청은 전체 집계처럼 표에서 제외 (0으로 채운 행만 남지 않도록)
+    summary = summary[summary.groupby("ATPT_OFCDC_ORG_NM")["학교 수"].transform("sum") > 0]
+    return _add_missing_rows_and_subtotals(summary)
 
 def main():
     csv_folder = "Database/schoolinfo/combined_csv"
     result = count_schools_by_attributes(csv_folder)
     # print(result)
-    result.to_csv("Database/schoolinfo/number_of_school.csv", index=False, encoding="utf-8-sig")
+    result.to_csv(NUMBER_OF_SCHOOL_PATH, index=False, encoding="utf-8-sig")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,71 @@
+import pandas as pd
+
+
+class PartialAggregate:
+    """
+    청크 단위로 갱신하고 서로 병합할 수 있는 부분 집계입니다.
+    키별 합계와 행 수(선택적으로 고유 값 집합)를 유지하며, 원본 행은 보관하지 않으므로
+    메모리 사용량은 키 수(+ 고유 값 수)에만 비례합니다.
+    키에 NaN 이 있는 행은 pandas groupby 기본값과 같이 제외하므로 전체 로드 방식과 결과가 같습니다.
+
+    Args:
+        keys (list[str]): 집계 키 컬럼
+        value_cols (list[str] | None): 합계를 낼 수치 컬럼
+        distinct_col (str | None): 고유 개수를 셀 컬럼 (None 이면 세지 않음)
+        dropna (bool): 키가 NaN 인 행 제외 여부 (groupby 의 dropna)
+    """
+
+    def __init__(
+        self,
+        keys: list[str],
+        value_cols: list[str] | None = None,
+        distinct_col: str | None = None,
+        dropna: bool = True
+    ):
+        self.keys = keys
+        self.value_cols = value_cols or []
+        self.distinct_col = distinct_col
+        self.dropna = dropna
+        self.sums: pd.DataFrame | None = None
+        self.distinct: dict[tuple, set] = {}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        청크 하나를 부분 집계에 반영합니다.
+        """
+        if chunk.empty:
+            return
+
+        grouped = chunk.groupby(self.keys, dropna=self.dropna)
+        part = grouped[self.value_cols].sum() if self.value_cols else pd.DataFrame(index=grouped.size().index)
+        part["행 수"] = grouped.size()
+        self.sums = part if self.sums is None else self.sums.add(part, fill_value=0)
+
+        if self.distinct_col:
+            for key, codes in grouped[self.distinct_col].unique().items():
+                key = key if isinstance(key, tuple) else (key,)
+                self.distinct.setdefault(key, set()).update(codes)
+
+    def merge(self, other: "PartialAggregate") -> "PartialAggregate":
+        """
+        다른 부분 집계(다른 파일/연도/워커 결과)를 합칩니다.
+        """
+        if other.sums is not None:
+            self.sums = other.sums.copy() if self.sums is None else self.sums.add(other.sums, fill_value=0)
+        for key, codes in other.distinct.items():
+            self.distinct.setdefault(key, set()).update(codes)
+        return self
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        최종 집계표를 만듭니다. distinct_col 이 있으면 '고유 수' 컬럼이 추가됩니다.
+        """
+        if self.sums is None:
+            return pd.DataFrame(columns=self.keys + self.value_cols + ["행 수"])
+
+        result = self.sums.reset_index()
+        result["행 수"] = result["행 수"].astype(int)
+        if self.distinct_col:
+            key_tuples = result[self.keys].itertuples(index=False, name=None)
+            result["고유 수"] = [len(self.distinct.get(key, ())) for key in key_tuples]
+        return result
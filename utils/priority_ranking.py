@@ -0,0 +1,175 @@
+import threading
+import numpy as np
+import pandas as pd
+import pyarrow.compute as pc
+
+from utils.arrow_store import load_arrow_table, load_arrow_version, read_current_version
+from utils.schema_registry import PER_HEAD_COLUMN
+from utils.yearly_trend import TREND_TABLE_NAME
+
+RANK_KEYS = ["ATPT_OFCDC_ORG_NM", "학교급", "항목"]
+
+# 우선순위 지표 (값이 클수록 지원 필요도가 높음)
+# - 비중_부족: 전국 같은 학교급의 항목 비중 - 해당 교육청 항목 비중
+# - 학교당_격차: (전국 학교당 결산액 - 교육청 학교당 결산액) / 전국 학교당 결산액
+# - 미집행: 1 - 결산/예산
+DEFAULT_WEIGHTS = {"비중_부족": 1.0, "학교당_격차": 1.0, "미집행": 0.5}
+FEATURES = list(DEFAULT_WEIGHTS)
+
+MAX_TOP_N = 1000
+
+# {(데이터 버전, 연도): (키 DataFrame, 원 지표, 표준화 지표)}
+_feature_cache: dict[tuple, tuple[pd.DataFrame, np.ndarray, np.ndarray]] = {}
+_latest_year: dict[str, int] = {}
+# 요청은 스레드 풀에서 동시에 실행되므로 캐시 dict 조회/교체는 이 잠금 안에서만 수행
+_cache_lock = threading.Lock()
+
+
+def _build_features(store: pd.DataFrame, year: int) -> tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+    """
+    추세 저장소에서 한 연도의 세출 항목별 우선순위 지표를 (교육청 × 학교급 × 항목) 행렬로 만듭니다.
+    지표는 같은 (학교급, 항목) 안에서 z-score 로 표준화합니다.
+    """
+    spending = store[(store["연도"] == year) & (store["세입세출"] == "세출") & (store["항목"] != PER_HEAD_COLUMN)]
+    if spending.empty:
+        raise FileNotFoundError(f"{year}년 세출 데이터가 없습니다.")
+
+    # 설립유형을 합쳐 (교육청, 학교급, 항목) 단위로 예산/결산 집계
+    totals = spending.pivot_table(index=RANK_KEYS, columns="예결산", values="합계", aggfunc="sum")
+    counts = spending[spending["예결산"] == "결산"].groupby(RANK_KEYS)["학교 수"].sum()
+    df = totals.reindex(columns=["예산", "결산"]).join(counts).reset_index()
+
+    office_total = df.groupby(["ATPT_OFCDC_ORG_NM", "학교급"])["결산"].transform("sum")
+    df["비중"] = df["결산"] / office_total
+
+    category_total = df.groupby(["학교급", "항목"])["결산"].transform("sum")
+    level_total = df.groupby("학교급")["결산"].transform("sum")
+    national_share = category_total / level_total
+    national_per_school = category_total / df.groupby(["학교급", "항목"])["학교 수"].transform("sum")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        df["비중_부족"] = national_share - df["비중"]
+        df["학교당_격차"] = (national_per_school - df["결산"] / df["학교 수"]) / national_per_school
+        df["미집행"] = 1 - df["결산"] / df["예산"]
+
+    raw = df[FEATURES].replace([np.inf, -np.inf], np.nan).fillna(0).to_numpy(dtype=float)
+
+    group = df.groupby(["학교급", "항목"])
+    mean = group[FEATURES].transform("mean").to_numpy(dtype=float)
+    std = group[FEATURES].transform("std", ddof=0).to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        standardized = np.where(std > 0, (raw - np.nan_to_num(mean)) / std, 0.0)
+
+    return df[RANK_KEYS + ["예산", "결산", "학교 수", "비중"]], raw, np.nan_to_num(standardized)
+
+
+def lookup_features(year: int | None) -> tuple[str, int, tuple | None]:
+    """
+    현재 추세 저장소 버전과 대상 연도(None 이면 최신 연도), 캐시된 지표 행렬(없으면 None)을 반환합니다.
+    """
+    version = read_current_version(TREND_TABLE_NAME)
+    if version is None:
+        raise FileNotFoundError("추세 저장소가 아직 게시되지 않았습니다.")
+
+    if year is None:
+        with _cache_lock:
+            year = _latest_year.get(version)
+        if year is None:
+            year = int(pc.max(load_arrow_table(TREND_TABLE_NAME)["연도"]).as_py())
+            with _cache_lock:
+                _latest_year[version] = year
+
+    with _cache_lock:
+        return version, year, _feature_cache.get((version, year))
+
+
+def build_features(version: str, year: int) -> tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+    """
+    해당 버전 저장소에서 한 연도의 지표 행렬을 계산합니다 (프로세스 풀에서 실행할 수 있도록 최상위 함수).
+    해당 연도 세출만 DataFrame 으로 변환하므로 저장소 전체를 워커 메모리로 복사하지 않습니다.
+    """
+    table = load_arrow_version(TREND_TABLE_NAME, version)
+    spending = table.filter((pc.field("연도") == year) & (pc.field("세입세출") == "세출"))
+    store = spending.to_pandas(split_blocks=True, self_destruct=True)
+    return _build_features(store, year)
+
+
+def store_features(version: str, year: int, features: tuple) -> None:
+    """
+    계산한 지표 행렬을 캐시합니다. 저장소가 다시 게시되면 이전 버전 캐시는 버립니다.
+    """
+    with _cache_lock:
+        for key in [key for key in _feature_cache if key[0] != version]:
+            del _feature_cache[key]
+        for key in [key for key in _latest_year if key != version]:
+            del _latest_year[key]
+        _feature_cache[(version, year)] = features
+
+
+def validate_rank_args(weights: dict | None, top_n: int) -> None:
+    if not 1 <= top_n <= MAX_TOP_N:
+        raise ValueError(f"top_n 은 1 이상 {MAX_TOP_N} 이하여야 합니다: {top_n}")
+    unknown = set(weights or {}) - set(FEATURES)
+    if unknown:
+        raise ValueError(f"알 수 없는 가중치 항목입니다: {sorted(unknown)} (사용 가능: {FEATURES})")
+
+
+def rank_features(
+    year: int,
+    features: tuple,
+    weights: dict | None = None,
+    top_n: int = 10,
+    level: str | None = None
+) -> pd.DataFrame:
+    """
+    지표 행렬에 가중치를 곱해 점수를 매기고 상위 top_n 개를 반환합니다 (행렬곱과 부분 정렬만 수행).
+    """
+    validate_rank_args(weights, top_n)
+    keys_df, raw, standardized = features
+    weight_vector = np.array([{**DEFAULT_WEIGHTS, **(weights or {})}[name] for name in FEATURES], dtype=float)
+    scores = standardized @ weight_vector
+
+    candidates = np.arange(len(scores))
+    if level is not None:
+        candidates = candidates[keys_df["학교급"].to_numpy() == level]
+    if candidates.size == 0:
+        return pd.DataFrame(columns=["순위"] + RANK_KEYS + ["점수"] + FEATURES)
+
+    # 전체 정렬 대신 상위 top_n 만 골라 정렬
+    top_n = min(top_n, candidates.size)
+    top = candidates[np.argpartition(-scores[candidates], top_n - 1)[:top_n]]
+    top = top[np.argsort(-scores[top], kind="stable")]
+
+    result = keys_df.iloc[top].reset_index(drop=True)
+    result.insert(0, "순위", np.arange(1, top_n + 1))
+    result["점수"] = scores[top]
+    result[FEATURES] = raw[top]
+    result["연도"] = year
+    return result
+
+
+def rank_priorities(
+    year: int | None = None,
+    weights: dict | None = None,
+    top_n: int = 10,
+    level: str | None = None
+) -> pd.DataFrame:
+    """
+    (교육청 × 학교급 × 항목)의 복합 우선순위 점수를 계산하고 상위 top_n 개를 반환합니다.
+    지표 행렬은 캐시되므로 가중치만 바꾼 what-if 요청은 행렬곱과 부분 정렬만 수행합니다.
+
+    Args:
+        year (int | None): 대상 연도 (None 이면 최신 연도)
+        weights (dict | None): 지표별 가중치 (없는 지표는 DEFAULT_WEIGHTS 사용)
+        top_n (int): 반환할 개수 (1 ~ MAX_TOP_N)
+        level (str | None): 특정 학교급만 순위 매길 때 지정
+
+    Returns:
+        pd.DataFrame: 순위, 키, 점수, 원 지표 값
+    """
+    validate_rank_args(weights, top_n)
+    version, year, features = lookup_features(year)
+    if features is None:
+        features = build_features(version, year)
+        store_features(version, year, features)
+    return rank_features(year, features, weights, top_n, level)
@@ -0,0 +1,45 @@
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# CPU 작업(집계, 정렬, 차트 렌더링)이 함께 쓰는 프로세스 풀.
+# 요청 처리용 풀과 렌더링용 풀을 따로 두면 두 풀의 워커 수 합이 코어 수를 넘으므로 한 풀(한 예산)로 관리합니다.
+CPU_MAX_WORKERS = int(os.environ.get("EDUDATA_CPU_WORKERS", max(1, (os.cpu_count() or 2) - 1)))
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    공유 프로세스 풀 (한 번 만들어 재사용). 서버 스레드에서 fork 하지 않도록 spawn 사용.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=CPU_MAX_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def replace_broken_pool(broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+    """
+    워커가 비정상 종료되어 BrokenProcessPool 이 된 풀을 새 풀로 교체합니다.
+    여러 요청이 동시에 같은 풀의 고장을 알려도 한 번만 교체합니다.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+            broken.shutdown(wait=False, cancel_futures=True)
+    print("⚠️ 프로세스 풀 워커가 종료되어 풀을 다시 만듭니다.")
+    return get_process_pool()
+
+
+def shutdown_process_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
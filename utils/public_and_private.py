@@ -1,7 +1,7 @@
 import os
 import pandas as pd
 
-def merge_common_csv_rows(public_dir: str, private_dir: str, output_dir: str):
+def merge_common_csv_rows(public_dir: str, private_dir: str, output_dir: str, chunksize: int | None = None):
     """
     공립과 사립 CSV 파일에서 앞부분(공립/사립)을 제외한 동일한 파일명을 기준으로 행 데이터를 병합하여 저장합니다.
     
@@ -9,6 +9,7 @@ def merge_common_csv_rows(public_dir: str, private_dir: str, output_dir: str):
         public_dir (str): 공립 CSV가 들어있는 폴더
         private_dir (str): 사립 CSV가 들어있는 폴더
         output_dir (str): 병합된 CSV를 저장할 폴더
+        chunksize (int | None): 지정하면 청크 단위로 읽어 바로 이어 쓰므로 전체 파일을 메모리에 올리지 않습니다
     """
     os.makedirs(output_dir, exist_ok=True)
 
@@ -27,6 +28,10 @@ def merge_common_csv_rows(public_dir: str, private_dir: str, output_dir: str):
     collect_files(private_dir, "사립")
 
     for short_name, paths in file_map.items():
+        if chunksize is not None:
+            _append_csv_chunks(paths, os.path.join(output_dir, short_name), chunksize)
+            continue
+
         dfs = []
         for path in paths:
             try:
@@ -43,6 +48,42 @@ def merge_common_csv_rows(public_dir: str, private_dir: str, output_dir: str):
 
     print("🎉 모든 병합 완료")
 
+def _append_csv_chunks(paths: list[str], output_path: str, chunksize: int) -> None:
+    """
+    여러 CSV를 chunksize 행씩 읽어 하나의 CSV로 이어 씁니다.
+    pd.concat 과 같은 결과가 되도록 모든 파일의 컬럼 합집합을 먼저 구해 각 청크를 맞춥니다.
+    """
+    columns = []
+    readable = []
+    for path in paths:
+        try:
+            header = pd.read_csv(path, nrows=0).columns
+        except Exception as e:
+            print(f"⚠️ {path} 읽기 실패: {e}")
+            continue
+        columns += [col for col in header if col not in columns]
+        readable.append(path)
+
+    if not readable:
+        return
+
+    tmp_path = output_path + ".tmp"
+    wrote_header = False
+    try:
+        for path in readable:
+            for chunk in pd.read_csv(path, chunksize=chunksize):
+                chunk.reindex(columns=columns).to_csv(
+                    tmp_path, mode="a" if wrote_header else "w", header=not wrote_header,
+                    index=False, encoding="utf-8-sig"
+                )
+                wrote_header = True
+        os.replace(tmp_path, output_path)
+    finally:
+        # 읽기 도중 실패하면 쓰다 만 임시 파일을 남기지 않음
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    print(f"✅ 병합 저장(청크): {output_path}")
+
 def main():
     merge_common_csv_rows(
         public_dir="Database/schoolinfo/public_csv",
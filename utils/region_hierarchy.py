@@ -0,0 +1,212 @@
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from utils.add_region_info import (
+    extract_region_hierarchy_mapping, REGION_HIERARCHY_MAPPING_PATH, SUPPORT_OFFICE_COLUMN, SIGUNGU_CODE_COLUMN, SIGUNGU_NAME_COLUMN, UNKNOWN_REGION
+)
+from utils.arrow_store import publish_arrow_table, load_arrow_table
+from utils.schema_registry import PER_HEAD_COLUMN, build_catalog, read_projected
+
+REGION_HIERARCHY_TABLE = "region_hierarchy"
+
+# 집계 단위: 전국 → 시도 → 지원청 → 학교 (시군구는 학교에서 바로 올린 시도 하위 단위)
+GEO_LEVELS = ["전국", "시도", "지원청", "시군구", "학교"]
+
+# 단위별 지역 이름 컬럼
+LEVEL_NAME_COLUMNS = {
+    "전국": None,
+    "시도": "ATPT_OFCDC_ORG_NM",
+    "지원청": SUPPORT_OFFICE_COLUMN,
+    "시군구": SIGUNGU_NAME_COLUMN,
+    "학교": "SCHUL_NM"
+}
+
+DIMENSIONS = ["연도", "예결산", "세입세출", "학교급"]
+GEO_COLUMNS = ["ATPT_OFCDC_ORG_NM", SUPPORT_OFFICE_COLUMN, SIGUNGU_CODE_COLUMN, SIGUNGU_NAME_COLUMN, "SCHUL_CODE", "SCHUL_NM"]
+MEASURES = ["합계", "학교 수"]
+
+# 히트맵 행 한도 (행당 0.4인치 × 150dpi 로 그리므로 이미지 높이 한도 2^16 픽셀보다 충분히 작게)
+HEATMAP_MAX_ROWS = 300
+
+
+def _load_school_rows(csv_folder_path: str, mapping: pd.DataFrame) -> pd.DataFrame:
+    """
+    예결산 CSV를 학교 × 항목 long 형식으로 읽고 지역 계층 정보를 붙입니다.
+    매핑에 없는 학교는 시도교육청을 지원청으로, 시군구는 '미상'으로 둡니다.
+    """
+    geo = mapping.drop(columns=["SCHUL_NM", "ATPT_OFCDC_ORG_NM"], errors="ignore").set_index("SCHUL_CODE")
+
+    frames = []
+    for meta in build_catalog(csv_folder_path):
+        if meta.year is None or meta.level is None or meta.budget_type is None or meta.flow is None:
+            continue
+        df = read_projected(meta, id_columns=["SCHUL_CODE", "SCHUL_NM", "ATPT_OFCDC_ORG_NM"])
+        df["SCHUL_CODE"] = df["SCHUL_CODE"].astype(str)
+        df = df.drop_duplicates(subset="SCHUL_CODE").join(geo, on="SCHUL_CODE")
+
+        long_df = df.melt(
+            id_vars=["SCHUL_CODE", "SCHUL_NM", "ATPT_OFCDC_ORG_NM", SUPPORT_OFFICE_COLUMN, SIGUNGU_CODE_COLUMN, SIGUNGU_NAME_COLUMN],
+            var_name="항목", value_name="합계"
+        ).dropna(subset=["합계"])
+        long_df["연도"] = meta.year
+        long_df["예결산"] = meta.budget_type
+        long_df["세입세출"] = meta.flow
+        long_df["학교급"] = meta.level
+        frames.append(long_df)
+
+    if not frames:
+        raise FileNotFoundError(f"{csv_folder_path}에 예결산 파일이 없습니다.")
+
+    school = pd.concat(frames, ignore_index=True)
+    school[SUPPORT_OFFICE_COLUMN] = school[SUPPORT_OFFICE_COLUMN].fillna(school["ATPT_OFCDC_ORG_NM"])
+    school[[SIGUNGU_CODE_COLUMN, SIGUNGU_NAME_COLUMN]] = school[[SIGUNGU_CODE_COLUMN, SIGUNGU_NAME_COLUMN]].fillna(UNKNOWN_REGION)
+    school["학교 수"] = 1
+    return school
+
+
+def build_region_hierarchy(
+    csv_folder_path: str = "Database/schoolinfo/combined_csv",
+    mapping_path: str = REGION_HIERARCHY_MAPPING_PATH
+) -> pd.DataFrame:
+    """
+    학교 단위 예결산을 전국 → 시도 → 지원청 → 학교 계층으로 한 번에 집계하여 Arrow 저장소에 게시합니다.
+    각 단위는 바로 아래 단위의 합계에서 올려 계산하므로(지원청 → 시도 → 전국) 학교 데이터는 한 번만 집계됩니다.
+    시군구는 학교 합계에서 올린 시도 하위 단위로 함께 저장합니다.
+
+    Args:
+        csv_folder_path (str): 예결산 CSV 폴더
+        mapping_path (str): extract_region_hierarchy_mapping 으로 만든 학교별 지역 계층 CSV
+
+    Returns:
+        pd.DataFrame: 단위, 차원(연도/예결산/세입세출/학교급), 지역 컬럼, 항목, 합계, 학교 수 (long 형식)
+    """
+    if os.path.exists(mapping_path):
+        mapping = pd.read_csv(mapping_path, dtype={"SCHUL_CODE": str, SIGUNGU_CODE_COLUMN: str})
+    else:
+        print(f"⚠️ 지역 계층 매핑 없음: {mapping_path} (지원청=시도교육청, 시군구=미상으로 집계)")
+        mapping = pd.DataFrame(columns=["SCHUL_CODE", SUPPORT_OFFICE_COLUMN, SIGUNGU_CODE_COLUMN, SIGUNGU_NAME_COLUMN])
+
+    school = _load_school_rows(csv_folder_path, mapping)
+
+    support = school.groupby(DIMENSIONS + ["ATPT_OFCDC_ORG_NM", SUPPORT_OFFICE_COLUMN, "항목"], as_index=False)[MEASURES].sum()
+    sido = support.groupby(DIMENSIONS + ["ATPT_OFCDC_ORG_NM", "항목"], as_index=False)[MEASURES].sum()
+    nation = sido.groupby(DIMENSIONS + ["항목"], as_index=False)[MEASURES].sum()
+    sigungu = school.groupby(
+        DIMENSIONS + ["ATPT_OFCDC_ORG_NM", SIGUNGU_CODE_COLUMN, SIGUNGU_NAME_COLUMN, "항목"], as_index=False
+    )[MEASURES].sum()
+
+    levels = {"전국": nation, "시도": sido, "지원청": support, "시군구": sigungu, "학교": school}
+    hierarchy = pd.concat(
+        [df.assign(단위=level) for level, df in levels.items()], ignore_index=True
+    ).reindex(columns=["단위"] + DIMENSIONS + GEO_COLUMNS + ["항목"] + MEASURES)
+    hierarchy[GEO_COLUMNS] = hierarchy[GEO_COLUMNS].astype("string")
+
+    publish_arrow_table(hierarchy, REGION_HIERARCHY_TABLE)
+    print(f"✅ 지역 계층 집계 게시 완료: 학교 {school['SCHUL_CODE'].nunique()}개, 지원청 {support[SUPPORT_OFFICE_COLUMN].nunique()}개")
+    return hierarchy
+
+
+def query_region_level(
+    level: str,
+    year: int,
+    budget_type: str = "결산",
+    flow: str = "세출",
+    school_level: str | None = None,
+    parent: str | None = None
+) -> pd.DataFrame:
+    """
+    계층 저장소에서 한 단위(전국/시도/지원청/시군구/학교)의 항목별 합계를 조회합니다.
+
+    Args:
+        level (str): GEO_LEVELS 중 하나
+        year (int): 연도
+        budget_type (str): "예산" 또는 "결산"
+        flow (str): "세입" 또는 "세출"
+        school_level (str | None): 학교급 (None 이면 학교급 합산)
+        parent (str | None): 상위 지역 이름 (시도교육청 또는 교육지원청) - 해당 지역 하위만 조회
+
+    Returns:
+        pd.DataFrame: 지역, 항목, 합계, 학교 수, 학교당 평균, 비중 (+ 상위 지역 컬럼)
+    """
+    if level not in GEO_LEVELS:
+        raise ValueError(f"알 수 없는 단위입니다: {level} (사용 가능: {GEO_LEVELS})")
+
+    table = load_arrow_table(REGION_HIERARCHY_TABLE)
+    mask = pc.and_(
+        pc.and_(pc.equal(table["단위"], level), pc.equal(table["연도"], pa.scalar(year, table.schema.field("연도").type))),
+        pc.and_(pc.equal(table["예결산"], budget_type), pc.equal(table["세입세출"], flow))
+    )
+    if school_level is not None:
+        mask = pc.and_(mask, pc.equal(table["학교급"], school_level))
+    if parent is not None:
+        mask = pc.and_(mask, pc.or_kleene(
+            pc.equal(table["ATPT_OFCDC_ORG_NM"], parent), pc.equal(table[SUPPORT_OFFICE_COLUMN], parent)
+        ))
+    df = table.filter(mask).to_pandas()
+    if df.empty:
+        raise FileNotFoundError(f"{year}년 {budget_type}_{flow} {level} 단위 데이터가 없습니다.")
+
+    # 학교급 합산 (학교 수는 학교급별 학교가 겹치지 않으므로 그대로 더함)
+    name_column = LEVEL_NAME_COLUMNS[level]
+    keys = [column for column in GEO_COLUMNS if df[column].notna().any()]
+    df = df.groupby(keys + ["항목"], as_index=False, dropna=False)[MEASURES].sum()
+    # 지역 이름은 겹칠 수 있으므로 구분 정보를 붙임 (학교: 코드, 시군구 미상: 시도)
+    if level == "학교":
+        label = df["SCHUL_NM"] + " (" + df["SCHUL_CODE"] + ")"
+    elif level == "시군구":
+        label = df[name_column].where(df[name_column] != UNKNOWN_REGION, df["ATPT_OFCDC_ORG_NM"] + " " + UNKNOWN_REGION)
+        # 매핑을 만든 시점이 달라 같은 이름이 여러 코드에 붙은 경우 코드로 구분
+        shared = df.groupby(label)[SIGUNGU_CODE_COLUMN].transform("nunique") > 1
+        label = label.where(~shared, label + " (" + df[SIGUNGU_CODE_COLUMN] + ")")
+    else:
+        label = df[name_column] if name_column else "전국"
+    df.insert(0, "지역", label)
+
+    df["학교당 평균"] = df["합계"] / df["학교 수"]
+    # 1인당 세출은 합계가 아니라 학교 평균으로만 의미가 있으므로 비중 계산에서 제외
+    amounts = df["합계"].where(df["항목"] != PER_HEAD_COLUMN)
+    df["비중"] = amounts / amounts.groupby(df["지역"]).transform("sum")
+    return df
+
+
+def region_heatmap_matrix(level: str, year: int, value: str = "비중", max_rows: int = HEATMAP_MAX_ROWS, **filters) -> pd.DataFrame:
+    """
+    한 단위의 지역 × 항목 행렬 (히트맵 입력).
+    값은 지역별 합계와 학교 수에서 다시 계산합니다 (학교당 평균을 더하면 평균이 아니게 됨).
+
+    Args:
+        value (str): "비중", "학교당 평균", "합계" 중 하나
+        max_rows (int): 행(지역) 수 한도 - 넘으면 ValueError (parent 로 범위를 좁혀 요청)
+        filters: query_region_level 인자 (budget_type, flow, school_level, parent)
+    """
+    if value not in ("비중", "학교당 평균", "합계"):
+        raise ValueError(f"알 수 없는 값입니다: {value}")
+
+    df = query_region_level(level, year, **filters)
+    if value != "학교당 평균":
+        df = df[df["항목"] != PER_HEAD_COLUMN]
+
+    grouped = df.groupby(["지역", "항목"])[MEASURES].sum()
+    if grouped.index.get_level_values("지역").nunique() > max_rows:
+        raise ValueError(
+            f"{level} 단위 지역이 {max_rows}개를 넘어 히트맵으로 그릴 수 없습니다. parent 로 상위 지역을 지정하세요."
+        )
+
+    if value == "학교당 평균":
+        values = grouped["합계"] / grouped["학교 수"]
+    elif value == "비중":
+        values = grouped["합계"] / grouped["합계"].groupby(level="지역").transform("sum")
+    else:
+        values = grouped["합계"]
+    return values.unstack("항목").fillna(0)
+
+
+def main():
+    extract_region_hierarchy_mapping(["Database/schoolinfo/public", "Database/schoolinfo/private"])
+    build_region_hierarchy()
+
+
+if __name__ == "__main__":
+    main()
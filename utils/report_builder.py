@@ -0,0 +1,353 @@
+import os
+import io
+import json
+import base64
+import hashlib
+import html
+import time
+import tempfile
+import importlib.util
+from dataclasses import dataclass, field
+from concurrent.futures.process import BrokenProcessPool
+import pandas as pd
+
+from utils.process_pool import get_process_pool, replace_broken_pool
+
+REPORT_DIR = "Database/report"
+ARTIFACT_DIR = os.path.join(REPORT_DIR, "artifacts")
+
+# 렌더러 결과 형식이 바뀌면 올려서 이전 산출물을 무효화
+RENDERER_VERSION = 1
+
+# 입력이 바뀐 섹션은 새 해시로 저장되므로, 마지막으로 사용한 지 이 기간이 지난 산출물은 정리
+ARTIFACT_RETENTION_SECONDS = 7 * 24 * 3600
+# 정리는 산출물 폴더 전체를 훑으므로 보고서 생성 때 이 간격마다 한 번만 실행
+ARTIFACT_PRUNE_INTERVAL = 3600
+_last_prune = 0.0
+
+CHART_KINDS = ("piechart", "heatmap", "wordcloud")
+
+_KOREAN_FONTS = ["NanumGothic", "Malgun Gothic", "AppleGothic", "Noto Sans CJK KR"]
+
+
+@dataclass(frozen=True)
+class ReportSection:
+    """
+    보고서 구성 요소 하나.
+    - kind: "piechart", "heatmap", "wordcloud", "table", "text"
+    - data: 렌더링 입력 (JSON 직렬화 가능해야 하며, 이 값의 해시로 산출물을 재사용)
+    """
+    name: str
+    kind: str
+    title: str
+    data: dict = field(default_factory=dict, hash=False)
+
+    def input_hash(self) -> str:
+        payload = json.dumps(
+            {"kind": self.kind, "data": self.data, "version": RENDERER_VERSION},
+            ensure_ascii=False, sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+_worker_ready = False
+
+
+def _init_worker() -> None:
+    """
+    프로세스 풀 워커 초기화: 비대화형 백엔드와 설치된 한글 폰트를 지정합니다.
+    풀은 다른 CPU 작업과 공유하므로 워커마다 첫 렌더링 때 한 번만 실행합니다.
+    """
+    global _worker_ready
+    if _worker_ready:
+        return
+    _worker_ready = True
+    import matplotlib
+    matplotlib.use("Agg")
+    from matplotlib import font_manager, rcParams
+
+    installed = {font.name for font in font_manager.fontManager.ttflist}
+    korean = [name for name in _KOREAN_FONTS if name in installed]
+    if korean:
+        rcParams["font.family"] = korean[0]
+    rcParams["axes.unicode_minus"] = False
+
+
+def _figure_to_png(fig) -> bytes:
+    import matplotlib.pyplot as plt
+
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=150, bbox_inches="tight")
+    plt.close(fig)
+    return buffer.getvalue()
+
+
+def render_piechart(data: dict) -> bytes:
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(6, 6))
+    ax.pie(data["values"], labels=data["labels"], autopct="%1.1f%%", startangle=90, counterclock=False)
+    ax.axis("equal")
+    return _figure_to_png(fig)
+
+
+def render_heatmap(data: dict) -> bytes:
+    import matplotlib.pyplot as plt
+
+    rows, columns = data["rows"], data["columns"]
+    fig, ax = plt.subplots(figsize=(max(6, len(columns) * 0.9), max(4, len(rows) * 0.4)))
+    image = ax.imshow(data["values"], cmap="YlOrRd", aspect="auto")
+    ax.set_xticks(range(len(columns)), labels=columns, rotation=45, ha="right")
+    ax.set_yticks(range(len(rows)), labels=rows)
+    fig.colorbar(image, ax=ax)
+    return _figure_to_png(fig)
+
+
+def render_wordcloud(data: dict) -> bytes:
+    frequencies = data["frequencies"]
+    try:
+        from wordcloud import WordCloud
+    except ImportError:  # wordcloud 미설치 시 상위 키워드 막대그래프로 대체
+        import matplotlib.pyplot as plt
+
+        top = sorted(frequencies.items(), key=lambda item: item[1], reverse=True)[:20][::-1]
+        fig, ax = plt.subplots(figsize=(6, max(3, len(top) * 0.3)))
+        ax.barh([word for word, _ in top], [count for _, count in top])
+        return _figure_to_png(fig)
+
+    from matplotlib import font_manager, rcParams
+
+    font_path = font_manager.findfont(rcParams["font.family"][0]) if rcParams["font.family"] else None
+    cloud = WordCloud(width=800, height=400, background_color="white", font_path=font_path)
+    buffer = io.BytesIO()
+    cloud.generate_from_frequencies(frequencies).to_image().save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def render_table(data: dict) -> bytes:
+    df = pd.DataFrame(data["rows"], columns=data["columns"])
+    return df.to_html(index=False, na_rep="-", float_format=lambda v: f"{v:,.2f}").encode("utf-8")
+
+
+def render_text(data: dict) -> bytes:
+    paragraphs = [f"<p>{html.escape(line)}</p>" for line in data["text"].splitlines() if line.strip()]
+    return "\n".join(paragraphs).encode("utf-8")
+
+
+RENDERERS = {
+    "piechart": render_piechart,
+    "heatmap": render_heatmap,
+    "wordcloud": render_wordcloud,
+    "table": render_table,
+    "text": render_text,
+}
+
+
+def render_section(kind: str, data: dict) -> bytes:
+    """
+    섹션 하나를 렌더링합니다 (차트는 프로세스 풀 워커에서 실행되므로 모듈 최상위 함수로 둠).
+    """
+    if kind in CHART_KINDS:
+        _init_worker()
+    return RENDERERS[kind](data)
+
+
+def _artifact_path(section: ReportSection) -> str:
+    extension = "png" if section.kind in CHART_KINDS else "html"
+    return os.path.join(ARTIFACT_DIR, f"{section.input_hash()}.{extension}")
+
+
+def _save_artifact(path: str, content: bytes) -> None:
+    # 같은 산출물을 여러 요청/워커가 동시에 쓸 수 있으므로 임시 파일은 쓰는 쪽마다 따로 만들고 rename 으로 교체
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _touch_artifact(path: str) -> bool:
+    """
+    재사용할 산출물의 수정 시각을 지금으로 바꿔 prune_artifacts 가 지우지 않도록 합니다 (산출물이 없으면 False).
+    """
+    try:
+        os.utime(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+
+def prune_artifacts(max_age_seconds: float = ARTIFACT_RETENTION_SECONDS) -> int:
+    """
+    마지막으로 사용한 지 max_age_seconds 가 지난 산출물(과 실패한 쓰기가 남긴 임시 파일)을 지웁니다.
+
+    Returns:
+        int: 지운 파일 수
+    """
+    if not os.path.isdir(ARTIFACT_DIR):
+        return 0
+
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    for entry in os.scandir(ARTIFACT_DIR):
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+        except OSError:
+            # 다른 요청이 먼저 지웠거나 (Windows) 읽는 중인 파일은 다음 정리 때 다시 시도
+            continue
+    if removed:
+        print(f"✅ 오래된 보고서 산출물 {removed}개 정리")
+    return removed
+
+
+def _prune_artifacts_periodically() -> None:
+    global _last_prune
+    now = time.time()
+    if now - _last_prune < ARTIFACT_PRUNE_INTERVAL:
+        return
+    _last_prune = now
+    prune_artifacts()
+
+
+def pdf_available() -> bool:
+    """
+    PDF 생성에 필요한 weasyprint 가 설치되어 있는지 확인합니다 (요청을 처리하기 전에 확인하는 용도).
+    """
+    return importlib.util.find_spec("weasyprint") is not None
+
+
+def plan_sections(sections: list[ReportSection]) -> tuple[dict, list[tuple[ReportSection, str]]]:
+    """
+    입력 해시가 같은 산출물이 있으면 재사용(마지막 사용 시각 갱신)하고, 표/텍스트는 바로 렌더링합니다.
+
+    Returns:
+        tuple: ({섹션 이름: (산출물 경로, 재사용 여부)}, 새로 렌더링할 차트 [(섹션, 산출물 경로)])
+    """
+    os.makedirs(ARTIFACT_DIR, exist_ok=True)
+
+    results = {}
+    charts = []
+    for section in sections:
+        if section.kind not in RENDERERS:
+            raise ValueError(f"알 수 없는 섹션 종류입니다: {section.kind}")
+
+        path = _artifact_path(section)
+        if _touch_artifact(path):
+            results[section.name] = (path, True)
+        elif section.kind in CHART_KINDS:
+            charts.append((section, path))
+        else:
+            _save_artifact(path, render_section(section.kind, section.data))
+            results[section.name] = (path, False)
+    return results, charts
+
+
+def save_rendered_charts(charts: list[tuple[ReportSection, str]], contents: list[bytes]) -> dict:
+    """
+    plan_sections 가 돌려준 차트의 렌더링 결과를 산출물로 저장합니다.
+
+    Returns:
+        dict: {섹션 이름: (산출물 경로, False)}
+    """
+    results = {}
+    for (section, path), content in zip(charts, contents):
+        _save_artifact(path, content)
+        results[section.name] = (path, False)
+    return results
+
+
+def render_sections(sections: list[ReportSection]) -> dict:
+    """
+    서버 밖(스크립트)에서 쓰는 동기 렌더링: 바뀐 차트만 공유 프로세스 풀(utils.process_pool)에서 병렬로 렌더링합니다.
+    서버에서는 실행 한도와 우선순위를 지키도록 App.report.report_render.render_report_sections 를 사용합니다.
+
+    Returns:
+        dict: {섹션 이름: (산출물 경로, 재사용 여부)}
+    """
+    results, charts = plan_sections(sections)
+
+    pool = get_process_pool()
+    futures = [pool.submit(render_section, section.kind, section.data) for section, _ in charts]
+    contents = []
+    for (section, _), future in zip(charts, futures):
+        try:
+            contents.append(future.result())
+        except BrokenProcessPool:
+            # 워커가 비정상 종료되면 풀을 새로 만들고 남은 차트는 새 풀에서 다시 렌더링
+            pool = replace_broken_pool(pool)
+            contents.append(pool.submit(render_section, section.kind, section.data).result())
+
+    results.update(save_rendered_charts(charts, contents))
+    return results
+
+
+def build_report(
+    title: str,
+    sections: list[ReportSection],
+    output_name: str,
+    pdf: bool = False,
+    rendered: dict | None = None
+) -> dict:
+    """
+    섹션들을 렌더링하여 하나의 HTML(선택적으로 PDF) 보고서로 조립합니다.
+
+    Args:
+        title (str): 보고서 제목
+        sections (list[ReportSection]): 보고서 순서대로의 섹션 목록
+        output_name (str): 저장 파일 이름 (확장자 제외, 예: "monthly_2025_04")
+        pdf (bool): PDF도 생성할지 여부 (weasyprint 필요, 없으면 pdf_available() 로 먼저 확인)
+        rendered (dict | None): 이미 렌더링한 결과 (render_sections 형식, 없으면 여기서 렌더링)
+
+    Returns:
+        dict: 생성된 파일 경로와 섹션별 재사용 여부
+    """
+    if rendered is None:
+        rendered = render_sections(sections)
+
+    body = [f"<h1>{html.escape(title)}</h1>"]
+    for section in sections:
+        path, _ = rendered[section.name]
+        with open(path, "rb") as f:
+            content = f.read()
+        body.append(f"<section id=\"{html.escape(section.name)}\"><h2>{html.escape(section.title)}</h2>")
+        if section.kind in CHART_KINDS:
+            encoded = base64.b64encode(content).decode("ascii")
+            body.append(f"<img src=\"data:image/png;base64,{encoded}\" alt=\"{html.escape(section.title)}\">")
+        else:
+            body.append(content.decode("utf-8"))
+        body.append("</section>")
+
+    document = (
+        "<!DOCTYPE html><html lang=\"ko\"><head><meta charset=\"utf-8\">"
+        f"<title>{html.escape(title)}</title>"
+        "<style>body{font-family:sans-serif;max-width:960px;margin:auto}img{max-width:100%}"
+        "table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:2px 6px}</style>"
+        f"</head><body>{''.join(body)}</body></html>"
+    )
+
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    html_path = os.path.join(REPORT_DIR, f"{output_name}.html")
+    _save_artifact(html_path, document.encode("utf-8"))
+    result = {
+        "html": html_path,
+        "sections": {name: {"reused": reused} for name, (_, reused) in rendered.items()}
+    }
+
+    if pdf:
+        try:
+            from weasyprint import HTML
+        except ImportError:
+            raise RuntimeError("PDF 생성을 위해서는 weasyprint 패키지가 필요합니다.")
+        pdf_path = os.path.join(REPORT_DIR, f"{output_name}.pdf")
+        HTML(string=document).write_pdf(pdf_path)
+        result["pdf"] = pdf_path
+
+    print(f"✅ 보고서 생성 완료: {html_path}")
+    _prune_artifacts_periodically()
+    return result
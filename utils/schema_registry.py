@@ -0,0 +1,177 @@
+import os
+import re
+from dataclasses import dataclass
+import pandas as pd
+
+# AMT 컬럼 → 항목명 매핑 (학교알리미 예결산서 API 기준)
+세입_amt_column_map = {
+    "AMT1": "정부이전수입",
+    "AMT2": "기타이전수입",
+    "AMT3": "학부모부담수입",
+    "AMT4": "미사용",
+    "AMT5": "행정활동수입",
+    "AMT6": "기타"
+}
+
+세출_amt_column_map = {
+    "AMT1": "인적자원_운용",
+    "AMT2": "학생복지_교육격차해소",
+    "AMT3": "기본적_교육활동",
+    "AMT4": "선택적_교육활동",
+    "AMT5": "교육활동_지원",
+    "AMT6": "학교_일반운영",
+    "AMT7": "학교_시설확충",
+    "AMT8": "학교_재무활동",
+    "YESAN_PER_HEAD": "1인당 평균 세출"
+}
+
+AMT_COLUMN_MAPS = {"세입": 세입_amt_column_map, "세출": 세출_amt_column_map}
+
+PER_HEAD_COLUMN = "1인당 평균 세출"
+
+ID_COLUMNS = ["SCHUL_CODE", "SCHUL_NM", "ATPT_OFCDC_ORG_NM", "FOND_SC_CODE"]
+
+_SCHOOL_TYPES = ("공립", "사립")
+_LEVELS = ("초등", "중등", "고등")
+_BUDGET_TYPES = ("예산", "결산")
+_FLOWS = ("세입", "세출")
+_YEAR_PATTERN = re.compile(r"^\d{4}$")
+
+
+@dataclass(frozen=True)
+class FileMeta:
+    """
+    예결산 파일 하나의 메타데이터.
+    파일명 예: '경기도교육청_공립_고등_결산_세입_2022.csv', '고등_결산_세입_2022.csv'
+    """
+    path: str
+    filename: str
+    year: int | None
+    level: str | None
+    budget_type: str | None
+    flow: str | None
+    school_type: str | None
+    office: str | None
+
+    @property
+    def amt_map(self) -> dict:
+        return AMT_COLUMN_MAPS.get(self.flow, {})
+
+
+def parse_file_meta(path: str) -> FileMeta:
+    """
+    파일명을 '_' 단위로 한 번만 나눠 연도, 학교급, 예산/결산, 세입/세출, 공립/사립, 교육청을 추출합니다.
+    """
+    filename = os.path.basename(path)
+    tokens = os.path.splitext(filename)[0].split("_")
+
+    def pick(candidates):
+        return next((t for t in tokens if t in candidates), None)
+
+    year = next((int(t) for t in tokens if _YEAR_PATTERN.match(t)), None)
+    office = next((t for t in tokens if t.endswith("교육청")), None)
+
+    return FileMeta(
+        path=path,
+        filename=filename,
+        year=year,
+        level=pick(_LEVELS),
+        budget_type=pick(_BUDGET_TYPES),
+        flow=pick(_FLOWS),
+        school_type=pick(_SCHOOL_TYPES),
+        office=office
+    )
+
+
+# {폴더: (파일 목록 서명, 카탈로그)}
+_catalog_cache: dict[str, tuple[tuple, list[FileMeta]]] = {}
+
+
+def _folder_signature(folder_path: str, extension: str) -> tuple:
+    """
+    폴더 안 대상 파일들의 (이름, mtime_ns, 크기) 목록.
+    폴더 mtime 만 보면 mtime 해상도가 낮은 파일시스템이나 덮어쓰기(같은 이름)에서 변경을 놓칠 수 있으므로 파일별로 확인합니다.
+    """
+    signature = []
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if entry.name.endswith(extension) and entry.is_file():
+                stat = entry.stat()
+                signature.append((entry.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(signature))
+
+
+def build_catalog(folder_path: str, extension: str = ".csv") -> list[FileMeta]:
+    """
+    폴더 내 파일들의 메타데이터 카탈로그를 만듭니다.
+    파일 목록과 각 파일의 mtime/크기가 그대로면 이전에 만든 카탈로그를 재사용합니다.
+
+    Args:
+        folder_path (str): 예결산 파일 폴더
+        extension (str): 대상 확장자 (".csv" 또는 ".json")
+
+    Returns:
+        list[FileMeta]: 파일명 순으로 정렬된 메타데이터 목록
+    """
+    cache_key = os.path.join(os.path.abspath(folder_path), extension)
+    signature = _folder_signature(folder_path, extension)
+    cached = _catalog_cache.get(cache_key)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    catalog = [parse_file_meta(os.path.join(folder_path, name)) for name, _, _ in signature]
+    _catalog_cache[cache_key] = (signature, catalog)
+    return catalog
+
+
+def query_catalog(
+    catalog: list[FileMeta],
+    budget_type: str | None = None,
+    flow: str | None = None,
+    years=None,
+    level: str | None = None,
+    school_type: str | None = None,
+    office: str | None = None
+) -> list[FileMeta]:
+    """
+    조건에 맞는 파일만 골라냅니다. 예) 2020~2024년 결산_세출:
+    query_catalog(catalog, budget_type="결산", flow="세출", years=range(2020, 2025))
+    """
+    year_set = None if years is None else {int(y) for y in years}
+    return [
+        meta for meta in catalog
+        if (budget_type is None or meta.budget_type == budget_type)
+        and (flow is None or meta.flow == flow)
+        and (year_set is None or meta.year in year_set)
+        and (level is None or meta.level == level)
+        and (school_type is None or meta.school_type == school_type)
+        and (office is None or meta.office == office)
+    ]
+
+
+def read_projected(meta: FileMeta, id_columns: list[str] | None = None, chunksize: int | None = None):
+    """
+    필요한 컬럼(ID + AMT)만 읽고 AMT 컬럼을 숫자로 변환해 항목명으로 바꿔 반환합니다.
+    헤더를 먼저 확인해 없는 컬럼은 건너뛰므로 파일마다 컬럼을 골라내는 과정이 필요 없습니다.
+
+    Args:
+        meta (FileMeta): 읽을 파일
+        id_columns (list[str] | None): 함께 읽을 식별 컬럼 (None 이면 ID_COLUMNS)
+        chunksize (int | None): 지정하면 청크 iterator 를 반환
+
+    Returns:
+        pd.DataFrame 또는 청크 iterator
+    """
+    id_columns = ID_COLUMNS if id_columns is None else id_columns
+    header = pd.read_csv(meta.path, nrows=0).columns
+    amt_map = {col: name for col, name in meta.amt_map.items() if col in header}
+    usecols = [col for col in id_columns if col in header] + list(amt_map)
+
+    def to_numeric(df: pd.DataFrame) -> pd.DataFrame:
+        # 숫자가 아닌 값이 섞인 AMT 컬럼도 float 로 계산할 수 있도록 숫자로 바꾸고 나머지는 NaN 처리
+        df[list(amt_map)] = df[list(amt_map)].apply(pd.to_numeric, errors="coerce")
+        return df.rename(columns=amt_map)
+
+    if chunksize is not None:
+        return (to_numeric(chunk) for chunk in pd.read_csv(meta.path, usecols=usecols, chunksize=chunksize))
+    return to_numeric(pd.read_csv(meta.path, usecols=usecols))
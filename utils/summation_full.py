@@ -1,6 +1,10 @@
 import os
+import numpy as np
 import pandas as pd
-import re
+
+from utils.schema_registry import PER_HEAD_COLUMN, build_catalog, query_catalog, read_projected
+from utils.weighted_stats import grouped_weighted_stats, summary_records
+
 
 def summarize_budget_means_from_csv_folder(folder_path: str, output_dir: str):
     """
@@ -16,102 +20,61 @@ def summarize_budget_means_from_csv_folder(folder_path: str, output_dir: str):
     # 폴더 이름에서 public/private 추출
     prefix = os.path.basename(folder_path).replace("_csv", "")  # 예: private_csv → private
 
-    세출_amt_column_map = {
-        "AMT1": "인적자원_운용",
-        "AMT2": "학생복지_교육격차해소",
-        "AMT3": "기본적_교육활동",
-        "AMT4": "선택적_교육활동",
-        "AMT5": "교육활동_지원",
-        "AMT6": "학교_일반운영",
-        "AMT7": "학교_시설확충",
-        "AMT8": "학교_재무활동",
-        "YESAN_PER_HEAD": "1인당 평균 세출"
-    }
-
-    세입_amt_column_map = {
-        "AMT1": "정부이전수입",
-        "AMT2": "기타이전수입",
-        "AMT3": "학부모부담수입",
-        "AMT4": "미사용",
-        "AMT5": "행정활동수입",
-        "AMT6": "기타"
-    }
-
-    result_dict = {
-        "예산_세입": [],
-        "예산_세출": [],
-        "결산_세입": [],
-        "결산_세출": []
-    }
-
-    for filename in os.listdir(folder_path):
-        if not filename.endswith(".csv"):
-            continue
-
-        file_path = os.path.join(folder_path, filename)
-        df = pd.read_csv(file_path)
-
-        if "예산" in filename:
-            yosan_type = "예산"
-        elif "결산" in filename:
-            yosan_type = "결산"
-        else:
-            print(f"⚠️ 파일명에 '예산' 또는 '결산' 없음: {filename}")
-            continue
+    catalog = build_catalog(folder_path)
+    result_dict = {}
 
-        if "세입" in filename:
-            amt_map = 세입_amt_column_map
-            inout_type = "세입"
-        elif "세출" in filename:
-            amt_map = 세출_amt_column_map
-            inout_type = "세출"
-        else:
-            print(f"⚠️ 파일명에 '세입' 또는 '세출' 없음: {filename}")
-            continue
+    for budget_type in ["예산", "결산"]:
+        for flow in ["세입", "세출"]:
+            key = f"{budget_type}_{flow}"
+            # 학교 단위 값은 모았다가 가중 통계 커널로 한 번에 계산
+            result_dict[key] = [
+                (meta.filename, meta.level, read_projected(meta, id_columns=[]))
+                for meta in query_catalog(catalog, budget_type=budget_type, flow=flow)
+            ]
 
-        key = f"{yosan_type}_{inout_type}"
-        selected_cols = [col for col in amt_map if col in df.columns]
-
-        row = {"파일명": filename}
-        for col in selected_cols:
-            row[amt_map[col]] = df[col].mean()
-        row["평균합계"] = sum([row[amt_map[c]] for c in selected_cols])
-        
-        # 학교급 정보 추출
-        school_level_match = re.search(r"(초등|중등|고등)", filename)
-        row["학교급"] = school_level_match.group(1) if school_level_match else None
-        result_dict[key].append(row)
+    for meta in catalog:
+        if meta.budget_type is None or meta.flow is None:
+            print(f"⚠️ 파일명에 예산/결산 또는 세입/세출 정보 없음: {meta.filename}")
 
     # 저장
-    for key, records in result_dict.items():
-        if records:
+    for key, files in result_dict.items():
+        if files:
             output_filename = f"{prefix}_{key}_요약.csv"  # 여기서 prefix 추가됨!
             output_path = os.path.join(output_dir, output_filename)
-            # 평균 행 추가 (학교급별 및 전체)
-            school_level_frames = {"초등": [], "중등": [], "고등": []}
-            for record in result_dict[key]:
-                level = record.get("학교급")
-                if level in school_level_frames:
-                    school_level_frames[level].append(record)
-
-            avg_rows = []
-            for level, records in school_level_frames.items():
-                if records:
-                    df_level = pd.DataFrame(records)
-                    mean_vals = df_level.drop(columns=["파일명", "학교급"]).mean()
-                    avg_row = {"파일명": f"{prefix}_{key}_{level}_평균", "학교급": level}
-                    avg_row.update(mean_vals.to_dict())
-                    avg_rows.append(avg_row)
+
+            values_df = pd.concat([frame for _, _, frame in files], ignore_index=True)
+            value_cols = list(values_df.columns)
+            values = values_df.to_numpy(dtype=float)
+            sizes = [len(frame) for _, _, frame in files]
+
+            # 파일별 행
+            file_stats = grouped_weighted_stats(values, np.repeat(np.arange(len(files)), sizes), n_groups=len(files))
+            rows = summary_records(
+                [filename for filename, _, _ in files], [level for _, level, _ in files], file_stats, value_cols,
+                dispersion_column=PER_HEAD_COLUMN, include_total=True
+            )
+
+            # 평균 행 추가 (학교급별 및 전체) - 파일 평균을 단순 평균하지 않고 학교 수로 가중
+            levels = [level for level in ["초등", "중등", "고등"] if level in [lv for _, lv, _ in files]]
+            level_codes = np.repeat(
+                [levels.index(level) if level in levels else -1 for _, level, _ in files], sizes
+            )
+            has_level = level_codes >= 0
+            level_stats = grouped_weighted_stats(values[has_level], level_codes[has_level], n_groups=len(levels))
+            rows += summary_records(
+                [f"{prefix}_{key}_{level}_평균" for level in levels], levels, level_stats, value_cols,
+                dispersion_column=PER_HEAD_COLUMN, include_total=True
+            )
 
             # 전체 평균
-            df_all = pd.DataFrame(result_dict[key])
-            mean_total = df_all.drop(columns=["파일명", "학교급"]).mean()
-            avg_total_row = {"파일명": f"{prefix}_{key}_전체_평균", "학교급": "전체"}
-            avg_total_row.update(mean_total.to_dict())
-            avg_rows.append(avg_total_row)
+            total_stats = grouped_weighted_stats(values, np.zeros(len(values), dtype=np.intp), n_groups=1)
+            rows += summary_records(
+                [f"{prefix}_{key}_전체_평균"], ["전체"], total_stats, value_cols,
+                dispersion_column=PER_HEAD_COLUMN, include_total=True
+            )
 
             # 최종 결과 저장
-            df_final = pd.concat([df_all, pd.DataFrame(avg_rows)], ignore_index=True)
+            df_final = pd.DataFrame(rows)
             df_final.to_csv(output_path, index=False, encoding="utf-8-sig")
             print(f"✅ {output_filename} 저장 완료 → {output_path}")
 
@@ -138,7 +101,7 @@ def summarize_total_and_school_level_mean(input_dir: str, output_dir: str, prefi
     df_all = pd.concat(df_list, ignore_index=True)
 
     # 수치 컬럼만 추출
-    value_columns = [col for col in df_all.columns if col not in ["파일명", "학교급"]]
+    value_columns = [col for col in df_all.columns if col not in ["파일명", "학교급", "학교 수"]]
 
     # ✅ 전체 평균 계산
     total_mean = df_all[value_columns].mean()
@@ -199,7 +162,7 @@ def combine_public_private_summary_and_average(
         df_combined = pd.concat([df_private, df_public], ignore_index=True)
 
         # 평균 계산
-        value_cols = [col for col in df_combined.columns if col not in ["파일명", "학교급"]]
+        value_cols = [col for col in df_combined.columns if col not in ["파일명", "학교급", "학교 수"]]
         row = {"파일명": f"combined_{combo}_평균"}
         for col in value_cols:
             row[col] = df_combined[col].mean()
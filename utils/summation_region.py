@@ -1,26 +1,37 @@
 import os
+import numpy as np
 import pandas as pd
 
-def extract_school_level(filename: str, df: pd.DataFrame) -> str | None:
+from utils.schema_registry import PER_HEAD_COLUMN, FileMeta, build_catalog, query_catalog, read_projected
+from utils.weighted_stats import grouped_weighted_stats, summary_records
+
+def extract_school_level(meta: FileMeta, df: pd.DataFrame) -> str | None:
     if "학교급" in df.columns:
         return df["학교급"].iloc[0]
-    elif "초등" in filename:
-        return "초등"
-    elif "중등" in filename:
-        return "중등"
-    elif "고등" in filename:
-        return "고등"
-    else:
-        return None
-
-def summarize_region_school_data(school_type: str, budget_type: str, revenue_type: str) -> None:
+    return meta.level
+
+def summarize_region_school_data(
+    school_type: str,
+    budget_type: str,
+    revenue_type: str,
+    regions: list[str] | None = None,
+    base_dir: str = "Database/schoolinfo"
+) -> None:
     """
     시도교육청 단위로 예산/결산 - 세입/세출 파일들을 요약하여 학교급별 평균 행 포함 CSV 파일 저장.
 
+    출력 컬럼 (모든 행이 학교당 평균이며 합계가 아님, 합계가 필요하면 항목 평균 × 학교 수):
+    - 파일명: 원본 파일명, 또는 "{학교급}_평균" / "전체_평균"
+    - 항목 컬럼: 학교당 평균 금액 (학교급/전체 평균 행은 학교 수 가중 평균)
+    - 1인당 평균 세출_중앙값 / _IQR / _p90/p10: 1인당 평균 세출의 학교 간 격차 지표 (세출만)
+    - 학교급, 학교 수
+
     Args:
         school_type (str): "private", "public", "combined" 중 하나
         budget_type (str): "예산" 또는 "결산"
         revenue_type (str): "세입" 또는 "세출"
+        regions (list[str] | None): 다시 계산할 교육청 (None 이면 전체, 변경분 반영 시 사용)
+        base_dir (str): {school_type}_filtered 와 summary 폴더가 있는 기준 폴더
     """
 
     시도교육청_목록 = [
@@ -31,78 +42,58 @@ def summarize_region_school_data(school_type: str, budget_type: str, revenue_typ
     ]
 
     for region in 시도교육청_목록:
-        input_dir = f"Database/schoolinfo/{school_type}_filtered/{region}"
-        output_dir = f"Database/schoolinfo/summary/{school_type}_summary/{region}"
+        if regions is not None and region not in regions:
+            continue
+        input_dir = os.path.join(base_dir, f"{school_type}_filtered", region)
+        output_dir = os.path.join(base_dir, "summary", f"{school_type}_summary", region)
         os.makedirs(output_dir, exist_ok=True)
 
-        df_list = []
-
-        for filename in os.listdir(input_dir):
-            if budget_type in filename and revenue_type in filename and filename.endswith(".csv"):
-                file_path = os.path.join(input_dir, filename)
-                df = pd.read_csv(file_path)
-
-                # 원하는 컬럼 매핑
-                if revenue_type == "세입":
-                    amt_column_map = {
-                        "AMT1": "정부이전수입",
-                        "AMT2": "기타이전수입",
-                        "AMT3": "학부모부담수입",
-                        "AMT4": "미사용",
-                        "AMT5": "행정활동수입",
-                        "AMT6": "기타"
-                    }
-                else:
-                    amt_column_map = {
-                        "AMT1": "인적자원_운용",
-                        "AMT2": "학생복지_교육격차해소",
-                        "AMT3": "기본적_교육활동",
-                        "AMT4": "선택적_교육활동",
-                        "AMT5": "교육활동_지원",
-                        "AMT6": "학교_일반운영",
-                        "AMT7": "학교_시설확충",
-                        "AMT8": "학교_재무활동",
-                        "YESAN_PER_HEAD": "1인당 평균 세출"
-                    }
-
-                # 변환된 컬럼으로 재구성
-                selected_cols = [col for col in amt_column_map if col in df.columns]
-                renamed_cols = {col: amt_column_map[col] for col in selected_cols}
-                df = df[["학교급"] + selected_cols if "학교급" in df.columns else selected_cols]
-                df.rename(columns=renamed_cols, inplace=True)
-
-                # 학교급 추출
-                school_level = extract_school_level(filename, df)
-                if school_level is None:
-                    print(f"⛔ 학교급 정보 없음 (컬럼/파일명 모두): {filename}")
-                    continue
-
-                numeric_cols = df.select_dtypes(include='number').columns
-                mean_values = df[numeric_cols].sum()
-                count = len(df)
-                row = [filename] + mean_values.tolist() + [school_level, count]
-                df_list.append(row)
-
-        if df_list:
-            columns = ["파일명"] + list(mean_values.index) + ["학교급", "학교 수"]
-            summary_df = pd.DataFrame(df_list, columns=columns)
-
-            # 학교급별 평균 행 추가
-            avg_rows = []
-            for school_level in summary_df["학교급"].unique():
-                temp = summary_df[summary_df["학교급"] == school_level]
-                weights = temp["학교 수"]
-                weighted_avg = (temp.iloc[:, 1:-2].multiply(weights, axis=0).sum() / weights.sum())
-                avg_row = [f"{school_level}_평균"] + weighted_avg.tolist() + [school_level, weights.sum()]
-                avg_rows.append(avg_row)
-
-            avg_df = pd.DataFrame(avg_rows, columns=columns)
+        raw_frames = []
+        file_info = []
+
+        catalog = build_catalog(input_dir)
+        for meta in query_catalog(catalog, budget_type=budget_type, flow=revenue_type):
+            # AMT 컬럼만 항목명으로 읽기
+            df = read_projected(meta, id_columns=["학교급"])
+
+            # 학교급 추출
+            school_level = extract_school_level(meta, df)
+            if school_level is None:
+                print(f"⛔ 학교급 정보 없음 (컬럼/파일명 모두): {meta.filename}")
+                continue
+
+            raw_frames.append(df.drop(columns=["학교급"], errors="ignore"))
+            file_info.append((meta.filename, school_level))
+
+        if raw_frames:
+            # 학교 단위 값을 한 배열로 모아 파일별/학교급별/전체 통계를 같은 커널로 계산
+            values_df = pd.concat(raw_frames, ignore_index=True)
+            value_cols = list(values_df.columns)
+            values = values_df.to_numpy(dtype=float)
+            sizes = [len(frame) for frame in raw_frames]
+
+            file_levels = [level for _, level in file_info]
+            level_names = list(dict.fromkeys(file_levels))
+            file_codes = np.repeat(np.arange(len(raw_frames)), sizes)
+            level_codes = np.repeat([level_names.index(level) for level in file_levels], sizes)
+
+            file_stats = grouped_weighted_stats(values, file_codes, n_groups=len(raw_frames))
+            level_stats = grouped_weighted_stats(values, level_codes, n_groups=len(level_names))
+            overall_stats = grouped_weighted_stats(values, np.zeros(len(values), dtype=np.intp), n_groups=1)
+
+            summary_df = pd.DataFrame(summary_records(
+                [name for name, _ in file_info], file_levels, file_stats, value_cols, dispersion_column=PER_HEAD_COLUMN
+            ))
+
+            # 학교급별 평균 행 추가 (학교 수 가중)
+            avg_df = pd.DataFrame(summary_records(
+                [f"{level}_평균" for level in level_names], level_names, level_stats, value_cols, dispersion_column=PER_HEAD_COLUMN
+            ))
 
             # 전체 평균 행 추가
-            weights = summary_df["학교 수"]
-            overall_weighted_avg = (summary_df.iloc[:, 1:-2].multiply(weights, axis=0).sum() / weights.sum())
-            overall_avg_row = ["전체_평균"] + overall_weighted_avg.tolist() + ["전체", weights.sum()]
-            overall_avg_df = pd.DataFrame([overall_avg_row], columns=columns)
+            overall_avg_df = pd.DataFrame(summary_records(
+                ["전체_평균"], ["전체"], overall_stats, value_cols, dispersion_column=PER_HEAD_COLUMN
+            ))
 
             # 최종 결합
             final_df = pd.concat([summary_df, avg_df, overall_avg_df], ignore_index=True)
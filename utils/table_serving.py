@@ -0,0 +1,318 @@
+import io
+import json
+import base64
+import zlib
+import threading
+from collections import OrderedDict
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+from utils.arrow_store import publish_arrow_table, load_arrow_frame, load_arrow_version, load_current_arrow_table
+from utils.schema_registry import ID_COLUMNS, FileMeta, build_catalog, read_projected
+
+try:
+    import brotli
+except ImportError:  # brotli 는 선택 의존성
+    brotli = None
+
+FINAL_TABLE_NAMES = {"school": "final_table_school", "office": "final_table_office"}
+
+# 요청 필터 이름 → 테이블 컬럼
+FILTER_COLUMNS = {
+    "office": "ATPT_OFCDC_ORG_NM",
+    "level": "학교급",
+    "type": "FOND_SC_CODE",
+    "year": "연도"
+}
+
+OFFICE_KEYS = ["ATPT_OFCDC_ORG_NM", "학교급", "FOND_SC_CODE", "연도", "예결산", "세입세출"]
+
+
+def _read_final_rows(meta: FileMeta) -> pd.DataFrame:
+    """
+    예결산 파일 하나를 최종 표 행(학교 × 항목 컬럼 + 학교급/연도/예결산/세입세출)으로 읽습니다.
+    """
+    df = read_projected(meta, id_columns=ID_COLUMNS)
+    df["FOND_SC_CODE"] = df["FOND_SC_CODE"].replace({"공립": "국공립", "국립": "국공립"})
+    df["학교급"] = meta.level
+    df["연도"] = meta.year
+    df["예결산"] = meta.budget_type
+    df["세입세출"] = meta.flow
+    return df
+
+
+def _office_rows(school_df: pd.DataFrame) -> pd.DataFrame:
+    value_cols = [col for col in school_df.columns if col not in ID_COLUMNS + OFFICE_KEYS]
+    office_df = school_df.groupby(OFFICE_KEYS)[value_cols].sum(min_count=1).reset_index()
+    office_df["학교 수"] = school_df.groupby(OFFICE_KEYS).size().to_numpy()
+    return office_df
+
+
+def build_final_tables(csv_folder_path: str = "Database/schoolinfo/combined_csv") -> None:
+    """
+    학교별/교육청별 예결산 표를 만들어 Arrow 저장소에 게시합니다.
+    (뉴스 예측 예산 컬럼은 뉴스 예측 단계가 생기면 같은 키로 병합)
+
+    Args:
+        csv_folder_path (str): 예결산 CSV 폴더
+    """
+    frames = [
+        _read_final_rows(meta) for meta in build_catalog(csv_folder_path)
+        if meta.year is not None and meta.level is not None and meta.budget_type is not None and meta.flow is not None
+    ]
+    if not frames:
+        raise FileNotFoundError(f"{csv_folder_path}에 예결산 파일이 없습니다.")
+
+    school_df = pd.concat(frames, ignore_index=True)
+    publish_arrow_table(school_df, FINAL_TABLE_NAMES["school"])
+    publish_arrow_table(_office_rows(school_df), FINAL_TABLE_NAMES["office"])
+
+
+def refresh_final_table_partition(meta: FileMeta, offices: list[str] | None = None) -> None:
+    """
+    파일 하나(연도, 학교급, 예결산, 세입세출)에 해당하는 부분만 다시 읽어 최종 표의 같은 부분을 교체합니다.
+    다른 연도/학교급 행은 게시된 Arrow 표에서 그대로 가져오므로 원본 CSV를 다시 읽지 않습니다.
+
+    Args:
+        meta (FileMeta): 변경된 통합(combined_csv) 파일
+        offices (list[str] | None): 지정하면 해당 교육청 행만 교체 (변경분이 있는 교육청)
+    """
+    school_rows = _read_final_rows(meta)
+    partition = (
+        (pc.field("연도") == meta.year) & (pc.field("학교급") == meta.level)
+        & (pc.field("예결산") == meta.budget_type) & (pc.field("세입세출") == meta.flow)
+    )
+    if offices is not None:
+        school_rows = school_rows[school_rows["ATPT_OFCDC_ORG_NM"].isin(offices)]
+        partition = partition & pc.field("ATPT_OFCDC_ORG_NM").isin(list(offices))
+
+    for key, rows in [("school", school_rows), ("office", _office_rows(school_rows))]:
+        try:
+            kept = load_arrow_frame(FINAL_TABLE_NAMES[key], filter=~partition)
+        except FileNotFoundError:
+            kept = rows.iloc[0:0]
+        publish_arrow_table(pd.concat([kept, rows], ignore_index=True), FINAL_TABLE_NAMES[key])
+
+
+def encode_cursor(version: str, offset: int) -> str:
+    payload = json.dumps({"v": version, "o": offset}).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """
+    커서를 (데이터 버전, 시작 위치)로 풉니다. 형식이 잘못되었거나 위치가 음수이면 ValueError.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        version, offset = payload["v"], int(payload["o"])
+    except Exception:
+        raise ValueError("잘못된 cursor 입니다.")
+    if offset < 0:
+        raise ValueError("잘못된 cursor 입니다.")
+    return version, offset
+
+
+def compute_sorted_indices(table_name: str, version: str, filters: tuple, sort_by: str, descending: bool) -> pa.Array:
+    """
+    memory-map 된 테이블(해당 버전)에 필터와 정렬을 적용한 행 번호 배열을 계산합니다.
+    테이블을 복사하지 않고 조건에 맞는 행 번호와 정렬 키 컬럼만 다룹니다.
+    필터 값의 형식이 컬럼과 맞지 않으면 ValueError.
+    """
+    table = load_arrow_version(table_name, version)
+    if sort_by not in table.column_names:
+        raise ValueError(f"정렬할 수 없는 컬럼입니다: {sort_by}")
+
+    sort_keys = [(sort_by, "descending" if descending else "ascending")]
+    tie_breaker = "SCHUL_CODE" if "SCHUL_CODE" in table.column_names else None
+    if tie_breaker and tie_breaker != sort_by:
+        sort_keys.append((tie_breaker, "ascending"))
+
+    try:
+        mask = None
+        for column, values in filters:
+            condition = pc.is_in(table[column], value_set=pa.array(values, type=table.schema.field(column).type))
+            mask = condition if mask is None else pc.and_(mask, condition)
+
+        keys = table.select([column for column, _ in sort_keys])
+        if mask is None:
+            return pc.sort_indices(keys, sort_keys=sort_keys)
+        positions = pc.indices_nonzero(mask)
+        return positions.take(pc.sort_indices(keys.take(positions), sort_keys=sort_keys))
+    except pa.ArrowException as e:
+        raise ValueError(f"필터 또는 정렬 값의 형식이 맞지 않습니다: {e}")
+
+
+# {(표, 버전, 필터, 정렬 컬럼, 내림차순): 정렬된 행 번호} - 결과 행이 아니라 행 번호만 보관
+_index_cache: OrderedDict[tuple, pa.Array] = OrderedDict()
+_index_cache_lock = threading.Lock()
+INDEX_CACHE_SIZE = 32
+
+
+def lookup_sorted_indices(key: tuple) -> pa.Array | None:
+    with _index_cache_lock:
+        if key in _index_cache:
+            _index_cache.move_to_end(key)
+            return _index_cache[key]
+    return None
+
+
+def store_sorted_indices(key: tuple, indices: pa.Array) -> None:
+    with _index_cache_lock:
+        _index_cache[key] = indices
+        while len(_index_cache) > INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+
+
+def get_sorted_indices(table_name: str, version: str, filters: tuple, sort_by: str, descending: bool) -> pa.Array:
+    """
+    정렬된 행 번호를 (버전, 필터, 정렬) 단위로 캐시합니다. 다음 페이지 요청은 정렬 없이 slice 만 수행합니다.
+    """
+    key = (table_name, version, filters, sort_by, descending)
+    indices = lookup_sorted_indices(key)
+    if indices is None:
+        indices = compute_sorted_indices(*key)
+        store_sorted_indices(key, indices)
+    return indices
+
+
+def resolve_final_table(table: str) -> tuple[str, str, pa.Table]:
+    """
+    표 이름("school"/"office")을 (Arrow 테이블 이름, 현재 버전, memory-map 테이블)로 바꿉니다.
+    """
+    table_name = FINAL_TABLE_NAMES.get(table)
+    if table_name is None:
+        raise ValueError(f"알 수 없는 표입니다: {table}")
+    try:
+        version, arrow_table = load_current_arrow_table(table_name)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"'{table_name}' 표가 아직 게시되지 않았습니다.")
+    return table_name, version, arrow_table
+
+
+def filter_key(filters: dict | None) -> tuple:
+    """
+    {"office": [...], ...} 요청 필터를 캐시 키로 쓸 수 있는 ((컬럼, 값들), ...) 튜플로 바꿉니다.
+    """
+    return tuple(
+        (FILTER_COLUMNS[name], tuple(values))
+        for name, values in sorted((filters or {}).items())
+        if values
+    )
+
+
+def paginate(version: str, indices: pa.Array, cursor: str | None, limit: int | None) -> tuple[pa.Array, str | None, int]:
+    """
+    정렬된 행 번호에서 cursor 위치부터 limit 개를 잘라 (페이지 행 번호, 다음 커서, 전체 행 수)를 반환합니다.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("limit 은 1 이상이어야 합니다.")
+
+    offset = 0
+    if cursor:
+        cursor_version, offset = decode_cursor(cursor)
+        if cursor_version != version:
+            raise ValueError("데이터가 갱신되어 cursor 가 만료되었습니다. 처음부터 다시 요청하세요.")
+
+    total = len(indices)
+    page = indices.slice(offset, limit) if limit is not None else indices.slice(offset)
+    next_offset = offset + len(page)
+    next_cursor = encode_cursor(version, next_offset) if next_offset < total else None
+    return page, next_cursor, total
+
+
+def query_final_table(
+    table: str = "school",
+    filters: dict | None = None,
+    sort_by: str = "ATPT_OFCDC_ORG_NM",
+    descending: bool = False,
+    cursor: str | None = None,
+    limit: int | None = 1000
+) -> tuple[pa.Table, pa.Array, str | None, int]:
+    """
+    최종 표에서 필터/정렬을 적용한 한 페이지의 행 번호를 반환합니다.
+    행 자체는 만들지 않으므로 take_batches 로 필요한 만큼씩 꺼내 쓰면 됩니다.
+
+    Args:
+        table (str): "school" 또는 "office"
+        filters (dict | None): {"office": [...], "level": [...], "type": [...], "year": [...]}
+        sort_by (str): 정렬 컬럼
+        descending (bool): 내림차순 여부
+        cursor (str | None): 이전 응답의 next_cursor
+        limit (int | None): 페이지 크기 (None 이면 끝까지)
+
+    Returns:
+        tuple: (memory-map 테이블, 페이지 행 번호, 다음 커서 또는 None, 필터 적용 후 전체 행 수)
+    """
+    table_name, version, arrow_table = resolve_final_table(table)
+    indices = get_sorted_indices(table_name, version, filter_key(filters), sort_by, descending)
+    page, next_cursor, total = paginate(version, indices, cursor, limit)
+    return arrow_table, page, next_cursor, total
+
+
+def take_batches(table: pa.Table, indices: pa.Array, batch_size: int = 10_000):
+    """
+    행 번호 순서대로 batch_size 행씩 레코드 배치를 꺼냅니다 (한 번에 한 배치만 메모리에 만듦).
+    """
+    for start in range(0, len(indices), batch_size):
+        yield from table.take(indices.slice(start, batch_size)).combine_chunks().to_batches()
+
+
+def _compressor(compression: str | None):
+    """
+    스트리밍 압축기 (compress, flush) 쌍을 반환합니다.
+    """
+    if compression is None:
+        return (lambda data: data), (lambda: b"")
+    if compression == "gzip":
+        compressor = zlib.compressobj(wbits=31)
+        return compressor.compress, compressor.flush
+    if compression == "br":
+        if brotli is None:
+            raise ValueError("brotli 압축을 사용하려면 brotli 패키지가 필요합니다.")
+        compressor = brotli.Compressor()
+        return compressor.process, compressor.finish
+    raise ValueError(f"지원하지 않는 압축 방식입니다: {compression}")
+
+
+def iter_csv_bytes(batches, schema: pa.Schema, compression: str | None = None):
+    """
+    레코드 배치를 CSV(utf-8-sig)로 변환하여 (압축된) 바이트 조각으로 내보냅니다.
+    결과가 비어 있어도 헤더 줄은 항상 씁니다.
+    """
+    compress, flush = _compressor(compression)
+    yield compress(b"\xef\xbb\xbf")
+
+    include_header = True
+    for batch in batches:
+        sink = io.BytesIO()
+        pa_csv.write_csv(batch, sink, write_options=pa_csv.WriteOptions(include_header=include_header))
+        include_header = False
+        chunk = compress(sink.getvalue())
+        if chunk:
+            yield chunk
+
+    if include_header:
+        sink = io.BytesIO()
+        pa_csv.write_csv(schema.empty_table(), sink)
+        yield compress(sink.getvalue())
+
+    tail = flush()
+    if tail:
+        yield tail
+
+
+def iter_arrow_stream_bytes(batches, schema: pa.Schema):
+    """
+    레코드 배치를 Arrow IPC stream 형식으로 배치마다 바로 내보냅니다.
+    """
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            yield sink.getvalue()
+            sink.seek(0)
+            sink.truncate()
+    yield sink.getvalue()
@@ -0,0 +1,167 @@
+import numpy as np
+
+from utils.schema_registry import PER_HEAD_COLUMN
+
+DEFAULT_QUANTILES = (0.1, 0.25, 0.5, 0.75, 0.9)
+DISPERSION_NAMES = ["중앙값", "IQR", "p90/p10"]
+
+
+def _grouped_weighted_quantiles(
+    col: np.ndarray,
+    groups: np.ndarray,
+    weights: np.ndarray,
+    n_groups: int,
+    quantiles: tuple
+) -> np.ndarray:
+    """
+    (그룹, 값) 순으로 한 번 정렬한 뒤 그룹 내 누적 가중치 비율로 분위수를 찾습니다.
+    각 값의 위치는 자기 가중치의 가운데 지점 (누적 가중치 - w/2) / 그룹 가중치이며,
+    분위수는 이웃한 두 위치 사이를 선형 보간합니다 (가중치가 같으면 [1, 3]의 중앙값은 2).
+    그룹 번호 + 위치(0~1)는 전체 배열에서 단조 증가하므로 searchsorted 한 번으로 모든 그룹을 처리합니다.
+    """
+    out = np.full((n_groups, len(quantiles)), np.nan)
+    if col.size == 0:
+        return out
+
+    order = np.lexsort((col, groups))
+    sorted_groups = groups[order]
+    sorted_values = col[order]
+    sorted_weights = weights[order]
+
+    cum_weights = np.cumsum(sorted_weights)
+    totals = np.bincount(sorted_groups, weights=sorted_weights, minlength=n_groups)
+    group_starts = np.concatenate(([0.0], np.cumsum(totals)[:-1]))
+    keys = sorted_groups + (cum_weights - sorted_weights / 2 - group_starts[sorted_groups]) / totals[sorted_groups]
+
+    group_ids = np.arange(n_groups)
+    has_value = totals > 0
+    first = np.searchsorted(sorted_groups, group_ids, side="left")[has_value]
+    last = np.searchsorted(sorted_groups, group_ids, side="right")[has_value] - 1
+    for i, q in enumerate(quantiles):
+        target = group_ids[has_value] + q
+        upper = np.clip(np.searchsorted(keys, target, side="left"), first, last)
+        lower = np.clip(upper - 1, first, last)
+        # 그룹의 첫/마지막 위치 밖이면 끝값, 그 사이면 두 값 사이 보간
+        span = keys[upper] - keys[lower]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fraction = np.where(span > 0, (target - keys[lower]) / span, 0.0)
+        fraction = np.clip(fraction, 0.0, 1.0)
+        out[has_value, i] = sorted_values[lower] + fraction * (sorted_values[upper] - sorted_values[lower])
+    return out
+
+
+def grouped_weighted_stats(
+    values,
+    groups,
+    weights=None,
+    n_groups: int | None = None,
+    quantiles: tuple = DEFAULT_QUANTILES
+) -> dict:
+    """
+    그룹별 가중 평균, 가중 분산, 가중 분위수를 한 번에 계산합니다.
+    값이 NaN 이거나 가중치가 0 이하인 행은 해당 컬럼 계산에서 제외됩니다.
+
+    Args:
+        values: (n,) 또는 (n, k) 값 배열
+        groups: (n,) 0부터 시작하는 그룹 번호 배열
+        weights: (n,) 가중치 배열 (None 이면 모두 1, 예: 학교 수)
+        n_groups (int | None): 그룹 수 (None 이면 groups.max() + 1)
+        quantiles (tuple): 계산할 분위수 목록
+
+    Returns:
+        dict: "count", "weight", "mean", "var" 는 (그룹 수, k) 배열,
+              "quantiles" 는 {분위수: (그룹 수, k) 배열}
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, None]
+    groups = np.asarray(groups, dtype=np.intp)
+    weights = np.ones(len(groups)) if weights is None else np.asarray(weights, dtype=float)
+    if n_groups is None:
+        n_groups = int(groups.max()) + 1 if groups.size else 0
+
+    n_cols = values.shape[1]
+    count = np.zeros((n_groups, n_cols))
+    weight = np.zeros((n_groups, n_cols))
+    mean = np.full((n_groups, n_cols), np.nan)
+    var = np.full((n_groups, n_cols), np.nan)
+    q_values = np.full((len(quantiles), n_groups, n_cols), np.nan)
+
+    for j in range(n_cols):
+        col = values[:, j]
+        mask = ~np.isnan(col) & (weights > 0)
+        g, x, w = groups[mask], col[mask], weights[mask]
+
+        count[:, j] = np.bincount(g, minlength=n_groups)
+        weight[:, j] = np.bincount(g, weights=w, minlength=n_groups)
+        has_weight = weight[:, j] > 0
+
+        weighted_sum = np.bincount(g, weights=w * x, minlength=n_groups)
+        mean[has_weight, j] = weighted_sum[has_weight] / weight[has_weight, j]
+
+        deviation = x - mean[g, j]
+        weighted_sq = np.bincount(g, weights=w * deviation * deviation, minlength=n_groups)
+        var[has_weight, j] = weighted_sq[has_weight] / weight[has_weight, j]
+
+        q_values[:, :, j] = _grouped_weighted_quantiles(x, g, w, n_groups, quantiles).T
+
+    return {
+        "count": count,
+        "weight": weight,
+        "mean": mean,
+        "var": var,
+        "quantiles": {q: q_values[i] for i, q in enumerate(quantiles)}
+    }
+
+
+def dispersion_metrics(stats: dict) -> dict:
+    """
+    grouped_weighted_stats 결과에서 학교 간 격차 지표(중앙값, IQR, p90/p10)를 뽑습니다.
+    """
+    q = stats["quantiles"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        p90_p10 = np.where(q[0.1] > 0, q[0.9] / q[0.1], np.nan)
+    return {
+        "중앙값": q[0.5],
+        "IQR": q[0.75] - q[0.25],
+        "p90/p10": p90_p10
+    }
+
+
+def summary_records(
+    labels: list,
+    levels: list,
+    stats: dict,
+    value_cols: list,
+    dispersion_column: str | None = None,
+    include_total: bool = False
+) -> list[dict]:
+    """
+    grouped_weighted_stats 결과를 요약 CSV 레코드로 변환합니다.
+    컬럼 순서: 파일명, 항목별 평균, (평균합계), dispersion_column 의 격차 지표, 학교급, 학교 수
+
+    Args:
+        labels (list): 그룹별 파일명(행 이름)
+        levels (list): 그룹별 학교급
+        stats (dict): grouped_weighted_stats 결과
+        value_cols (list): stats 의 컬럼 이름
+        dispersion_column (str | None): 격차 지표를 붙일 컬럼 (value_cols 에 없으면 생략)
+        include_total (bool): 항목별 평균의 합(평균합계) 컬럼 포함 여부 (합산할 수 없는 1인당 평균 세출은 제외)
+    """
+    dispersion = dispersion_metrics(stats)
+    dispersion_idx = value_cols.index(dispersion_column) if dispersion_column in value_cols else None
+    summable = np.array([col != PER_HEAD_COLUMN for col in value_cols], dtype=bool)
+
+    records = []
+    for i, (label, level) in enumerate(zip(labels, levels)):
+        row = {"파일명": label}
+        row.update(dict(zip(value_cols, stats["mean"][i].tolist())))
+        if include_total:
+            row["평균합계"] = float(np.nansum(stats["mean"][i][summable]))
+        if dispersion_idx is not None:
+            for name in DISPERSION_NAMES:
+                row[f"{dispersion_column}_{name}"] = dispersion[name][i, dispersion_idx]
+        row["학교급"] = level
+        row["학교 수"] = int(stats["count"][i].max()) if stats["count"].size else 0
+        records.append(row)
+    return records
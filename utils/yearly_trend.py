@@ -0,0 +1,222 @@
+import numpy as np
+import pandas as pd
+import pyarrow.compute as pc
+
+from utils.arrow_store import publish_arrow_table, load_arrow_frame
+from utils.schema_registry import PER_HEAD_COLUMN, FileMeta, build_catalog, query_catalog, read_projected
+
+TREND_TABLE_NAME = "yearly_trend"
+
+# 연도별 집계의 키 (교육청, 학교급, 설립유형, 세입/세출, 항목)
+TREND_KEYS = ["ATPT_OFCDC_ORG_NM", "학교급", "FOND_SC_CODE", "세입세출", "항목"]
+
+# 비교 가능한 최대 연도 수 (/report/yearly 의 span 상한)
+MAX_TREND_SPAN = 20
+
+
+def aggregate_year_from_csv_folder(csv_folder_path: str, year: int) -> pd.DataFrame:
+    """
+    한 연도의 CSV 파일들(예산/결산 - 세입/세출)을 읽어
+    (교육청, 학교급, 설립유형, 세입/세출, 항목) 단위 합계와 학교 수를 구합니다.
+
+    Args:
+        csv_folder_path (str): 연도별 CSV가 있는 폴더 (예: Database/schoolinfo/combined_csv)
+        year (int): 집계할 연도
+
+    Returns:
+        pd.DataFrame: 연도, 예결산, TREND_KEYS, 합계, 학교 수 컬럼의 long 형식 집계표
+    """
+    frames = []
+    for meta in query_catalog(build_catalog(csv_folder_path), years=[year]):
+        if meta.level is None or meta.budget_type is None or meta.flow is None:
+            print(f"⚠️ 파일명 형식이 이상함: {meta.filename}")
+            continue
+        frames.append(_aggregate_file(meta))
+
+    if not frames:
+        raise FileNotFoundError(f"{csv_folder_path}에 {year}년 파일이 없습니다.")
+
+    result = pd.concat(frames, ignore_index=True)
+    result["연도"] = int(year)
+    return result[["연도", "예결산"] + TREND_KEYS + ["합계", "학교 수"]]
+
+
+def _aggregate_file(meta: FileMeta, offices: list[str] | None = None) -> pd.DataFrame:
+    """
+    파일 하나를 (교육청, 설립유형, 항목) 단위 합계와 학교 수로 집계합니다 (offices 를 주면 해당 교육청만).
+    """
+    df = read_projected(meta, id_columns=["ATPT_OFCDC_ORG_NM", "FOND_SC_CODE"])
+    if offices is not None:
+        df = df[df["ATPT_OFCDC_ORG_NM"].isin(offices)]
+    df = df.drop(columns=[PER_HEAD_COLUMN], errors="ignore")
+    df["FOND_SC_CODE"] = df["FOND_SC_CODE"].replace({"공립": "국공립", "국립": "국공립"})
+
+    long_df = df.melt(
+        id_vars=["ATPT_OFCDC_ORG_NM", "FOND_SC_CODE"],
+        var_name="항목",
+        value_name="금액"
+    )
+
+    grouped = long_df.groupby(["ATPT_OFCDC_ORG_NM", "FOND_SC_CODE", "항목"])["금액"].agg(["sum", "count"]).reset_index()
+    grouped = grouped.rename(columns={"sum": "합계", "count": "학교 수"})
+    grouped["학교급"] = meta.level
+    grouped["예결산"] = meta.budget_type
+    grouped["세입세출"] = meta.flow
+    return grouped
+
+
+def refresh_trend_partition(meta: FileMeta, offices: list[str]) -> pd.DataFrame:
+    """
+    변경된 파일 하나의 (교육청, 학교급, 예결산, 세입세출) 집계 행만 다시 계산하여 추세 저장소의 같은 행을 교체합니다.
+    같은 연도의 다른 교육청/학교급/파일은 게시된 저장소 값을 그대로 사용합니다.
+
+    Args:
+        meta (FileMeta): 변경된 통합(combined_csv) 파일
+        offices (list[str]): 변경된 교육청 목록
+
+    Returns:
+        pd.DataFrame: 갱신된 전체 추세 저장소
+    """
+    rows = _aggregate_file(meta, offices)
+    rows["연도"] = int(meta.year)
+    partition = (
+        (pc.field("연도") == int(meta.year)) & (pc.field("학교급") == meta.level)
+        & (pc.field("예결산") == meta.budget_type) & (pc.field("세입세출") == meta.flow)
+        & pc.field("ATPT_OFCDC_ORG_NM").isin(list(offices))
+    )
+
+    store = pd.concat([load_arrow_frame(TREND_TABLE_NAME, filter=~partition), rows], ignore_index=True)
+    store = store[["연도", "예결산"] + TREND_KEYS + ["합계", "학교 수"]]
+    store = store.sort_values(["연도"] + TREND_KEYS + ["예결산"], ignore_index=True)
+    publish_arrow_table(store, TREND_TABLE_NAME)
+    return store
+
+
+def append_year_to_trend_store(csv_folder_path: str, year: int) -> pd.DataFrame:
+    """
+    새 연도의 집계만 계산하여 기존 추세 저장소에 추가(같은 연도가 있으면 교체)합니다.
+    다른 연도의 원본 CSV는 다시 읽지 않습니다.
+
+    Args:
+        csv_folder_path (str): 연도별 CSV가 있는 폴더
+        year (int): 추가할 연도
+
+    Returns:
+        pd.DataFrame: 갱신된 전체 추세 저장소
+    """
+    year_df = aggregate_year_from_csv_folder(csv_folder_path, year)
+
+    try:
+        store = load_arrow_frame(TREND_TABLE_NAME, filter=pc.field("연도") != int(year))
+        store = pd.concat([store, year_df], ignore_index=True)
+    except FileNotFoundError:
+        store = year_df
+
+    store = store.sort_values(["연도"] + TREND_KEYS + ["예결산"], ignore_index=True)
+    publish_arrow_table(store, TREND_TABLE_NAME)
+    return store
+
+
+def _compute_cagr(values: np.ndarray, years: np.ndarray) -> np.ndarray:
+    """
+    행마다 처음/마지막 유효 값 사이의 연평균 성장률(CAGR)을 계산합니다.
+    """
+    valid = ~np.isnan(values)
+    has_value = valid.any(axis=1)
+    first_idx = valid.argmax(axis=1)
+    last_idx = values.shape[1] - 1 - valid[:, ::-1].argmax(axis=1)
+
+    rows = np.arange(values.shape[0])
+    first = values[rows, first_idx]
+    last = values[rows, last_idx]
+    span = years[last_idx] - years[first_idx]
+
+    cagr = np.full(values.shape[0], np.nan)
+    ok = has_value & (span > 0) & (first > 0) & (last >= 0)
+    cagr[ok] = (last[ok] / first[ok]) ** (1.0 / span[ok]) - 1
+    return cagr
+
+
+def compute_trend_metrics(trend_df: pd.DataFrame, window: int = 3) -> pd.DataFrame:
+    """
+    추세 저장소 전체에 대해 전년 대비 증감률, CAGR, 예산 대비 결산 집행 차이, 이동평균을
+    (키 × 연도) 행렬 연산으로 한 번에 계산합니다. 1인당 평균 세출처럼 합산할 수 없는 항목은 제외합니다.
+
+    Args:
+        trend_df (pd.DataFrame): append_year_to_trend_store 가 만든 long 형식 저장소
+        window (int): 이동평균 구간(년)
+
+    Returns:
+        pd.DataFrame: TREND_KEYS, 연도별 예산/결산 및 추세 지표
+    """
+    # 이전에 게시된 저장소에 남아 있을 수 있는 1인당 항목 제외
+    trend_df = trend_df[trend_df["항목"] != PER_HEAD_COLUMN]
+    # 빠진 연도도 열로 두어 전년 대비가 항상 바로 앞 연도와 비교되도록 함 (빠진 연도 다음 해는 NaN)
+    years = np.arange(trend_df["연도"].min(), trend_df["연도"].max() + 1)
+    wide = trend_df.pivot_table(
+        index=TREND_KEYS, columns=["예결산", "연도"], values="합계", aggfunc="sum"
+    )
+
+    keys_df = wide.index.to_frame(index=False)
+    result = keys_df.loc[keys_df.index.repeat(len(years))].reset_index(drop=True)
+    result["연도"] = np.tile(years, len(keys_df))
+
+    for budget_type in ["예산", "결산"]:
+        if budget_type not in wide.columns.get_level_values(0):
+            result[budget_type] = np.nan
+            continue
+
+        matrix = wide[budget_type].reindex(columns=years)
+        values = matrix.to_numpy(dtype=float)
+
+        # 전년 값이 0 이하인 칸은 증감률을 정의할 수 없으므로 NaN (inf 는 JSON 으로 보낼 수 없음)
+        yoy = np.full_like(values, np.nan)
+        previous = values[:, :-1]
+        np.divide(values[:, 1:], previous, out=yoy[:, 1:], where=previous > 0)
+        yoy[:, 1:] -= 1
+
+        rolling = matrix.T.rolling(window, min_periods=1).mean().T.to_numpy(dtype=float)
+        cagr = _compute_cagr(values, years.astype(float))
+
+        result[budget_type] = values.ravel()
+        result[f"{budget_type}_전년대비"] = yoy.ravel()
+        result[f"{budget_type}_이동평균"] = rolling.ravel()
+        result[f"{budget_type}_CAGR"] = np.repeat(cagr, len(years))
+
+    result["집행차이"] = result["결산"] - result["예산"]
+    result["집행률"] = result["결산"] / result["예산"].where(result["예산"] > 0)
+
+    return result.dropna(subset=["예산", "결산"], how="all").reset_index(drop=True)
+
+
+def build_yearly_comparison(year: int, span: int = 5, window: int = 3) -> pd.DataFrame:
+    """
+    연별 보고서용 최근 span년 비교표를 추세 저장소만으로 만듭니다 (원본 행을 읽지 않음).
+
+    Args:
+        year (int): 보고서 대상 연도
+        span (int): 비교할 연도 수 (기본 5년, 1 ~ MAX_TREND_SPAN)
+        window (int): 이동평균 구간(년)
+
+    Returns:
+        pd.DataFrame: 대상 기간의 추세 지표
+    """
+    if not 1 <= span <= MAX_TREND_SPAN:
+        raise ValueError(f"span 은 1 ~ {MAX_TREND_SPAN} 사이여야 합니다: {span}")
+
+    store = load_arrow_frame(TREND_TABLE_NAME, filter=(pc.field("연도") > year - span) & (pc.field("연도") <= year))
+    if store.empty:
+        raise FileNotFoundError(f"{year - span + 1}~{year}년 추세 데이터가 없습니다.")
+    return compute_trend_metrics(store, window=window)
+
+
+def main():
+    csv_folder = "Database/schoolinfo/combined_csv"
+    for year in range(2020, 2025):
+        append_year_to_trend_store(csv_folder, year)
+    comparison = build_yearly_comparison(2024)
+    comparison.to_csv("Database/schoolinfo/summary/yearly_trend_2024.csv", index=False, encoding="utf-8-sig")
+
+
+if __name__ == "__main__":
+    main()